@@ -1,6 +1,6 @@
 import sys
 from datetime import datetime, timezone
-from flask import Flask, jsonify, request, Blueprint
+from flask import Flask, jsonify, request, Blueprint, Request, current_app
 from flask_cors import CORS
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
@@ -20,10 +20,25 @@ from middlewares.error_middleware import setup_error_handlers
 from controllers.health_controller import HealthController
 from controllers.model_controller import ModelController
 from controllers.shortlist_controller import ShortlistController
+from controllers.match_controller import MatchController
+from controllers.talent_pool_controller import TalentPoolController
 
 # Load environment variables
 load_dotenv()
 
+# Content type of streamed shortlisting uploads (job line, then one application per line)
+NDJSON_MIMETYPE = "application/x-ndjson"
+
+
+class AIServiceRequest(Request):
+    """Request class that applies the streaming size cap to NDJSON uploads"""
+
+    @property
+    def max_content_length(self):
+        if self.mimetype == NDJSON_MIMETYPE and current_app:
+            return current_app.config["STREAM_MAX_CONTENT_LENGTH"] or None
+        return super().max_content_length
+
 
 def setup_logging(config):
     """Enhanced logging configuration with colors"""
@@ -79,12 +94,18 @@ def setup_logging(config):
 def log_system_info():
     """Log system information for monitoring"""
     try:
-        cpu_percent = psutil.cpu_percent(interval=1)
+        # Load averages instead of a sampled CPU percentage, which would block
+        # startup; the first cpu_percent call starts the measurement that
+        # health checks report against
+        psutil.cpu_percent(interval=None)
+        load_1, load_5, load_15 = psutil.getloadavg()
         memory = psutil.virtual_memory()
         disk = psutil.disk_usage("/")
 
         logging.info("System Information:")
-        logging.info(f"  CPU Usage: {cpu_percent}%")
+        logging.info(
+            f"  CPU Load: {load_1:.2f}, {load_5:.2f}, {load_15:.2f} ({psutil.cpu_count()} CPUs)"
+        )
         logging.info(
             f"  Memory Usage: {memory.percent}% ({memory.used // (1024**2)}MB / {memory.total // (1024**2)}MB)"
         )
@@ -99,6 +120,7 @@ def log_system_info():
 
 def create_app():
     app = Flask(__name__)
+    app.request_class = AIServiceRequest
     config = AppConfig()
 
     # Enhanced configuration
@@ -108,6 +130,7 @@ def create_app():
             "JSON_SORT_KEYS": False,
             "JSONIFY_PRETTYPRINT_REGULAR": config.DEBUG,
             "MAX_CONTENT_LENGTH": 16 * 1024 * 1024,  # 16MB max request size
+            "STREAM_MAX_CONTENT_LENGTH": config.STREAM_MAX_CONTENT_LENGTH,
         }
     )
 
@@ -162,6 +185,8 @@ def create_app():
     health_controller = HealthController()
     shortlist_controller = ShortlistController()
     model_controller = ModelController()
+    match_controller = MatchController()
+    talent_pool_controller = TalentPoolController()
 
     # ===== HEALTH CONTROLLER ROUTES =====
     health_bp = Blueprint("health", __name__, url_prefix="/api/v1/health")
@@ -172,6 +197,18 @@ def create_app():
         """Check overall system health"""
         return health_controller.check_health()
 
+    @health_bp.route("/live", methods=["GET"])
+    @limiter.exempt
+    def liveness():
+        """Liveness probe, answered while the model is still loading"""
+        return health_controller.check_liveness()
+
+    @health_bp.route("/ready", methods=["GET"])
+    @limiter.exempt
+    def readiness():
+        """Readiness probe, green once the model is loaded and warmed up"""
+        return health_controller.check_readiness()
+
     @health_bp.route("/ai-service", methods=["GET"])
     @limiter.limit("30 per minute")
     def ai_service_status():
@@ -186,8 +223,31 @@ def create_app():
     def shortlist_candidates():
         """Shortlist top candidates for a job position"""
         logging.info("Processing candidate shortlisting request")
+        if request.mimetype == NDJSON_MIMETYPE:
+            return shortlist_controller.shortlist_candidates_stream(request.stream)
         return shortlist_controller.shortlist_candidates(request.get_json())
 
+    @shortlist_bp.route("/batch", methods=["POST"])
+    @limiter.limit("10 per minute")
+    def shortlist_batch():
+        """Shortlist top candidates for several jobs in one request"""
+        logging.info("Processing batch shortlisting request")
+        return shortlist_controller.shortlist_batch(request.get_json())
+
+    @shortlist_bp.route("/explain", methods=["POST"])
+    @limiter.limit("60 per minute")
+    def explain_candidate():
+        """Explain the full score breakdown of a single application"""
+        logging.info("Processing candidate explanation request")
+        return shortlist_controller.explain_candidate(request.get_json())
+
+    @shortlist_bp.route("/rerank", methods=["POST"])
+    @limiter.limit("60 per minute")
+    def rerank_candidates():
+        """Re-rank a shortlisted job with new scoring weights"""
+        logging.info("Processing candidate re-ranking request")
+        return shortlist_controller.rerank_candidates(request.get_json())
+
     @shortlist_bp.route("/preview", methods=["POST"])
     @limiter.limit("20 per minute")
     def preview_shortlist():
@@ -217,10 +277,81 @@ def create_app():
         """Get detailed model performance metrics"""
         return model_controller.get_model_metrics()
 
+    @model_bp.route("/versions", methods=["GET"])
+    @limiter.limit("30 per minute")
+    def model_versions():
+        """List stored model versions"""
+        return model_controller.list_versions()
+
+    @model_bp.route("/versions/<version_id>/activate", methods=["POST"])
+    @limiter.limit("10 per hour")
+    def activate_model_version(version_id):
+        """Serve a stored model version without retraining"""
+        logging.info(f"Activating model version {version_id}")
+        return model_controller.activate_version(version_id)
+
+    @model_bp.route("/rollback", methods=["POST"])
+    @limiter.limit("10 per hour")
+    def rollback_model():
+        """Re-activate the previously active model version"""
+        logging.info("Rolling back to the previous model version")
+        return model_controller.rollback_version()
+
+    # ===== MATCH CONTROLLER ROUTES =====
+    match_bp = Blueprint("match", __name__, url_prefix="/api/v1/match")
+
+    @match_bp.route("/jobs", methods=["POST"])
+    @limiter.limit("60 per minute")
+    def upsert_jobs():
+        """Add or update open jobs in the job index"""
+        logging.info("Processing open job index upsert request")
+        return match_controller.upsert_jobs(request.get_json())
+
+    @match_bp.route("/jobs/<job_id>", methods=["DELETE"])
+    @limiter.limit("60 per minute")
+    def remove_job(job_id):
+        """Remove a job from the open job index"""
+        logging.info(f"Removing job {job_id} from the open job index")
+        return match_controller.remove_job(job_id)
+
+    @match_bp.route("/jobs-for-candidate", methods=["POST"])
+    @limiter.limit("30 per minute")
+    def jobs_for_candidate():
+        """Find the best open jobs for a candidate's resume"""
+        logging.info("Processing jobs-for-candidate matching request")
+        return match_controller.jobs_for_candidate(request.get_json())
+
+    # ===== TALENT POOL CONTROLLER ROUTES =====
+    talent_pool_bp = Blueprint(
+        "talent_pool", __name__, url_prefix="/api/v1/talent-pool"
+    )
+
+    @talent_pool_bp.route("/applications", methods=["POST"])
+    @limiter.limit("30 per minute")
+    def add_to_talent_pool():
+        """Add applications to the persistent talent pool"""
+        logging.info("Processing talent pool append request")
+        return talent_pool_controller.add_applications(request.get_json())
+
+    @talent_pool_bp.route("/search", methods=["POST"])
+    @limiter.limit("10 per minute")
+    def search_talent_pool():
+        """Shortlist past applicants from the talent pool for a new job"""
+        logging.info("Processing talent pool search request")
+        return talent_pool_controller.search(request.get_json())
+
+    @talent_pool_bp.route("/stats", methods=["GET"])
+    @limiter.limit("30 per minute")
+    def talent_pool_stats():
+        """Get talent pool statistics"""
+        return talent_pool_controller.get_stats()
+
     # Register blueprints with app
     app.register_blueprint(health_bp)
     app.register_blueprint(shortlist_bp)
     app.register_blueprint(model_bp)
+    app.register_blueprint(match_bp)
+    app.register_blueprint(talent_pool_bp)
 
     # Register error handlers
     setup_error_handlers(app)
@@ -240,16 +371,34 @@ def create_app():
                     "endpoints": {
                         "health": {
                             "system_health": "/api/v1/health/",
+                            "liveness": "/api/v1/health/live",
+                            "readiness": "/api/v1/health/ready",
                             "ai_service_status": "/api/v1/health/ai-service",
                         },
                         "shortlist": {
                             "shortlist_candidates": "/api/v1/shortlist/candidates",
                             "preview_shortlist": "/api/v1/shortlist/preview",
+                            "shortlist_batch": "/api/v1/shortlist/batch",
+                            "explain_candidate": "/api/v1/shortlist/explain",
+                            "rerank_candidates": "/api/v1/shortlist/rerank",
+                        },
+                        "match": {
+                            "upsert_jobs": "/api/v1/match/jobs",
+                            "remove_job": "/api/v1/match/jobs/<job_id>",
+                            "jobs_for_candidate": "/api/v1/match/jobs-for-candidate",
+                        },
+                        "talent_pool": {
+                            "add_applications": "/api/v1/talent-pool/applications",
+                            "search": "/api/v1/talent-pool/search",
+                            "stats": "/api/v1/talent-pool/stats",
                         },
                         "model": {
                             "train_model": "/api/v1/model/train",
                             "model_status": "/api/v1/model/status",
                             "model_metrics": "/api/v1/model/metrics",
+                            "model_versions": "/api/v1/model/versions",
+                            "activate_version": "/api/v1/model/versions/<version_id>/activate",
+                            "rollback": "/api/v1/model/rollback",
                         },
                     },
                     "config": {
@@ -262,6 +411,8 @@ def create_app():
             200,
         )
 
+    if config.MODEL_BACKGROUND_LOAD:
+        logging.info("⏳ Model loading in the background, see /api/v1/health/ready")
     logging.info("OptaHire AI Service initialized successfully")
     return app
 
@@ -311,7 +462,7 @@ def start_server():
             + f'⏰ Timestamp:  {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}'
         )
         print(Fore.BLUE + f"💾 Memory:     {psutil.virtual_memory().percent}% used")
-        print(Fore.BLUE + f"🖥️  CPU:       {psutil.cpu_percent(interval=1)}% used")
+        print(Fore.BLUE + f"🖥️  CPU:       {psutil.cpu_percent(interval=None)}% used")
         print(Fore.YELLOW + f"📊 Model Ver:  {config.MODEL_VERSION}")
         print(Fore.YELLOW + f"🎯 Max Candidates: {config.MAX_CANDIDATES}")
         print(Fore.YELLOW + f"📈 Min Similarity: {config.MIN_SIMILARITY}")
@@ -320,8 +471,16 @@ def start_server():
         print(Fore.MAGENTA + "🔗 API ENDPOINTS:")
         print(Fore.MAGENTA + f"   Health Check:      /api/v1/health/")
         print(Fore.MAGENTA + f"   AI Service Status: /api/v1/health/ai-service")
+        print(Fore.MAGENTA + f"   Liveness Probe:    /api/v1/health/live")
+        print(Fore.MAGENTA + f"   Readiness Probe:   /api/v1/health/ready")
         print(Fore.MAGENTA + f"   Shortlist Candidates: /api/v1/shortlist/candidates")
         print(Fore.MAGENTA + f"   Preview Shortlist:    /api/v1/shortlist/preview")
+        print(Fore.MAGENTA + f"   Batch Shortlist:      /api/v1/shortlist/batch")
+        print(Fore.MAGENTA + f"   Explain Candidate:    /api/v1/shortlist/explain")
+        print(Fore.MAGENTA + f"   Rerank Candidates:    /api/v1/shortlist/rerank")
+        print(Fore.MAGENTA + f"   Index Open Jobs:   /api/v1/match/jobs")
+        print(Fore.MAGENTA + f"   Jobs For Candidate: /api/v1/match/jobs-for-candidate")
+        print(Fore.MAGENTA + f"   Talent Pool:       /api/v1/talent-pool/search")
         print(Fore.MAGENTA + f"   Train Model:       /api/v1/model/train")
         print(Fore.MAGENTA + f"   Model Status:      /api/v1/model/status")
         print(Fore.MAGENTA + f"   Model Metrics:     /api/v1/model/metrics")
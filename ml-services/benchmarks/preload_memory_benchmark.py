@@ -0,0 +1,254 @@
+"""
+Benchmark gunicorn worker memory with and without preloading the model
+
+Starts the service with gunicorn.conf.py twice, once with GUNICORN_PRELOAD
+off (every worker imports the app and loads the model after fork) and
+once with it on (the master loads and freezes everything before forking).
+It sends the same shortlisting requests to each and reports, per worker,
+resident (RSS), proportional (PSS) and unique (USS) memory plus the minor
+page faults taken since the fork, which include copy-on-write faults on
+pages inherited from the master.
+
+The shortlisting route is limited to 10 requests per minute per client,
+so each run sends at most that many by default.
+
+PSS and USS come from /proc/<pid>/smaps and the fault counts from
+/proc/<pid>/stat, so the full report needs Linux.
+
+Usage:
+    python benchmarks/preload_memory_benchmark.py
+    python benchmarks/preload_memory_benchmark.py --workers 4 --pool-size 500
+"""
+
+import argparse
+import json
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+import urllib.request
+from pathlib import Path
+
+import psutil
+from colorama import Fore, Style, init
+
+# Initialize colorama
+init(autoreset=True)
+
+SERVICE_DIR = Path(__file__).resolve().parent.parent
+
+
+def print_header(title):
+    """Print a formatted header"""
+    print("\n" + Fore.YELLOW + "=" * 86)
+    print(Fore.YELLOW + Style.BRIGHT + title)
+    print(Fore.YELLOW + "=" * 86)
+
+
+def print_error(message):
+    """Print an error message"""
+    print(f"{Fore.RED}❌ {message}{Style.RESET_ALL}")
+
+
+def free_port():
+    """Pick an unused local TCP port"""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def load_payloads(data_path, n_jobs, pool_size):
+    """Shortlisting requests built from the synthetic training data"""
+    with open(data_path, "r") as f:
+        examples = json.load(f)
+
+    applications = [
+        {
+            "id": f"application-{idx}",
+            "candidateId": example["candidate"]["id"],
+            "candidate": example["candidate"],
+            "resume": example["resume"],
+            "status": "applied",
+        }
+        for idx, example in enumerate(examples[:pool_size])
+    ]
+    step = max(1, len(examples) // n_jobs)
+    return [
+        json.dumps({"job": example["job"], "applications": applications}).encode()
+        for example in examples[::step][:n_jobs]
+    ]
+
+
+def minor_faults(pid):
+    """Minor page faults of a process (None outside Linux)"""
+    try:
+        with open(f"/proc/{pid}/stat", "r") as f:
+            # Fields after the parenthesized command name; minflt is field 10
+            return int(f.read().rsplit(")", 1)[1].split()[7])
+    except OSError:
+        return None
+
+
+def worker_memory(master):
+    """RSS, PSS, USS and minor faults of every worker of a gunicorn master"""
+    workers = []
+    for worker in master.children():
+        try:
+            info = worker.memory_full_info()
+        except psutil.Error:
+            continue
+        workers.append(
+            {
+                "rss": info.rss,
+                "pss": getattr(info, "pss", 0),
+                "uss": getattr(info, "uss", 0),
+                "minor_faults": minor_faults(worker.pid),
+            }
+        )
+    return workers
+
+
+def wait_until_up(base_url, timeout):
+    """Poll the index endpoint until every worker can answer"""
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            with urllib.request.urlopen(f"{base_url}/", timeout=2):
+                return True
+        except OSError:
+            time.sleep(0.5)
+    return False
+
+
+def run_server(preload, args, payloads):
+    """Start gunicorn, send the requests and measure its workers"""
+    port = free_port()
+    env = dict(
+        os.environ,
+        GUNICORN_PRELOAD="true" if preload else "false",
+        WEB_CONCURRENCY=str(args.workers),
+        HOST="127.0.0.1",
+        PORT=str(port),
+        RATE_LIMIT_PER_MINUTE="100000",
+        LOG_LEVEL="WARNING",
+    )
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "gunicorn", "-c", "gunicorn.conf.py", "app:app"],
+        cwd=SERVICE_DIR,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+    try:
+        base_url = f"http://127.0.0.1:{port}"
+        if not wait_until_up(base_url, args.timeout):
+            raise RuntimeError("gunicorn did not start in time")
+        startup_seconds = time.perf_counter() - start
+
+        master = psutil.Process(process.pid)
+        before = worker_memory(master)
+
+        for idx in range(args.requests):
+            request = urllib.request.Request(
+                f"{base_url}/api/v1/shortlist/candidates",
+                data=payloads[idx % len(payloads)],
+                headers={"Content-Type": "application/json"},
+            )
+            with urllib.request.urlopen(request, timeout=120) as response:
+                response.read()
+
+        after = worker_memory(master)
+        return {"startup_seconds": startup_seconds, "before": before, "after": after}
+
+    finally:
+        process.send_signal(signal.SIGTERM)
+        try:
+            process.wait(timeout=30)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+
+def average(workers, key):
+    values = [worker[key] for worker in workers if worker[key] is not None]
+    return sum(values) / len(values) if values else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare gunicorn worker memory with and without preloading"
+    )
+    parser.add_argument(
+        "--data",
+        default=str(SERVICE_DIR / "data" / "optahire_training_data.json"),
+        help="Synthetic dataset to build requests from",
+    )
+    parser.add_argument("--workers", type=int, default=3, help="Gunicorn workers")
+    parser.add_argument(
+        "--requests",
+        type=int,
+        default=10,
+        help="Shortlisting requests per run (the route allows 10 per minute)",
+    )
+    parser.add_argument("--jobs", type=int, default=10, help="Distinct jobs")
+    parser.add_argument(
+        "--pool-size", type=int, default=200, help="Applications per request"
+    )
+    parser.add_argument(
+        "--timeout", type=float, default=120, help="Seconds to wait for startup"
+    )
+    args = parser.parse_args()
+
+    print_header("🧊 GUNICORN PRELOAD MEMORY BENCHMARK")
+
+    try:
+        payloads = load_payloads(args.data, args.jobs, args.pool_size)
+    except Exception as e:
+        print_error(f"Could not load dataset: {e}")
+        sys.exit(1)
+
+    results = {}
+    for preload in (False, True):
+        label = "preload" if preload else "no preload"
+        try:
+            results[label] = run_server(preload, args, payloads)
+        except Exception as e:
+            print_error(f"{label} run failed: {e}")
+            sys.exit(1)
+
+    mb = 1024**2
+    print(
+        f"{Fore.BLUE}ℹ️ {args.workers} workers, {args.requests} requests of "
+        f"{args.pool_size} applications{Style.RESET_ALL}"
+    )
+    print(f"\n{'Per worker (average)':<36}{'no preload':>14}{'preload':>14}")
+    for label, stage, key, scale in (
+        ("RSS after startup (MB)", "before", "rss", mb),
+        ("PSS after startup (MB)", "before", "pss", mb),
+        ("USS after startup (MB)", "before", "uss", mb),
+        ("Minor faults after startup", "before", "minor_faults", 1),
+        ("RSS after requests (MB)", "after", "rss", mb),
+        ("PSS after requests (MB)", "after", "pss", mb),
+        ("USS after requests (MB)", "after", "uss", mb),
+        ("Minor faults after requests", "after", "minor_faults", 1),
+    ):
+        values = [
+            average(results[run][stage], key) / scale
+            for run in ("no preload", "preload")
+        ]
+        print(f"{label:<36}{values[0]:>14.1f}{values[1]:>14.1f}")
+
+    totals = [
+        sum(worker["pss"] for worker in results[run]["after"]) / mb
+        for run in ("no preload", "preload")
+    ]
+    startups = [results[run]["startup_seconds"] for run in ("no preload", "preload")]
+    print(f"{'Total worker PSS (MB)':<36}{totals[0]:>14.1f}{totals[1]:>14.1f}")
+    print(f"{'Startup (s)':<36}{startups[0]:>14.2f}{startups[1]:>14.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,217 @@
+"""
+Benchmark float32 against float64 TF-IDF vectors
+
+Shortlists every sampled job against the synthetic applicant pool once per
+VECTOR_DTYPE and reports vector memory, peak allocations, latency and whether
+both precisions return the same top-K ordering.
+
+Usage:
+    python benchmarks/vector_dtype_benchmark.py
+    python benchmarks/vector_dtype_benchmark.py --jobs 20 --top-k 10 --repeats 5
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+from colorama import Fore, Style, init
+
+# Initialize colorama
+init(autoreset=True)
+
+# Add the ml-services directory to Python path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+DTYPES = ("float64", "float32")
+
+
+def print_header(title):
+    """Print a formatted header"""
+    print("\n" + Fore.YELLOW + "=" * 86)
+    print(Fore.YELLOW + Style.BRIGHT + title)
+    print(Fore.YELLOW + "=" * 86)
+
+
+def print_success(message):
+    """Print a success message"""
+    print(f"{Fore.GREEN}✅ {message}{Style.RESET_ALL}")
+
+
+def print_error(message):
+    """Print an error message"""
+    print(f"{Fore.RED}❌ {message}{Style.RESET_ALL}")
+
+
+def print_warning(message):
+    """Print a warning message"""
+    print(f"{Fore.YELLOW}⚠️ {message}{Style.RESET_ALL}")
+
+
+def load_dataset(data_path, n_jobs):
+    """Build sample jobs and one applicant pool from the synthetic training data"""
+    with open(data_path, "r") as f:
+        examples = json.load(f)
+
+    applications = [
+        {
+            "id": f"application-{idx}",
+            "candidateId": example["candidate"]["id"],
+            "candidate": example["candidate"],
+            "resume": example["resume"],
+            "status": "applied",
+        }
+        for idx, example in enumerate(examples)
+    ]
+
+    # Spread the sampled jobs across the dataset
+    step = max(1, len(examples) // n_jobs)
+    jobs = [example["job"] for example in examples[::step][:n_jobs]]
+
+    return jobs, applications
+
+
+def vector_bytes(features):
+    """Bytes held by the sparse resume vectors of a pool"""
+    return sum(
+        matrix.data.nbytes + matrix.indices.nbytes + matrix.indptr.nbytes
+        for field, matrix in features.items()
+        if field != "has_text"
+    )
+
+
+def run_dtype(dtype, jobs, applications, repeats):
+    """Shortlist every job with one vector precision and collect measurements"""
+    os.environ["VECTOR_DTYPE"] = dtype
+
+    from models.candidate_matcher import CandidateMatcher
+
+    matcher = CandidateMatcher()
+    if not matcher.is_trained:
+        raise RuntimeError("No trained model found. Run train_model.py first.")
+
+    resumes = [application["resume"] for application in applications]
+    pool_vector_bytes = vector_bytes(matcher._transform_resumes(resumes))
+
+    # Warm-up pass, also used for peak allocations and the returned rankings
+    tracemalloc.start()
+    shortlists = {
+        job["id"]: matcher.shortlist_candidates(job, applications) for job in jobs
+    }
+    _, peak_bytes = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for job in jobs:
+            matcher.shortlist_candidates(job, applications)
+        timings.append(time.perf_counter() - start)
+
+    return {
+        "pool_vector_bytes": pool_vector_bytes,
+        "peak_bytes": peak_bytes,
+        "median_seconds": statistics.median(timings),
+        "best_seconds": min(timings),
+        "shortlists": shortlists,
+    }
+
+
+def compare_shortlists(reference, candidate):
+    """Compare the top-K of two runs job by job"""
+    identical_jobs = 0
+    max_score_diff = 0.0
+
+    for job_id, expected in reference.items():
+        actual = candidate[job_id]
+        if [result["application_id"] for result in expected] == [
+            result["application_id"] for result in actual
+        ]:
+            identical_jobs += 1
+
+        for expected_result, actual_result in zip(expected, actual):
+            max_score_diff = max(
+                max_score_diff,
+                abs(expected_result["total_score"] - actual_result["total_score"]),
+            )
+
+    return identical_jobs, max_score_diff
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare float32 and float64 TF-IDF vectors for shortlisting"
+    )
+    parser.add_argument(
+        "--data",
+        default="data/optahire_training_data.json",
+        help="Synthetic dataset to sample jobs and applicants from",
+    )
+    parser.add_argument("--jobs", type=int, default=10, help="Number of jobs")
+    parser.add_argument(
+        "--top-k", type=int, default=5, help="Candidates shortlisted per job"
+    )
+    parser.add_argument(
+        "--repeats", type=int, default=3, help="Timed passes per precision"
+    )
+    args = parser.parse_args()
+
+    # Measure the vector pipeline itself, not the resume cache
+    os.environ["ENABLE_CACHING"] = "false"
+    os.environ["MAX_CANDIDATES"] = str(args.top_k)
+
+    print_header("📏 VECTOR PRECISION BENCHMARK")
+
+    try:
+        jobs, applications = load_dataset(args.data, args.jobs)
+    except Exception as e:
+        print_error(f"Could not load dataset: {e}")
+        sys.exit(1)
+
+    print(
+        f"{Fore.BLUE}ℹ️ {len(jobs)} jobs x {len(applications)} applications, top {args.top_k}{Style.RESET_ALL}"
+    )
+
+    results = {}
+    for dtype in DTYPES:
+        try:
+            results[dtype] = run_dtype(dtype, jobs, applications, args.repeats)
+        except Exception as e:
+            print_error(f"{dtype} run failed: {e}")
+            sys.exit(1)
+
+    print(f"\n{'':<28}{'float64':>14}{'float32':>14}{'ratio':>10}")
+    for label, key, scale, unit in (
+        ("Pool vector memory", "pool_vector_bytes", 1024**2, "MB"),
+        ("Peak allocations", "peak_bytes", 1024**2, "MB"),
+        ("Median latency", "median_seconds", 1, "s"),
+        ("Best latency", "best_seconds", 1, "s"),
+    ):
+        baseline = results["float64"][key]
+        value = results["float32"][key]
+        print(
+            f"{label + ' (' + unit + ')':<28}{baseline / scale:>14.3f}{value / scale:>14.3f}"
+            f"{(value / baseline if baseline else 0):>10.2f}"
+        )
+
+    identical_jobs, max_score_diff = compare_shortlists(
+        results["float64"]["shortlists"], results["float32"]["shortlists"]
+    )
+    print()
+    if identical_jobs == len(jobs):
+        print_success(f"Identical top-{args.top_k} ordering for all {len(jobs)} jobs")
+    else:
+        print_warning(
+            f"Identical top-{args.top_k} ordering for {identical_jobs}/{len(jobs)} jobs"
+        )
+    print(
+        f"{Fore.BLUE}ℹ️ Max total score difference: {max_score_diff:.3f}{Style.RESET_ALL}"
+    )
+
+
+if __name__ == "__main__":
+    main()
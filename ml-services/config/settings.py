@@ -41,7 +41,34 @@ class AppConfig:
         self.MODEL_VERSION = os.getenv("MODEL_VERSION", "1.0.0")
         self.MAX_CANDIDATES = int(os.getenv("MAX_CANDIDATES", 5))
         self.MIN_SIMILARITY = float(os.getenv("MIN_SIMILARITY", 0.3))
+        # Drop applicants whose skill overlap with the requirements is below
+        # MIN_SIMILARITY before full scoring (changes who can be shortlisted)
+        self.ENABLE_PREFILTER = os.getenv("ENABLE_PREFILTER", "false").lower() == "true"
+        self.MAX_MATCHED_JOBS = int(os.getenv("MAX_MATCHED_JOBS", 10))
         self.MODEL_STORAGE_PATH = os.getenv("MODEL_STORAGE_PATH", "data/models")
+        # Vectorizer trained by default: "tfidf" (fitted vocabulary) or
+        # "hashing" (fixed-size hashed features, memory independent of corpus)
+        self.MODEL_TYPE = os.getenv("MODEL_TYPE", "tfidf").lower()
+        self.HASHING_N_FEATURES = int(os.getenv("HASHING_N_FEATURES", 2**18))
+        # Open stored model arrays (.npy) with mmap so workers share them
+        self.MODEL_MMAP = os.getenv("MODEL_MMAP", "true").lower() == "true"
+        # Trained model versions kept on disk for rollback (0 keeps all)
+        self.MODEL_KEEP_VERSIONS = int(os.getenv("MODEL_KEEP_VERSIONS", 5))
+        # Load the model on a background thread so the service answers
+        # liveness probes at once, then warm it up with a synthetic shortlist
+        self.MODEL_BACKGROUND_LOAD = (
+            os.getenv("MODEL_BACKGROUND_LOAD", "true").lower() == "true"
+        )
+        self.MODEL_WARM_UP = os.getenv("MODEL_WARM_UP", "true").lower() == "true"
+        self.SHORTLIST_CHUNK_SIZE = int(os.getenv("SHORTLIST_CHUNK_SIZE", 1000))
+        self.TALENT_POOL_BLOCK_SIZE = int(os.getenv("TALENT_POOL_BLOCK_SIZE", 5000))
+
+        # Parallel shortlisting (opt-in, set SHORTLIST_WORKERS above 1 to enable).
+        # Each server worker forks its scoring processes once and reuses them
+        self.SHORTLIST_WORKERS = int(os.getenv("SHORTLIST_WORKERS", 0))
+        self.PARALLEL_MIN_APPLICATIONS = int(
+            os.getenv("PARALLEL_MIN_APPLICATIONS", 5000)
+        )
 
         # Scoring Weights
         self.WEIGHT_SKILLS = float(os.getenv("WEIGHT_SKILLS", 0.40))
@@ -52,6 +79,39 @@ class AppConfig:
 
         # Performance Settings - Optimized for free tier
         self.ENABLE_CACHING = os.getenv("ENABLE_CACHING", "false").lower() == "true"
+        self.JOB_CACHE_MAX_ENTRIES = int(os.getenv("JOB_CACHE_MAX_ENTRIES", 128))
+        self.JOB_CACHE_TTL_SECONDS = int(os.getenv("JOB_CACHE_TTL_SECONDS", 3600))
+        self.RESUME_CACHE_MAX_BYTES = int(
+            os.getenv("RESUME_CACHE_MAX_BYTES", 64 * 1024 * 1024)
+        )
+        # Distinct texts whose token streams are memoized per vectorizer
+        self.TOKEN_CACHE_MAX_ENTRIES = int(os.getenv("TOKEN_CACHE_MAX_ENTRIES", 10000))
+        # float32 halves the memory of TF-IDF vectors; scores are rounded to
+        # 3 decimals either way
+        self.VECTOR_DTYPE = os.getenv("VECTOR_DTYPE", "float64").lower()
+        # Component scores kept per job for /shortlist/rerank (0 disables).
+        # Opt-in: a recorded run keeps a row per applicant (memory grows with
+        # the pool, not K) and turns off score pruning. Runs are also written
+        # under MODEL_STORAGE_PATH so any worker can re-rank them; streamed
+        # shortlists are never recorded
+        self.RERANK_CACHE_MAX_JOBS = int(os.getenv("RERANK_CACHE_MAX_JOBS", 0))
+        self.RERANK_CACHE_TTL_SECONDS = int(os.getenv("RERANK_CACHE_TTL_SECONDS", 3600))
+        # Skip TF-IDF scoring of candidates whose best possible score cannot
+        # reach the top-K (never changes the shortlist). Only applies when the
+        # rerank cache is disabled, since re-ranking needs every candidate
+        self.ENABLE_SCORE_PRUNING = (
+            os.getenv("ENABLE_SCORE_PRUNING", "false").lower() == "true"
+        )
+        # Component scores per (job, resume, model) persisted in
+        # SQLite under MODEL_STORAGE_PATH, so re-shortlisting skips scoring
+        self.ENABLE_SCORE_CACHE = (
+            os.getenv("ENABLE_SCORE_CACHE", "false").lower() == "true"
+        )
+        self.SCORE_CACHE_MAX_AGE_DAYS = float(os.getenv("SCORE_CACHE_MAX_AGE_DAYS", 30))
+        # Gunicorn (gunicorn.conf.py): workers, and whether the master loads
+        # the app and model once before forking them
+        self.GUNICORN_WORKERS = int(os.getenv("WEB_CONCURRENCY", 3))
+        self.GUNICORN_PRELOAD = os.getenv("GUNICORN_PRELOAD", "true").lower() == "true"
         self.RATE_LIMIT_PER_MINUTE = int(
             os.getenv("RATE_LIMIT_PER_MINUTE", 60)
         )  # Reduced for free tier
@@ -72,9 +132,16 @@ class AppConfig:
 
         # Memory optimization for free tier
         self.MAX_CONTENT_LENGTH = 16 * 1024 * 1024  # 16MB max request size
+        # Streamed NDJSON uploads are scored incrementally, so they get their
+        # own (much larger) cap; 0 disables the limit
+        self.STREAM_MAX_CONTENT_LENGTH = int(
+            os.getenv("STREAM_MAX_CONTENT_LENGTH", 1024 * 1024 * 1024)
+        )
 
         # Validate configuration after initialization
         self._validate_weights()
+        self._validate_vector_dtype()
+        self._validate_model_type()
 
     def _validate_port(self):
         try:
@@ -113,3 +180,21 @@ class AppConfig:
             raise ValueError(
                 f"Scoring weights must sum to 1.0, current sum: {total_weight}"
             )
+
+    def _validate_vector_dtype(self):
+        """Validate that TF-IDF vectors use a supported float type"""
+        if self.VECTOR_DTYPE not in ("float32", "float64"):
+            raise ValueError(
+                f"VECTOR_DTYPE must be float32 or float64, got: {self.VECTOR_DTYPE}"
+            )
+
+    def _validate_model_type(self):
+        """Validate the default model type and hashed feature count"""
+        if self.MODEL_TYPE not in ("tfidf", "hashing"):
+            raise ValueError(
+                f"MODEL_TYPE must be tfidf or hashing, got: {self.MODEL_TYPE}"
+            )
+        if self.HASHING_N_FEATURES < 1:
+            raise ValueError(
+                f"HASHING_N_FEATURES must be positive, got: {self.HASHING_N_FEATURES}"
+            )
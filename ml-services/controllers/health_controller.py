@@ -22,9 +22,10 @@ class HealthController:
         This is like a heartbeat to confirm the AI server is responding
         """
         try:
-            # Get system information for monitoring
+            # Get system information for monitoring (CPU usage since the
+            # previous call, so the check never blocks to sample it)
             memory_usage = psutil.virtual_memory().percent
-            cpu_usage = psutil.cpu_percent(interval=1)
+            cpu_usage = psutil.cpu_percent(interval=None)
 
             health_data = {
                 "status": "healthy",
@@ -55,14 +56,55 @@ class HealthController:
                 error_code="HEALTH_CHECK_FAILED",
             )
 
+    def check_liveness(self):
+        """
+        Liveness probe - the process is up and serving requests
+
+        Answers while the model is still loading and never touches it.
+        """
+        return format_response(
+            success=True,
+            message="AI service is alive",
+            data={"status": "alive", "service": "OptaHire AI Server"},
+        )
+
+    def check_readiness(self):
+        """
+        Readiness probe - the model is loaded and warmed up
+
+        Returns 503 until the first model load (and warm-up) of this worker
+        has finished. A service without a trained model is ready: it can
+        still be trained.
+        """
+        status = self.matcher.registry.status
+        readiness_data = {
+            "status": status,
+            "model_trained": self.matcher.registry.current().is_trained,
+        }
+
+        if status != "ready":
+            return format_error_response(
+                message=f"AI model is {status}",
+                status_code=503,
+                error_code="MODEL_NOT_READY",
+                details=readiness_data,
+            )
+
+        return format_response(
+            success=True, message="AI service is ready", data=readiness_data
+        )
+
     def check_ai_status(self):
         """
         Detailed AI model status check
         This provides information about whether the AI model is trained and ready
         """
         try:
+            # Reported without waiting for a model that is still loading
+            model_trained = self.matcher.registry.current().is_trained
             ai_status = {
-                "model_trained": self.matcher.is_trained,
+                "model_trained": model_trained,
+                "model_status": self.matcher.registry.status,
                 "model_version": self.config.MODEL_VERSION,
                 "last_training": self._get_last_training_time(),
                 "capabilities": {
@@ -87,7 +129,7 @@ class HealthController:
                 },
             }
 
-            if self.matcher.is_trained:
+            if model_trained:
                 message = "AI model is trained and ready for candidate shortlisting"
                 status_code = 200
             else:
@@ -116,12 +158,25 @@ class HealthController:
     def _get_last_training_time(self):
         """Get timestamp of last model training"""
         try:
-            model_path = os.path.join(
-                self.config.MODEL_STORAGE_PATH, "text_vectorizer.pkl"
-            )
-            if os.path.exists(model_path):
-                timestamp = os.path.getmtime(model_path)
-                return datetime.fromtimestamp(timestamp).isoformat()
+            # The state file is written by every model type; legacy models
+            # only have the pickled vectorizers
+            model_paths = [
+                os.path.join(self.config.MODEL_STORAGE_PATH, filename)
+                for filename in ("training_state.json", "text_vectorizer.pkl")
+            ]
+            version_id = self.matcher.model_store.active_version()
+            if version_id:
+                model_paths.insert(
+                    0,
+                    os.path.join(
+                        self.matcher.model_store.version_path(version_id),
+                        "training_state.json",
+                    ),
+                )
+            for model_path in model_paths:
+                if os.path.exists(model_path):
+                    timestamp = os.path.getmtime(model_path)
+                    return datetime.fromtimestamp(timestamp).isoformat()
             return None
         except:
             return None
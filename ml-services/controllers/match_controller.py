@@ -0,0 +1,197 @@
+import logging
+from datetime import datetime, timezone
+from utils.response_utils import format_response, format_error_response
+from utils.validation_utils import validate_job_data, validate_resume_data
+from utils.error_utils import AIModelError, ValidationError, log_error
+from models.candidate_matcher import CandidateMatcher
+from models.job_index import JobIndex
+
+
+class MatchController:
+    """
+    Controller for reverse matching - finding the best open jobs for a candidate
+
+    Open jobs are kept in an inverted index that your Node.js server maintains
+    by upserting jobs when they are posted or edited and removing them when
+    they close.
+    """
+
+    def __init__(self):
+        self.matcher = CandidateMatcher()
+        self.job_index = JobIndex(self.matcher.config.MODEL_STORAGE_PATH)
+
+    def upsert_jobs(self, request_data):
+        """
+        Add open jobs to the index or update them
+
+        Expected data format:
+        {
+          "jobs": [ { job_data }, ... ]
+        }
+        """
+        try:
+            if not request_data:
+                raise ValidationError("Request body is required")
+
+            if not isinstance(request_data, dict):
+                raise ValidationError("Request body must be a JSON object")
+
+            jobs = request_data.get("jobs")
+            if not isinstance(jobs, list) or len(jobs) == 0:
+                raise ValidationError("jobs must be a non-empty array")
+
+            for idx, job_data in enumerate(jobs):
+                if not isinstance(job_data, dict):
+                    raise ValidationError(f"Invalid job data at index {idx}")
+
+                job_valid, job_error = validate_job_data(job_data)
+                if not job_valid:
+                    raise ValidationError(
+                        f"Invalid job data at index {idx}: {job_error}"
+                    )
+
+            if not self.matcher.is_trained:
+                raise AIModelError(
+                    "AI model is not trained yet. Please train the model before indexing jobs.",
+                    error_code="MODEL_NOT_TRAINED",
+                )
+
+            total_indexed = self.matcher.index_jobs(jobs, self.job_index)
+
+            logging.info(f"📇 Indexed {len(jobs)} open jobs")
+
+            return format_response(
+                success=True,
+                message=f"Successfully indexed {len(jobs)} open jobs",
+                data={
+                    "indexed_job_ids": [job_data["id"] for job_data in jobs],
+                    "total_indexed_jobs": total_indexed,
+                },
+            )
+
+        except ValidationError as e:
+            return format_error_response(
+                message=e.message,
+                status_code=400,
+                error_code="JOB_INDEX_VALIDATION_ERROR",
+            )
+        except AIModelError as e:
+            log_error(e, "AI model error while indexing jobs")
+            return format_error_response(
+                message=e.message, status_code=500, error_code=e.error_code
+            )
+        except Exception as e:
+            log_error(e, "Unexpected error while indexing jobs")
+            return format_error_response(
+                message="An unexpected error occurred while indexing jobs",
+                status_code=500,
+                error_code="JOB_INDEX_UNEXPECTED_ERROR",
+            )
+
+    def remove_job(self, job_id):
+        """Remove a closed or deleted job from the index"""
+        try:
+            remaining = self.matcher.remove_indexed_job(job_id, self.job_index)
+            if remaining is None:
+                return format_error_response(
+                    message=f"Job {job_id} is not in the open job index",
+                    status_code=404,
+                    error_code="JOB_NOT_INDEXED",
+                )
+
+            return format_response(
+                success=True,
+                message=f"Job {job_id} removed from the open job index",
+                data={
+                    "job_id": job_id,
+                    "total_indexed_jobs": remaining,
+                },
+            )
+
+        except Exception as e:
+            log_error(e, "Unexpected error while removing indexed job")
+            return format_error_response(
+                message="An unexpected error occurred while removing the job",
+                status_code=500,
+                error_code="JOB_INDEX_UNEXPECTED_ERROR",
+            )
+
+    def jobs_for_candidate(self, request_data):
+        """
+        Find the open jobs that best fit a candidate's resume
+
+        Expected data format:
+        {
+          "resume": { resume_data },
+          "limit": 10
+        }
+        """
+        try:
+            if not request_data:
+                raise ValidationError("Request body is required")
+
+            if not isinstance(request_data, dict):
+                raise ValidationError("Request body must be a JSON object")
+
+            if "resume" not in request_data:
+                raise ValidationError("Missing resume data in request")
+
+            resume = request_data["resume"]
+            if not isinstance(resume, dict):
+                raise ValidationError("Resume data must be an object")
+
+            resume_valid, resume_error = validate_resume_data(resume)
+            if not resume_valid:
+                raise ValidationError(f"Invalid resume data: {resume_error}")
+
+            limit = request_data.get("limit", self.matcher.config.MAX_MATCHED_JOBS)
+            if (
+                not isinstance(limit, int)
+                or isinstance(limit, bool)
+                or not 1 <= limit <= 100
+            ):
+                raise ValidationError("limit must be an integer between 1 and 100")
+
+            if not self.matcher.is_trained:
+                raise AIModelError(
+                    "AI model is not trained yet. Please train the model before matching jobs.",
+                    error_code="MODEL_NOT_TRAINED",
+                )
+
+            matched_jobs = self.matcher.match_jobs_for_candidate(
+                resume, self.job_index, limit
+            )
+
+            return format_response(
+                success=True,
+                message=f"Found {len(matched_jobs)} matching open jobs",
+                data={
+                    "matched_jobs": matched_jobs,
+                    "matched_count": len(matched_jobs),
+                    "total_indexed_jobs": len(self.job_index),
+                    "matching_metadata": {
+                        "algorithm": "inverted_index_multi_factor_scoring",
+                        "weights_used": self.matcher.weights,
+                        "processing_timestamp": datetime.now(timezone.utc).isoformat(),
+                    },
+                },
+            )
+
+        except ValidationError as e:
+            return format_error_response(
+                message=e.message,
+                status_code=400,
+                error_code="JOB_MATCHING_VALIDATION_ERROR",
+            )
+        except AIModelError as e:
+            log_error(e, "AI model error during job matching")
+            return format_error_response(
+                message=e.message, status_code=500, error_code=e.error_code
+            )
+        except Exception as e:
+            log_error(e, "Unexpected error during job matching")
+            return format_error_response(
+                message="An unexpected error occurred while matching jobs",
+                status_code=500,
+                error_code="JOB_MATCHING_UNEXPECTED_ERROR",
+            )
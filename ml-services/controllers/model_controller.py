@@ -3,6 +3,7 @@ from utils.response_utils import format_response, format_error_response
 from utils.validation_utils import validate_job_data, validate_resume_data
 from utils.error_utils import AIModelError, ValidationError, log_error
 from models.candidate_matcher import CandidateMatcher
+from models.hashing_vectorizer import HashingTfidfVectorizer, MODEL_TYPES
 import os
 import sys
 from datetime import datetime, timezone
@@ -33,7 +34,8 @@ class ModelController:
                     "resume": { resume_data },
                     "outcome": "hired" | "rejected"
                 }
-            ]
+            ],
+            "model_type": "tfidf" | "hashing"  (optional, defaults to MODEL_TYPE)
         }
         """
         try:
@@ -46,6 +48,12 @@ class ModelController:
             if not isinstance(training_data, list) or len(training_data) == 0:
                 raise ValidationError("training_data must be a non-empty array")
 
+            model_type = request_data.get("model_type")
+            if model_type is not None and model_type not in MODEL_TYPES:
+                raise ValidationError(
+                    f"model_type must be one of: {', '.join(MODEL_TYPES)}"
+                )
+
             # Filter for successful hiring cases only
             # We want to train the model on what good matches look like
             successful_matches = []
@@ -100,7 +108,9 @@ class ModelController:
             )
 
             # Train the model using CandidateMatcher
-            training_results = self.matcher.train_model(successful_matches)
+            training_results = self.matcher.train_model(
+                successful_matches, model_type=model_type
+            )
 
             # Return training results
             return format_response(
@@ -112,6 +122,7 @@ class ModelController:
                     "successful_examples_used": len(successful_matches),
                     "model_ready": self.matcher.is_trained,
                     "model_version": training_results.get("model_version", "1.0.0"),
+                    "model_type": training_results.get("model_type"),
                     "vocabulary_size": training_results.get("vocabulary_size", 0),
                     "skills_vocabulary_size": training_results.get(
                         "skills_vocabulary_size", 0
@@ -145,12 +156,16 @@ class ModelController:
         This helps your Node.js server understand if the AI is ready to work
         """
         try:
+            # Pick up a version activated through another worker
+            self.matcher.sync_model_version()
+
             # Get basic status information
             status_data = {
                 "is_trained": self.matcher.is_trained,
                 "model_version": self.matcher.training_metadata.get(
                     "model_version", "1.0.0"
                 ),
+                "version_id": self.matcher.training_metadata.get("version_id"),
                 "scoring_weights": self.matcher.weights,
                 "supported_features": [
                     "skills_matching",
@@ -169,6 +184,7 @@ class ModelController:
                 status_data.update(
                     {
                         "training_info": {
+                            "model_type": self.matcher.model_type,
                             "training_samples": metadata.get("training_samples", 0),
                             "valid_samples": metadata.get("valid_samples", 0),
                             "vocabulary_size": metadata.get("vocabulary_size", 0),
@@ -223,6 +239,93 @@ class ModelController:
                 error_code="MODEL_STATUS_ERROR",
             )
 
+    def list_versions(self):
+        """
+        List the stored model versions, newest first, flagging the active one
+        """
+        try:
+            self.matcher.sync_model_version()
+            versions = self.matcher.list_model_versions()
+
+            return format_response(
+                success=True,
+                message=f"Found {len(versions)} model versions",
+                data={
+                    "versions": versions,
+                    "active_version": self.matcher.training_metadata.get("version_id"),
+                },
+            )
+
+        except Exception as e:
+            log_error(e, "Error listing model versions")
+            return format_error_response(
+                message="Failed to list model versions",
+                status_code=500,
+                error_code="MODEL_VERSIONS_ERROR",
+            )
+
+    def activate_version(self, version_id):
+        """
+        Serve a previously trained model version without retraining
+        """
+        try:
+            metadata = self.matcher.activate_model_version(version_id)
+
+            return format_response(
+                success=True,
+                message=f"Model version {version_id} is now active",
+                data={"version_id": version_id, "training_info": metadata},
+            )
+
+        except AIModelError as e:
+            return self._version_error_response(e, "Model version activation failed")
+        except Exception as e:
+            log_error(e, "Unexpected error activating model version")
+            return format_error_response(
+                message="An unexpected error occurred while activating the model version",
+                status_code=500,
+                error_code="MODEL_VERSION_UNEXPECTED_ERROR",
+            )
+
+    def rollback_version(self):
+        """
+        Re-activate the model version that was active before the current one
+        """
+        try:
+            metadata = self.matcher.rollback_model()
+
+            return format_response(
+                success=True,
+                message=f"Rolled back to model version {metadata.get('version_id')}",
+                data={
+                    "version_id": metadata.get("version_id"),
+                    "training_info": metadata,
+                },
+            )
+
+        except AIModelError as e:
+            return self._version_error_response(e, "Model rollback failed")
+        except Exception as e:
+            log_error(e, "Unexpected error rolling back model version")
+            return format_error_response(
+                message="An unexpected error occurred while rolling back the model",
+                status_code=500,
+                error_code="MODEL_VERSION_UNEXPECTED_ERROR",
+            )
+
+    def _version_error_response(self, error, context):
+        """Map model version errors to HTTP status codes"""
+        status_codes = {
+            "MODEL_VERSION_NOT_FOUND": 404,
+            "NO_PREVIOUS_MODEL_VERSION": 409,
+        }
+        status_code = status_codes.get(error.error_code, 500)
+        if status_code == 500:
+            log_error(error, context)
+        return format_error_response(
+            message=error.message, status_code=status_code, error_code=error.error_code
+        )
+
     def get_model_metrics(self):
         """
         Get detailed model metrics and performance statistics
@@ -253,16 +356,17 @@ class ModelController:
                     ),
                 },
                 "model_components": {
+                    "model_type": self.matcher.model_type,
                     "text_vectorizer": {
                         "vocabulary_size": self.matcher.training_metadata.get(
                             "vocabulary_size", 0
                         ),
-                        "feature_count": (
-                            len(self.matcher.text_vectorizer.vocabulary_)
-                            if self.matcher.text_vectorizer
-                            else 0
+                        "feature_count": self.matcher.vectorizer_feature_count(
+                            self.matcher.text_vectorizer
+                        ),
+                        "max_features": self._max_features(
+                            self.matcher.text_vectorizer, 1000
                         ),
-                        "max_features": 1000,
                         "ngram_range": "(1, 2)",
                         "status": (
                             "loaded" if self.matcher.text_vectorizer else "not_loaded"
@@ -272,12 +376,12 @@ class ModelController:
                         "vocabulary_size": self.matcher.training_metadata.get(
                             "skills_vocabulary_size", 0
                         ),
-                        "feature_count": (
-                            len(self.matcher.skills_vectorizer.vocabulary_)
-                            if self.matcher.skills_vectorizer
-                            else 0
+                        "feature_count": self.matcher.vectorizer_feature_count(
+                            self.matcher.skills_vectorizer
+                        ),
+                        "max_features": self._max_features(
+                            self.matcher.skills_vectorizer, 500
                         ),
-                        "max_features": 500,
                         "ngram_range": "(1, 3)",
                         "status": (
                             "loaded" if self.matcher.skills_vectorizer else "not_loaded"
@@ -341,6 +445,12 @@ class ModelController:
         except:
             return False
 
+    def _max_features(self, vectorizer, tfidf_max_features):
+        """Feature space size: hashed columns or the TF-IDF vocabulary cap"""
+        if isinstance(vectorizer, HashingTfidfVectorizer):
+            return vectorizer.n_features
+        return tfidf_max_features
+
     def _check_storage_health(self):
         """Check if model storage directory is accessible"""
         try:
@@ -1,3 +1,4 @@
+import json
 import logging
 from typing import List, Dict, Any
 from datetime import datetime, timezone
@@ -79,35 +80,11 @@ class ShortlistController:
                 )
 
             # Validate and prepare application data
-            valid_applications = []
-            for idx, application in enumerate(applications):
-                try:
-                    # Validate application structure
-                    app_valid, app_error = validate_application_data(application)
-                    if not app_valid:
-                        logging.warning(
-                            f"Skipping invalid application {idx}: {app_error}"
-                        )
-                        continue
-
-                    # Validate resume data if present
-                    if "resume" in application and application["resume"]:
-                        resume_valid, resume_error = validate_resume_data(
-                            application["resume"]
-                        )
-                        if not resume_valid:
-                            logging.warning(
-                                f"Skipping application {idx}: {resume_error}"
-                            )
-                            continue
-
-                    # Only consider applications with 'applied' status
-                    if application.get("status") == "applied":
-                        valid_applications.append(application)
-
-                except Exception as e:
-                    logging.warning(f"Error validating application {idx}: {str(e)}")
-                    continue
+            valid_applications = [
+                application
+                for idx, application in enumerate(applications)
+                if self._is_shortlistable(idx, application)
+            ]
 
             if len(valid_applications) == 0:
                 return format_response(
@@ -134,8 +111,9 @@ class ShortlistController:
                 )
 
             # Perform AI-powered shortlisting
+            selection_stats = {}
             shortlisted_candidates = self.matcher.shortlist_candidates(
-                job_data, valid_applications
+                job_data, valid_applications, selection_stats
             )
 
             # Prepare response data (matching your Node.js response patterns)
@@ -150,6 +128,8 @@ class ShortlistController:
                     "model_version": "1.0.0",
                     "algorithm": "multi_factor_scoring",
                     "weights_used": self.matcher.weights,
+                    "selection_stats": selection_stats,
+                    "cache_stats": self.matcher.get_cache_stats(),
                     "processing_timestamp": self._get_current_timestamp(),
                 },
             }
@@ -181,6 +161,249 @@ class ShortlistController:
                 error_code="SHORTLISTING_UNEXPECTED_ERROR",
             )
 
+    def shortlist_candidates_stream(self, stream):
+        """
+        Streaming shortlisting endpoint for very large applicant pools
+
+        Accepts newline-delimited JSON (application/x-ndjson): the job on the
+        first line, then one application per line. Applications are validated
+        and scored as they arrive, and only the running top candidates are
+        kept in memory, so the pool is not limited by the request size cap.
+
+        Expected data format:
+        { job_data }
+        { "id": "application_id", "candidateId": "candidate_id", ... }
+        { "id": "application_id", "candidateId": "candidate_id", ... }
+        """
+        try:
+            lines = (line for line in stream if line.strip())
+
+            first_line = next(lines, None)
+            if first_line is None:
+                raise ValidationError("Request body is required")
+
+            try:
+                job_data = json.loads(first_line)
+            except ValueError:
+                raise ValidationError("First line must be the job data as JSON")
+
+            if not isinstance(job_data, dict):
+                raise ValidationError("First line must be the job data as JSON")
+
+            job_valid, job_error = validate_job_data(job_data)
+            if not job_valid:
+                raise ValidationError(f"Invalid job data: {job_error}")
+
+            # Check if AI model is trained before consuming the stream
+            if not self.matcher.is_trained:
+                raise AIModelError(
+                    "AI model is not trained yet. Please train the model before shortlisting candidates.",
+                    error_code="MODEL_NOT_TRAINED",
+                )
+
+            logging.info(
+                f"Starting streamed shortlisting process for job '{job_data.get('title')}'"
+            )
+
+            counts = {"total": 0, "valid": 0}
+
+            def valid_applications():
+                for idx, line in enumerate(lines):
+                    counts["total"] += 1
+                    try:
+                        application = json.loads(line)
+                    except ValueError:
+                        logging.warning(f"Skipping application {idx}: invalid JSON")
+                        continue
+
+                    if self._is_shortlistable(idx, application):
+                        counts["valid"] += 1
+                        yield application
+
+            selection_stats = {}
+            shortlisted_candidates = self.matcher.shortlist_candidates_stream(
+                job_data, valid_applications(), selection_stats
+            )
+
+            response_data = {
+                "shortlisted_candidates": shortlisted_candidates,
+                "total_applications": counts["total"],
+                "valid_applications": counts["valid"],
+                "shortlisted_count": len(shortlisted_candidates),
+                "job_id": job_data.get("id"),
+                "job_title": job_data.get("title"),
+                "shortlisting_metadata": {
+                    "model_version": "1.0.0",
+                    "algorithm": "multi_factor_scoring",
+                    "streaming": True,
+                    "weights_used": self.matcher.weights,
+                    "selection_stats": selection_stats,
+                    "cache_stats": self.matcher.get_cache_stats(),
+                    "processing_timestamp": self._get_current_timestamp(),
+                },
+            }
+
+            success_message = f"Successfully shortlisted {len(shortlisted_candidates)} candidates from {counts['valid']} applications for {job_data.get('title')} position"
+
+            logging.info(f"✅ {success_message}")
+
+            return format_response(
+                success=True, message=success_message, data=response_data
+            )
+
+        except ValidationError as e:
+            return format_error_response(
+                message=e.message,
+                status_code=400,
+                error_code="SHORTLISTING_VALIDATION_ERROR",
+            )
+        except AIModelError as e:
+            log_error(e, "AI model error during streamed shortlisting")
+            return format_error_response(
+                message=e.message, status_code=500, error_code=e.error_code
+            )
+        except Exception as e:
+            log_error(e, "Unexpected error during streamed candidate shortlisting")
+            return format_error_response(
+                message="An unexpected error occurred during candidate shortlisting",
+                status_code=500,
+                error_code="SHORTLISTING_UNEXPECTED_ERROR",
+            )
+
+    def shortlist_batch(self, request_data):
+        """
+        Batch shortlisting endpoint - shortlists several jobs in one request
+
+        Used when several jobs close at the same time. Resumes shared between
+        jobs are vectorized once and all jobs are scored together.
+
+        Expected data format:
+        {
+          "jobs": [
+            {
+              "job": { job_data },
+              "applications": [ { application_data }, ... ]
+            }
+          ]
+        }
+        """
+        try:
+            if not request_data:
+                raise ValidationError("Request body is required")
+
+            if not isinstance(request_data, dict):
+                raise ValidationError("Request body must be a JSON object")
+
+            if "jobs" not in request_data:
+                raise ValidationError("Missing jobs data in request")
+
+            jobs = request_data["jobs"]
+            if not isinstance(jobs, list) or len(jobs) == 0:
+                raise ValidationError("jobs must be a non-empty array")
+
+            # Validate every job entry; an invalid job is reported on its own
+            # without failing the rest of the batch
+            job_results = []
+            job_batches = []
+
+            for job_idx, entry in enumerate(jobs):
+                job_error = self._batch_entry_error(job_idx, entry)
+                if job_error:
+                    job_data = entry.get("job") if isinstance(entry, dict) else None
+                    job_fields = job_data if isinstance(job_data, dict) else {}
+                    job_results.append(
+                        {
+                            "job_id": job_fields.get("id"),
+                            "job_title": job_fields.get("title"),
+                            "success": False,
+                            "message": job_error,
+                        }
+                    )
+                    continue
+
+                job_data = entry["job"]
+                applications = entry.get("applications", [])
+
+                valid_applications = [
+                    application
+                    for idx, application in enumerate(applications)
+                    if self._is_shortlistable(idx, application)
+                ]
+
+                job_results.append(
+                    {
+                        "job_id": job_data.get("id"),
+                        "job_title": job_data.get("title"),
+                        "success": True,
+                        "total_applications": len(applications),
+                        "valid_applications": len(valid_applications),
+                    }
+                )
+                job_batches.append((job_data, valid_applications))
+
+            # Check if AI model is trained
+            if not self.matcher.is_trained:
+                raise AIModelError(
+                    "AI model is not trained yet. Please train the model before shortlisting candidates.",
+                    error_code="MODEL_NOT_TRAINED",
+                )
+
+            logging.info(
+                f"Starting batch shortlisting process for {len(job_batches)} jobs"
+            )
+
+            selection_stats = []
+            shortlists = iter(
+                self.matcher.shortlist_candidates_batch(job_batches, selection_stats)
+            )
+            job_stats = iter(selection_stats)
+            for job_result in job_results:
+                if job_result["success"]:
+                    shortlisted_candidates = next(shortlists)
+                    job_result["shortlisted_candidates"] = shortlisted_candidates
+                    job_result["shortlisted_count"] = len(shortlisted_candidates)
+                    job_result["selection_stats"] = next(job_stats)
+
+            response_data = {
+                "results": job_results,
+                "total_jobs": len(jobs),
+                "shortlisted_jobs": len(job_batches),
+                "shortlisting_metadata": {
+                    "model_version": "1.0.0",
+                    "algorithm": "multi_factor_scoring",
+                    "weights_used": self.matcher.weights,
+                    "cache_stats": self.matcher.get_cache_stats(),
+                    "processing_timestamp": self._get_current_timestamp(),
+                },
+            }
+
+            success_message = f"Successfully shortlisted candidates for {len(job_batches)} of {len(jobs)} jobs"
+
+            logging.info(f"✅ {success_message}")
+
+            return format_response(
+                success=True, message=success_message, data=response_data
+            )
+
+        except ValidationError as e:
+            return format_error_response(
+                message=e.message,
+                status_code=400,
+                error_code="SHORTLISTING_VALIDATION_ERROR",
+            )
+        except AIModelError as e:
+            log_error(e, "AI model error during batch shortlisting")
+            return format_error_response(
+                message=e.message, status_code=500, error_code=e.error_code
+            )
+        except Exception as e:
+            log_error(e, "Unexpected error during batch candidate shortlisting")
+            return format_error_response(
+                message="An unexpected error occurred during batch candidate shortlisting",
+                status_code=500,
+                error_code="SHORTLISTING_UNEXPECTED_ERROR",
+            )
+
     def preview_shortlist(self, request_data):
         """
         Preview shortlisting results without making any changes
@@ -214,6 +437,242 @@ class ShortlistController:
                 error_code="PREVIEW_ERROR",
             )
 
+    def explain_candidate(self, request_data):
+        """
+        Explain how a single application was scored for a job
+
+        Expected data format:
+        {
+          "job": { job_data },
+          "application": { application_data with resume }
+        }
+        """
+        try:
+            if not request_data:
+                raise ValidationError("Request body is required")
+
+            if not isinstance(request_data, dict):
+                raise ValidationError("Request body must be a JSON object")
+
+            if "job" not in request_data:
+                raise ValidationError("Missing job data in request")
+
+            if "application" not in request_data:
+                raise ValidationError("Missing application data in request")
+
+            job_data = request_data["job"]
+            if not isinstance(job_data, dict):
+                raise ValidationError("Job data must be an object")
+
+            job_valid, job_error = validate_job_data(job_data)
+            if not job_valid:
+                raise ValidationError(f"Invalid job data: {job_error}")
+
+            application = request_data["application"]
+            if not isinstance(application, dict):
+                raise ValidationError("Application must be an object")
+
+            if not application.get("resume"):
+                raise ValidationError("Application must include resume data")
+
+            if not isinstance(application["resume"], dict):
+                raise ValidationError("Resume data must be an object")
+
+            if not isinstance(application.get("candidate", {}), dict):
+                raise ValidationError("Candidate data must be an object")
+
+            app_valid, app_error = validate_application_data(application)
+            if not app_valid:
+                raise ValidationError(f"Invalid application data: {app_error}")
+
+            resume_valid, resume_error = validate_resume_data(application["resume"])
+            if not resume_valid:
+                raise ValidationError(f"Invalid resume data: {resume_error}")
+
+            explanation = self.matcher.explain_candidate(job_data, application)
+
+            return format_response(
+                success=True,
+                message="Candidate score explained successfully",
+                data={
+                    "job_id": job_data.get("id"),
+                    "job_title": job_data.get("title"),
+                    "candidate": explanation,
+                },
+            )
+
+        except ValidationError as e:
+            return format_error_response(
+                message=e.message, status_code=400, error_code="VALIDATION_ERROR"
+            )
+        except AIModelError as e:
+            log_error(e, "AI model error during candidate explanation")
+            return format_error_response(
+                message=e.message, status_code=500, error_code=e.error_code
+            )
+        except Exception as e:
+            log_error(e, "Unexpected error during candidate explanation")
+            return format_error_response(
+                message="An unexpected error occurred while explaining the candidate score",
+                status_code=500,
+                error_code="EXPLANATION_UNEXPECTED_ERROR",
+            )
+
+    def rerank_candidates(self, request_data):
+        """
+        Re-rank a recently shortlisted job with different scoring weights
+
+        Uses the component scores cached by the last shortlist run of the job,
+        so no resumes are sent and nothing is re-vectorized.
+
+        Expected data format:
+        {
+          "job_id": "job_id",
+          "weights": {
+            "skills_match": 0.5,
+            "experience_relevance": 0.2,
+            "education_alignment": 0.1,
+            "industry_experience": 0.1,
+            "text_similarity": 0.1
+          }
+        }
+        """
+        try:
+            if not request_data:
+                raise ValidationError("Request body is required")
+
+            job_id = request_data.get("job_id")
+            if not job_id:
+                raise ValidationError("Missing job_id in request")
+
+            weights = request_data.get("weights")
+            weights_error = self._validate_weights(weights)
+            if weights_error:
+                raise ValidationError(weights_error)
+
+            shortlisted_candidates = self.matcher.rerank_candidates(job_id, weights)
+
+            return format_response(
+                success=True,
+                message=f"Re-ranked candidates for job {job_id} with new weights",
+                data={
+                    "shortlisted_candidates": shortlisted_candidates,
+                    "shortlisted_count": len(shortlisted_candidates),
+                    "job_id": job_id,
+                    "shortlisting_metadata": {
+                        "algorithm": "multi_factor_scoring",
+                        "weights_used": weights,
+                        "reranked": True,
+                        "processing_timestamp": self._get_current_timestamp(),
+                    },
+                },
+            )
+
+        except ValidationError as e:
+            return format_error_response(
+                message=e.message, status_code=400, error_code="VALIDATION_ERROR"
+            )
+        except AIModelError as e:
+            if e.error_code == "RERANK_NOT_AVAILABLE":
+                return format_error_response(
+                    message=e.message, status_code=404, error_code=e.error_code
+                )
+            if e.error_code == "RERANK_DISABLED":
+                return format_error_response(
+                    message=e.message, status_code=409, error_code=e.error_code
+                )
+            log_error(e, "AI model error during candidate re-ranking")
+            return format_error_response(
+                message=e.message, status_code=500, error_code=e.error_code
+            )
+        except Exception as e:
+            log_error(e, "Unexpected error during candidate re-ranking")
+            return format_error_response(
+                message="An unexpected error occurred during candidate re-ranking",
+                status_code=500,
+                error_code="RERANK_UNEXPECTED_ERROR",
+            )
+
+    def _validate_weights(self, weights):
+        """
+        Check a weights dict for re-ranking
+
+        Returns:
+            Error message, or None when the weights are valid
+        """
+        expected = set(self.matcher.weights)
+
+        if not isinstance(weights, dict):
+            return "weights must be an object"
+
+        if set(weights) != expected:
+            return (
+                f"weights must have exactly these keys: {', '.join(sorted(expected))}"
+            )
+
+        for key, value in weights.items():
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                return f"Weight {key} must be a number"
+            if value < 0:
+                return f"Weight {key} must not be negative"
+
+        total_weight = sum(weights.values())
+        if abs(total_weight - 1.0) > 0.01:
+            return f"Weights must sum to 1.0, current sum: {total_weight}"
+
+        return None
+
+    def _batch_entry_error(self, job_idx, entry):
+        """
+        Describe what is wrong with one entry of a batch request
+
+        Returns:
+            Error message, or None when the entry can be shortlisted
+        """
+        if not isinstance(entry, dict) or "job" not in entry:
+            return f"Missing job data in jobs[{job_idx}]"
+
+        job_data = entry["job"]
+        if not isinstance(job_data, dict):
+            return "Invalid job data: Job data must be an object"
+
+        job_valid, job_error = validate_job_data(job_data)
+        if not job_valid:
+            return f"Invalid job data: {job_error}"
+
+        if not isinstance(entry.get("applications", []), list):
+            return f"Applications must be an array in jobs[{job_idx}]"
+
+        return None
+
+    def _is_shortlistable(self, idx, application):
+        """
+        Check that an application is valid and still waiting for a decision
+
+        Invalid applications are logged and skipped rather than failing the
+        whole request.
+        """
+        try:
+            # Validate application structure
+            app_valid, app_error = validate_application_data(application)
+            if not app_valid:
+                logging.warning(f"Skipping invalid application {idx}: {app_error}")
+                return False
+
+            # Validate resume data if present
+            if "resume" in application and application["resume"]:
+                resume_valid, resume_error = validate_resume_data(application["resume"])
+                if not resume_valid:
+                    logging.warning(f"Skipping application {idx}: {resume_error}")
+                    return False
+
+            # Only consider applications with 'applied' status
+            return application.get("status") == "applied"
+
+        except Exception as e:
+            logging.warning(f"Error validating application {idx}: {str(e)}")
+            return False
+
     def _get_current_timestamp(self):
         """Get current timestamp in ISO format (matching Node.js patterns)"""
         return datetime.now(timezone.utc).isoformat() + "Z"
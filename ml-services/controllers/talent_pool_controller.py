@@ -0,0 +1,215 @@
+import logging
+from datetime import datetime, timezone
+from utils.response_utils import format_response, format_error_response
+from utils.validation_utils import (
+    validate_job_data,
+    validate_resume_data,
+    validate_application_data,
+)
+from utils.error_utils import AIModelError, ValidationError, log_error
+from models.candidate_matcher import CandidateMatcher
+from models.talent_pool import TalentPoolIndex
+
+
+class TalentPoolController:
+    """
+    Controller for the persistent talent pool of past applicants
+
+    Your Node.js server adds applications to the pool as they come in, and a
+    new job can later be matched against every past applicant without
+    sending any resumes.
+    """
+
+    def __init__(self):
+        self.matcher = CandidateMatcher()
+        self.talent_pool = TalentPoolIndex(
+            self.matcher.config.MODEL_STORAGE_PATH,
+            self.matcher.config.TALENT_POOL_BLOCK_SIZE,
+        )
+
+    def add_applications(self, request_data):
+        """
+        Add applications to the talent pool
+
+        Applications already in the pool are replaced by their new version.
+
+        Expected data format:
+        {
+          "applications": [
+            {
+              "id": "application_id",
+              "candidateId": "candidate_id",
+              "candidate": { candidate_data },
+              "resume": { resume_data },
+              "status": "applied"
+            }
+          ]
+        }
+        """
+        try:
+            if not request_data:
+                raise ValidationError("Request body is required")
+
+            if not isinstance(request_data, dict):
+                raise ValidationError("Request body must be a JSON object")
+
+            applications = request_data.get("applications")
+            if not isinstance(applications, list) or len(applications) == 0:
+                raise ValidationError("applications must be a non-empty array")
+
+            valid_applications = [
+                application
+                for idx, application in enumerate(applications)
+                if self._is_poolable(idx, application)
+            ]
+
+            if not valid_applications:
+                raise ValidationError("No valid applications with resumes to add")
+
+            total = self.matcher.add_to_talent_pool(
+                valid_applications, self.talent_pool
+            )
+
+            return format_response(
+                success=True,
+                message=f"Added {len(valid_applications)} applications to the talent pool",
+                data={
+                    "added_count": len(valid_applications),
+                    "skipped_count": len(applications) - len(valid_applications),
+                    "talent_pool": self.talent_pool.stats(),
+                },
+            )
+
+        except ValidationError as e:
+            return format_error_response(
+                message=e.message,
+                status_code=400,
+                error_code="TALENT_POOL_VALIDATION_ERROR",
+            )
+        except AIModelError as e:
+            log_error(e, "AI model error while adding to the talent pool")
+            return format_error_response(
+                message=e.message, status_code=500, error_code=e.error_code
+            )
+        except Exception as e:
+            log_error(e, "Unexpected error while adding to the talent pool")
+            return format_error_response(
+                message="An unexpected error occurred while adding applications",
+                status_code=500,
+                error_code="TALENT_POOL_UNEXPECTED_ERROR",
+            )
+
+    def search(self, request_data):
+        """
+        Shortlist the best past applicants for a new job
+
+        Expected data format:
+        {
+          "job": { job_data }
+        }
+        """
+        try:
+            if not request_data:
+                raise ValidationError("Request body is required")
+
+            if not isinstance(request_data, dict):
+                raise ValidationError("Request body must be a JSON object")
+
+            if "job" not in request_data:
+                raise ValidationError("Missing job data in request")
+
+            job_data = request_data["job"]
+            if not isinstance(job_data, dict):
+                raise ValidationError("Job data must be an object")
+
+            job_valid, job_error = validate_job_data(job_data)
+            if not job_valid:
+                raise ValidationError(f"Invalid job data: {job_error}")
+
+            selection_stats = {}
+            shortlisted_candidates = self.matcher.shortlist_from_talent_pool(
+                job_data, self.talent_pool, selection_stats
+            )
+
+            return format_response(
+                success=True,
+                message=f"Shortlisted {len(shortlisted_candidates)} candidates from the talent pool",
+                data={
+                    "shortlisted_candidates": shortlisted_candidates,
+                    "shortlisted_count": len(shortlisted_candidates),
+                    "job_id": job_data.get("id"),
+                    "job_title": job_data.get("title"),
+                    "talent_pool": self.talent_pool.stats(),
+                    "shortlisting_metadata": {
+                        "algorithm": "talent_pool_multi_factor_scoring",
+                        "weights_used": self.matcher.weights,
+                        "selection_stats": selection_stats,
+                        "processing_timestamp": datetime.now(timezone.utc).isoformat(),
+                    },
+                },
+            )
+
+        except ValidationError as e:
+            return format_error_response(
+                message=e.message,
+                status_code=400,
+                error_code="TALENT_POOL_VALIDATION_ERROR",
+            )
+        except AIModelError as e:
+            log_error(e, "AI model error during talent pool search")
+            return format_error_response(
+                message=e.message, status_code=500, error_code=e.error_code
+            )
+        except Exception as e:
+            log_error(e, "Unexpected error during talent pool search")
+            return format_error_response(
+                message="An unexpected error occurred while searching the talent pool",
+                status_code=500,
+                error_code="TALENT_POOL_UNEXPECTED_ERROR",
+            )
+
+    def get_stats(self):
+        """Get the size of the talent pool"""
+        try:
+            # Include applications added through other workers
+            self.talent_pool.refresh()
+            return format_response(
+                success=True,
+                message="Talent pool statistics retrieved successfully",
+                data=self.talent_pool.stats(),
+            )
+        except Exception as e:
+            log_error(e, "Error retrieving talent pool statistics")
+            return format_error_response(
+                message="Failed to retrieve talent pool statistics",
+                status_code=500,
+                error_code="TALENT_POOL_STATS_ERROR",
+            )
+
+    def _is_poolable(self, idx, application):
+        """
+        Check that an application is valid and carries a valid resume
+
+        Invalid applications are logged and skipped rather than failing the
+        whole request.
+        """
+        try:
+            app_valid, app_error = validate_application_data(application)
+            if not app_valid:
+                logging.warning(f"Skipping invalid application {idx}: {app_error}")
+                return False
+
+            if not application.get("resume"):
+                logging.warning(f"Skipping application {idx}: missing resume")
+                return False
+
+            resume_valid, resume_error = validate_resume_data(application["resume"])
+            if not resume_valid:
+                logging.warning(f"Skipping application {idx}: {resume_error}")
+                return False
+
+            return True
+
+        except Exception as e:
+            logging.warning(f"Error validating application {idx}: {str(e)}")
+            return False
@@ -0,0 +1,65 @@
+"""
+Gunicorn configuration for the OptaHire AI service
+
+    gunicorn -c gunicorn.conf.py app:app
+
+With GUNICORN_PRELOAD (default) the master imports the app once, which
+loads the trained model into the process-wide registry, and the workers
+inherit it through fork. Model arrays and every other object created at
+startup are shared copy-on-write instead of being loaded once per worker.
+
+CPython writes to an object whenever the garbage collector examines it, so
+a collection in a worker would copy the pages of inherited objects it
+never modifies. Following the gc.freeze() recipe, the collector is
+disabled while the master starts up. Everything allocated by then is
+frozen into the permanent generation, which collections skip, and the
+collector is re-enabled in each worker.
+
+Threads do not survive a fork, so a preloading master loads and warms up
+the model synchronously instead of on a background thread
+(MODEL_BACKGROUND_LOAD). Without preloading every worker loads its own
+model in the background and answers liveness probes meanwhile.
+
+Measure the effect with benchmarks/preload_memory_benchmark.py.
+"""
+
+import gc
+import os
+
+from config.settings import AppConfig
+
+app_config = AppConfig()
+
+bind = f"{app_config.HOST}:{app_config.PORT}"
+workers = app_config.GUNICORN_WORKERS
+preload_app = app_config.GUNICORN_PRELOAD
+
+if preload_app:
+    # Avoid freed "holes" in pages that the workers will share
+    gc.disable()
+    # A loader thread started in the master would be lost (or leave its
+    # locks held) in the forked workers
+    os.environ["MODEL_BACKGROUND_LOAD"] = "false"
+
+
+def when_ready(server):
+    """Freeze the preloaded app and model before the workers are forked"""
+    if preload_app:
+        gc.freeze()
+        server.log.info(f"🧊 Froze {gc.get_freeze_count()} objects before forking")
+
+
+def post_fork(server, worker):
+    """Re-enable garbage collection and verify the inherited model"""
+    gc.enable()
+
+    if not preload_app:
+        # The worker loads the app (and model) itself
+        return
+
+    from models.candidate_matcher import prepare_forked_worker
+
+    if prepare_forked_worker():
+        server.log.info(f"✅ Worker {worker.pid} verified the inherited model")
+    else:
+        server.log.warning(f"⚠️ Worker {worker.pid} has no working model")
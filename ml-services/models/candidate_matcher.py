@@ -2,16 +2,180 @@ import re
 import logging
 import numpy as np
 import json
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Callable, Iterable, Optional, Set, Tuple
 from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+from sklearn.preprocessing import normalize
 from collections import Counter
+from itertools import islice
 import joblib
 import os
+import time
+import scipy.sparse as sp
+import functools
+import threading
+import weakref
+from contextlib import contextmanager
 from datetime import datetime, timezone
 
 from utils.error_utils import AIModelError
+from utils.hash_utils import (
+    files_hash,
+    job_content_hash,
+    resume_content_hash,
+)
 from config.settings import AppConfig
+from models.feature_cache import (
+    ComponentMatrixCache,
+    JobFeatureCache,
+    ResumeVectorCache,
+)
+from models.hashing_vectorizer import MODEL_TYPES, HashingTfidfVectorizer
+from models.mapped_vectorizer import MappedTfidfVectorizer
+from models.model_registry import ModelSnapshot, get_model_registry
+from models.model_store import STATE_FILE, ModelStore
+from models.component_store import ComponentMatrixStore
+from models.ranking import TopKSelector
+from models.score_cache import ScoreCache, get_score_cache
+from models.similarity import pairwise_similarity, row_similarity, rows_similarity
+from models.tokenization import SharedAnalyzer
+from models.skill_matcher import SkillAutomaton
+from models.parallel_scoring import (
+    fork_available,
+    parallel_select_top_k,
+    start_worker_pool,
+)
+from models.job_index import JobIndex
+from models.talent_pool import TalentPoolIndex
+
+# Order of the score components in every score matrix produced by the batch engine
+SCORE_COMPONENTS = (
+    "skills_match",
+    "experience_relevance",
+    "education_alignment",
+    "industry_experience",
+    "text_similarity",
+)
+
+# High-demand technical skills (you can customize this list based on your market)
+HIGH_DEMAND_SKILLS = {
+    "python": 0.05,
+    "javascript": 0.05,
+    "react": 0.04,
+    "node.js": 0.04,
+    "aws": 0.06,
+    "docker": 0.05,
+    "kubernetes": 0.06,
+    "microservices": 0.05,
+    "machine learning": 0.07,
+    "ai": 0.06,
+    "data science": 0.06,
+    "postgresql": 0.04,
+    "mongodb": 0.04,
+    "redis": 0.03,
+    "git": 0.02,
+    "agile": 0.03,
+    "devops": 0.05,
+}
+
+# Jobs proposed by the inverted index per requested match before full scoring
+JOB_MATCH_CANDIDATE_FACTOR = 5
+
+# Largest cosine similarity of two L2-normalized rows, with headroom for
+# floating point error in the dot product (float32 included)
+SIMILARITY_UPPER_BOUND = 1.0 + 1e-5
+
+# Distinct resumes whose scores a single shortlisting request remembers for
+# later duplicates (bounds the memory of streamed requests)
+DEDUP_MAX_TRACKED_RESUMES = 100000
+
+# Resume fields vectorized for scoring (and stored in the resume vector cache)
+RESUME_VECTOR_FIELDS = ("experience", "education", "skills", "combined")
+
+# Similarity computed from each resume field and the job vector it is compared to
+RESUME_FIELD_SIMILARITIES = {
+    "experience": ("experience", "job_text_vector"),
+    "education": ("education", "requirements_text_vector"),
+    "skills": ("skills", "requirements_skills_vector"),
+    "combined": ("text", "job_text_vector"),
+}
+
+# Resume fields vectorized per pruning stage, cheapest (shortest texts) first
+PRUNING_STAGES = (("skills", "education"), ("experience",), ("combined",))
+
+# Synthetic shortlist run by warm_up, covering every scored resume field
+WARM_UP_JOB = {
+    "id": "warm-up-job",
+    "title": "Software Engineer",
+    "description": "Build and operate web services with Python and React",
+    "requirements": "3+ years of Python, JavaScript, SQL and AWS experience",
+    "category": "IT",
+    "company": "OptaHire",
+    "level": "mid",
+}
+WARM_UP_RESUMES = (
+    {
+        "title": "Backend Developer",
+        "summary": "Python developer building APIs and data pipelines",
+        "headline": "Backend Developer | 4 Years Experience",
+        "skills": ["Python", "Django", "PostgreSQL", "AWS"],
+        "experience": "4 years of backend development with Python and AWS",
+        "education": "BS Computer Science",
+        "industry": "Technology",
+        "company": "Tech Corp",
+        "achievements": "Cut API latency by 30%",
+    },
+    {
+        "title": "Frontend Developer",
+        "summary": "JavaScript developer focused on React interfaces",
+        "headline": "Frontend Developer | 2 Years Experience",
+        "skills": ["JavaScript", "React", "CSS"],
+        "experience": "2 years of frontend development with React",
+        "education": "Bachelor of Design",
+        "industry": "Marketing",
+        "company": "Web Agency",
+        "achievements": "Rebuilt the company website",
+    },
+)
+
+# Matchers alive in this process, revisited by prepare_forked_worker
+_live_matchers = weakref.WeakSet()
+
+
+def prepare_forked_worker() -> bool:
+    """
+    Make the matchers inherited from a preloading server master usable in a
+    freshly forked worker
+
+    Background threads and SQLite connections do not survive a fork, so
+    they are reopened; the inherited model is verified and reloaded from
+    disk if it no longer works. The parallel scoring workers are forked
+    before any of those threads starts again.
+
+    Returns:
+        True when every matcher has a working model (or none is trained)
+    """
+    matchers = list(_live_matchers)
+    ready = True
+    for matcher in matchers:
+        ready = matcher.verify_model() and ready
+
+    if matchers:
+        matchers[0].start_parallel_workers()
+
+    for matcher in matchers:
+        matcher._reopen_after_fork()
+    return ready
+
+
+def uses_model_snapshot(method):
+    """Run a matcher entry point with one model snapshot pinned throughout"""
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._pinned_model():
+            return method(self, *args, **kwargs)
+
+    return wrapper
 
 
 class CandidateMatcher:
@@ -32,10 +196,7 @@ class CandidateMatcher:
     def __init__(self):
         """Initialize the candidate matcher with configuration"""
         self.config = AppConfig()
-        self.skills_vectorizer = None
-        self.text_vectorizer = None
-        self.is_trained = False
-        self.training_metadata = {}
+        self.vector_dtype = np.dtype(self.config.VECTOR_DTYPE)
 
         # Scoring weights from configuration
         self.weights = {
@@ -46,11 +207,128 @@ class CandidateMatcher:
             "text_similarity": self.config.WEIGHT_TEXT,
         }
 
+        # Vectorized job features reused across preview/shortlist calls and retries
+        self.job_feature_cache = JobFeatureCache(
+            max_entries=self.config.JOB_CACHE_MAX_ENTRIES,
+            ttl_seconds=self.config.JOB_CACHE_TTL_SECONDS,
+        )
+
+        # Resume vectors shared across jobs, enabled with ENABLE_CACHING
+        self.resume_vector_cache = (
+            ResumeVectorCache(max_bytes=self.config.RESUME_CACHE_MAX_BYTES)
+            if self.config.ENABLE_CACHING
+            else None
+        )
+
+        # Component scores of recent shortlist runs, for re-ranking with new weights
+        self.component_cache = ComponentMatrixCache(
+            max_entries=self.config.RERANK_CACHE_MAX_JOBS,
+            ttl_seconds=self.config.RERANK_CACHE_TTL_SECONDS,
+        )
+
+        # Memoized token streams per vectorizer, shared by every resume field
+        self._shared_analyzers = {}
+
+        # Snapshot pinned by the request running on each thread
+        self._pinned = threading.local()
+        self._cache_generation = None
+
         # Ensure model storage directory exists
         self._ensure_model_directory()
 
-        # Load any existing trained models
-        self._load_model_if_exists()
+        # Trained models, one directory per training run
+        self.model_store = ModelStore(
+            self.config.MODEL_STORAGE_PATH,
+            keep_versions=self.config.MODEL_KEEP_VERSIONS,
+        )
+
+        # Component scores written for the re-ranks of other workers, enabled
+        # with RERANK_CACHE_MAX_JOBS
+        self.component_store = (
+            ComponentMatrixStore(
+                self.config.MODEL_STORAGE_PATH,
+                max_entries=self.config.RERANK_CACHE_MAX_JOBS,
+                ttl_seconds=self.config.RERANK_CACHE_TTL_SECONDS,
+            )
+            if self._records_components()
+            else None
+        )
+
+        # Pairwise component scores persisted across restarts, enabled with
+        # ENABLE_SCORE_CACHE
+        self.score_cache = None
+        if self.config.ENABLE_SCORE_CACHE:
+            self.score_cache = self._open_score_cache()
+
+        # Trained models are loaded (and warmed up) once per process and
+        # shared by every matcher through the registry of the storage directory
+        self.registry = get_model_registry(
+            self.config.MODEL_STORAGE_PATH, self.vector_dtype.name
+        )
+        warm_up = self.warm_up if self.config.MODEL_WARM_UP else None
+        if self.config.MODEL_BACKGROUND_LOAD:
+            # Requests that need the model wait for it (wait_for_model)
+            self.registry.start_loading(self._load_model_if_exists, warm_up)
+        else:
+            self.registry.prepare(self._load_model_if_exists, warm_up)
+
+        _live_matchers.add(self)
+
+    @property
+    def model(self) -> ModelSnapshot:
+        """Model snapshot of the running request, else the current one"""
+        snapshot = getattr(self._pinned, "snapshot", None)
+        return snapshot if snapshot is not None else self.wait_for_model()
+
+    @property
+    def text_vectorizer(self):
+        return self.model.text_vectorizer
+
+    @property
+    def skills_vectorizer(self):
+        return self.model.skills_vectorizer
+
+    @property
+    def is_trained(self) -> bool:
+        return self.model.is_trained
+
+    @property
+    def training_metadata(self):
+        return self.model.training_metadata
+
+    def wait_for_model(self) -> ModelSnapshot:
+        """Current snapshot, once the first model load of the process is done"""
+        if not self.registry.loaded:
+            # Still loading on the background thread; load_once blocks until
+            # it finishes (or loads here if that thread failed)
+            self.registry.load_once(self._load_model_if_exists)
+        return self.registry.current()
+
+    @contextmanager
+    def _pinned_model(self):
+        """
+        Score the calling thread's request with one model snapshot
+
+        A retrain publishing a new snapshot mid-request does not change the
+        vectorizers (or cache fingerprints) the request is using. Nested
+        calls keep the outermost pin.
+        """
+        if getattr(self._pinned, "snapshot", None) is not None:
+            yield self._pinned.snapshot
+            return
+
+        self.sync_model_version()
+        snapshot = self.registry.current()
+        if snapshot.generation != self._cache_generation:
+            # Vectors of the previous model are no longer valid
+            self._clear_feature_caches()
+            self._cache_generation = snapshot.generation
+
+        self._pinned.snapshot = snapshot
+        try:
+            yield snapshot
+        finally:
+            self._pinned.snapshot = None
 
     def _ensure_model_directory(self):
         """Ensure the model storage directory exists with proper permissions"""
@@ -58,7 +336,10 @@ class CandidateMatcher:
             os.makedirs(self.config.MODEL_STORAGE_PATH, exist_ok=True)
 
             # Test write permissions by creating a test file
-            test_file = os.path.join(self.config.MODEL_STORAGE_PATH, ".test_write")
+            # Per process, so concurrently starting workers do not race on it
+            test_file = os.path.join(
+                self.config.MODEL_STORAGE_PATH, f".test_write.{os.getpid()}"
+            )
             with open(test_file, "w") as f:
                 f.write("test")
             os.remove(test_file)
@@ -80,7 +361,9 @@ class CandidateMatcher:
                 f"⚠️ Using fallback directory: {self.config.MODEL_STORAGE_PATH}"
             )
 
-    def train_model(self, training_data: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def train_model(
+        self, training_data: List[Dict[str, Any]], model_type: Optional[str] = None
+    ) -> Dict[str, Any]:
         """
         Train the AI model with historical job and application data
 
@@ -89,10 +372,22 @@ class CandidateMatcher:
 
         Args:
             training_data: List of dictionaries containing job and successful candidate data
+            model_type: "tfidf" (fitted vocabulary) or "hashing" (fixed-size
+                hashed features); defaults to MODEL_TYPE
 
         Returns:
             Dictionary with training results and model performance metrics
         """
+        model_type = (model_type or self.config.MODEL_TYPE).lower()
+        if model_type not in MODEL_TYPES:
+            raise AIModelError(
+                f"Unknown model type '{model_type}'. Use one of: {', '.join(MODEL_TYPES)}",
+                error_code="INVALID_MODEL_TYPE",
+            )
+
+        # A background load finishing later must not replace the new model
+        self.wait_for_model()
+
         try:
             logging.info("🎓 Starting AI model training...")
 
@@ -152,14 +447,15 @@ class CandidateMatcher:
                     error_code="INSUFFICIENT_TEXT_DATA",
                 )
 
-            self.text_vectorizer = TfidfVectorizer(
+            text_vectorizer = self._create_vectorizer(
+                model_type,
                 max_features=1000,  # Keep top 1000 most important words
                 stop_words="english",  # Remove common words like "the", "and"
                 ngram_range=(1, 2),  # Consider both single words and pairs
                 min_df=2,  # Word must appear in at least 2 documents
                 max_df=0.8,  # Ignore words that appear in 80%+ of documents
             )
-            self.text_vectorizer.fit(all_texts)
+            text_vectorizer.fit(all_texts)
 
             # Train the skills vectorizer (for technical skills matching)
             # This specializes in understanding technical terminology and skills
@@ -185,7 +481,8 @@ class CandidateMatcher:
                     "Leadership",
                 ]
 
-            self.skills_vectorizer = TfidfVectorizer(
+            skills_vectorizer = self._create_vectorizer(
+                model_type,
                 max_features=500,
                 stop_words="english",
                 ngram_range=(1, 3),  # Include technical phrases up to 3 words
@@ -195,22 +492,30 @@ class CandidateMatcher:
 
             # Create a comprehensive skills vocabulary from training data
             all_skills_text = " ".join(skills_data)
-            self.skills_vectorizer.fit([all_skills_text])
+            skills_vectorizer.fit([all_skills_text])
 
             # FIXED: Store training metadata
-            self.training_metadata = {
+            training_metadata = {
                 "model_version": self.config.MODEL_VERSION,
                 "training_samples": len(training_data),
                 "valid_samples": len(job_descriptions),
-                "vocabulary_size": len(self.text_vectorizer.vocabulary_),
-                "skills_vocabulary_size": len(self.skills_vectorizer.vocabulary_),
+                "model_type": model_type,
+                "vocabulary_size": self.vectorizer_feature_count(text_vectorizer),
+                "skills_vocabulary_size": self.vectorizer_feature_count(
+                    skills_vectorizer
+                ),
                 "training_timestamp": datetime.now(timezone.utc).isoformat(),
                 "weights": self.weights.copy(),
+                "vector_dtype": self.vector_dtype.name,
                 "status": "training_completed",
             }
 
             # FIXED: Save models with proper error handling BEFORE setting is_trained
-            save_success = self._save_model()
+            version_id = self.model_store.new_version_id()
+            training_metadata["version_id"] = version_id
+            save_success = self._save_model(
+                version_id, text_vectorizer, skills_vectorizer, training_metadata
+            )
 
             if not save_success:
                 raise AIModelError(
@@ -218,33 +523,73 @@ class CandidateMatcher:
                     error_code="MODEL_SAVE_FAILED",
                 )
 
-            # FIXED: Only set trained status after successful save
-            self.is_trained = True
+            # FIXED: Only publish the model after a successful save; every
+            # matcher in the process switches to it at once
+            snapshot = self._publish_saved_model(
+                version_id, text_vectorizer, skills_vectorizer, training_metadata
+            )
 
             logging.info(
                 f"✅ Model training completed successfully with {len(job_descriptions)} valid samples"
             )
 
-            return self.training_metadata
+            return dict(snapshot.training_metadata)
 
         except Exception as e:
+            # The previously published model keeps serving requests
             logging.error(f"❌ Model training failed: {str(e)}")
-            # FIXED: Reset training state on failure
-            self.is_trained = False
-            self.text_vectorizer = None
-            self.skills_vectorizer = None
-            self.training_metadata = {}
 
             raise AIModelError(
                 f"Failed to train AI model: {str(e)}", error_code="TRAINING_FAILED"
             )
 
-    def _save_model(self) -> bool:
+    def _create_vectorizer(self, model_type: str, max_features: int, **params):
+        """
+        Create an unfitted vectorizer of the given model type
+
+        The hashing model has no vocabulary to cap, so max_features only
+        applies to TF-IDF; its size is HASHING_N_FEATURES instead.
+        """
+        if model_type == "hashing":
+            return HashingTfidfVectorizer(
+                n_features=self.config.HASHING_N_FEATURES,
+                dtype=self.vector_dtype,
+                **params,
+            )
+        return TfidfVectorizer(
+            max_features=max_features, dtype=self.vector_dtype, **params
+        )
+
+    def vectorizer_feature_count(self, vectorizer) -> int:
+        """Number of features a fitted vectorizer can produce"""
+        if vectorizer is None:
+            return 0
+        if isinstance(vectorizer, (HashingTfidfVectorizer, MappedTfidfVectorizer)):
+            return vectorizer.feature_count
+        return len(vectorizer.vocabulary_)
+
+    @property
+    def model_type(self) -> str:
+        """Type of the loaded model ("tfidf" for models trained before hashing)"""
+        return self.model.model_type
+
+    def _save_model(
+        self,
+        version_id: str,
+        text_vectorizer,
+        skills_vectorizer,
+        training_metadata: Dict[str, Any],
+    ) -> bool:
         """
         Save trained model to disk for persistence
 
         FIXED: Better error handling and training state persistence
 
+        The model is written as a new version of the model store (into a
+        temporary directory renamed into place) and then made the active
+        version, so no reader ever sees a partially written model. TF-IDF
+        models are stored as memory-mappable arrays (MappedTfidfVectorizer).
+
         Returns:
             bool: True if save was successful, False otherwise
         """
@@ -252,47 +597,60 @@ class CandidateMatcher:
             # Ensure directory exists
             self._ensure_model_directory()
 
-            if not self.text_vectorizer or not self.skills_vectorizer:
+            if not text_vectorizer or not skills_vectorizer:
                 logging.error("❌ Cannot save model: vectorizers not trained")
                 return False
 
-            # Save vectorizers
-            text_path = os.path.join(
-                self.config.MODEL_STORAGE_PATH, "text_vectorizer.pkl"
-            )
-            skills_path = os.path.join(
-                self.config.MODEL_STORAGE_PATH, "skills_vectorizer.pkl"
-            )
+            def write_files(directory: str):
+                # Save vectorizers
+                model_files = {}
+                for name, vectorizer in (
+                    ("text_vectorizer", text_vectorizer),
+                    ("skills_vectorizer", skills_vectorizer),
+                ):
+                    if isinstance(vectorizer, TfidfVectorizer):
+                        vectorizer = MappedTfidfVectorizer.from_tfidf(vectorizer)
+
+                    # Parameters as JSON plus the model arrays as .npy
+                    params_file, *array_files = vectorizer.save(directory, name)
+                    model_files[name] = params_file
+                    for array_file in array_files:
+                        model_files[os.path.splitext(array_file)[0]] = array_file
+
+                # FIXED: Save training state and metadata to separate file
+                state_data = {
+                    "is_trained": True,
+                    "version_id": version_id,
+                    "model_type": training_metadata.get("model_type", "tfidf"),
+                    "artifact_format": "npy",
+                    "training_metadata": training_metadata,
+                    "model_files": model_files,
+                    "saved_timestamp": datetime.now(timezone.utc).isoformat(),
+                    "model_version": self.config.MODEL_VERSION,
+                }
 
-            joblib.dump(self.text_vectorizer, text_path)
-            joblib.dump(self.skills_vectorizer, skills_path)
+                state_path = os.path.join(directory, STATE_FILE)
+                with open(state_path, "w") as f:
+                    json.dump(state_data, f, indent=2)
 
-            # FIXED: Save training state and metadata to separate file
-            state_data = {
-                "is_trained": True,
-                "training_metadata": self.training_metadata,
-                "model_files": {
-                    "text_vectorizer": "text_vectorizer.pkl",
-                    "skills_vectorizer": "skills_vectorizer.pkl",
-                },
-                "saved_timestamp": datetime.now(timezone.utc).isoformat(),
-                "model_version": self.config.MODEL_VERSION,
-            }
+                # Verify files were actually saved
+                saved_paths = [
+                    os.path.join(directory, filename)
+                    for filename in model_files.values()
+                ]
+                if not all(os.path.exists(path) for path in saved_paths + [state_path]):
+                    raise IOError("some model files are missing")
 
-            state_path = os.path.join(
-                self.config.MODEL_STORAGE_PATH, "training_state.json"
-            )
-            with open(state_path, "w") as f:
-                json.dump(state_data, f, indent=2)
+            self.model_store.write_version(version_id, write_files)
+            self.model_store.activate(version_id)
+            # This worker publishes the model itself; no need to reload it
+            self.registry.source_mtime = self.model_store.pointer_mtime()
 
-            # Verify files were actually saved
-            if not all(
-                os.path.exists(path) for path in [text_path, skills_path, state_path]
-            ):
-                logging.error("❌ Model save verification failed: some files missing")
-                return False
+            pruned = self.model_store.prune()
+            if pruned:
+                logging.info(f"🧹 Removed {len(pruned)} old model versions")
 
-            logging.info("✅ Model and training state saved successfully")
+            logging.info(f"✅ Model version {version_id} saved and activated")
             return True
 
         except Exception as e:
@@ -304,19 +662,24 @@ class CandidateMatcher:
         Load previously trained model if available
 
         FIXED: More robust loading with proper state management
+
+        Loads the active version of the model store, or the model files kept
+        directly in MODEL_STORAGE_PATH by releases before versioning.
         """
         try:
-            # Check for training state file first
-            state_path = os.path.join(
-                self.config.MODEL_STORAGE_PATH, "training_state.json"
-            )
-            text_path = os.path.join(
-                self.config.MODEL_STORAGE_PATH, "text_vectorizer.pkl"
-            )
-            skills_path = os.path.join(
-                self.config.MODEL_STORAGE_PATH, "skills_vectorizer.pkl"
+            self.registry.source_mtime = self.model_store.pointer_mtime()
+            version_id = self.model_store.active_version()
+            model_dir = (
+                self.model_store.version_path(version_id)
+                if version_id
+                else self.config.MODEL_STORAGE_PATH
             )
 
+            # Check for training state file first
+            state_path = os.path.join(model_dir, STATE_FILE)
+            text_path = os.path.join(model_dir, "text_vectorizer.pkl")
+            skills_path = os.path.join(model_dir, "skills_vectorizer.pkl")
+
             # If no state file exists, try legacy loading
             if not os.path.exists(state_path):
                 logging.info(
@@ -330,61 +693,272 @@ class CandidateMatcher:
                     )
                     return
 
-            # Load training state
-            with open(state_path, "r") as f:
-                state_data = json.load(f)
-
-            # Verify state data integrity
-            if not state_data.get("is_trained", False):
-                logging.warning("⚠️ Training state indicates model is not trained")
-                return
-
-            # Verify model files exist
-            if not all(os.path.exists(path) for path in [text_path, skills_path]):
-                logging.warning("⚠️ Training state exists but model files are missing")
-                self._cleanup_incomplete_state()
-                return
-
-            # Load vectorizers
-            self.text_vectorizer = joblib.load(text_path)
-            self.skills_vectorizer = joblib.load(skills_path)
-
-            # Restore metadata
-            self.training_metadata = state_data.get("training_metadata", {})
-
-            # Verify loaded models are functional
-            if not self._verify_loaded_models():
-                logging.warning("⚠️ Loaded models failed verification")
+            loaded = self._read_model(model_dir)
+            if loaded is None:
                 self._cleanup_incomplete_state()
                 return
 
-            # FIXED: Only set trained status after everything loads successfully
-            self.is_trained = True
+            # FIXED: Only publish the model after everything loads successfully
+            snapshot = self.registry.publish(*loaded)
 
-            trained_time = self.training_metadata.get("training_timestamp", "Unknown")
-            sample_count = self.training_metadata.get("valid_samples", "Unknown")
+            trained_time = snapshot.training_metadata.get(
+                "training_timestamp", "Unknown"
+            )
+            sample_count = snapshot.training_metadata.get("valid_samples", "Unknown")
 
             logging.info(
-                f"✅ Pre-trained model loaded successfully (trained: {trained_time}, samples: {sample_count})"
+                f"✅ Pre-trained model loaded successfully (version: {version_id or 'unversioned'}, trained: {trained_time}, samples: {sample_count})"
             )
 
         except Exception as e:
             logging.warning(f"⚠️ Could not load existing model: {str(e)}")
             self._cleanup_incomplete_state()
 
-    def _load_legacy_model(self, text_path: str, skills_path: str) -> bool:
-        """Load model files without state file (backward compatibility)"""
+    def _read_model(self, model_dir: str) -> Optional[Tuple[Any, Any, Dict[str, Any]]]:
+        """
+        Load and verify the model described by the training state in model_dir
+
+        Returns:
+            (text vectorizer, skills vectorizer, training metadata), or None
+            when the model is incomplete or fails verification
+        """
+        with open(os.path.join(model_dir, STATE_FILE), "r") as f:
+            state_data = json.load(f)
+
+        # Verify state data integrity
+        if not state_data.get("is_trained", False):
+            logging.warning("⚠️ Training state indicates model is not trained")
+            return None
+
+        # Verify model files exist
+        model_type = state_data.get("model_type", "tfidf")
+        model_files = state_data.get(
+            "model_files",
+            {
+                "text_vectorizer": "text_vectorizer.pkl",
+                "skills_vectorizer": "skills_vectorizer.pkl",
+            },
+        )
+        if not all(
+            os.path.exists(os.path.join(model_dir, filename))
+            for filename in model_files.values()
+        ):
+            logging.warning("⚠️ Training state exists but model files are missing")
+            return None
+
+        # Load vectorizers
+        text_vectorizer, skills_vectorizer = (
+            self._load_vectorizer(model_dir, name, model_type, model_files[name])
+            for name in ("text_vectorizer", "skills_vectorizer")
+        )
+        self._apply_vector_dtype(text_vectorizer, skills_vectorizer)
+
+        # Restore metadata
+        training_metadata = state_data.get("training_metadata", {})
+        training_metadata.setdefault("model_type", model_type)
+        if state_data.get("version_id"):
+            training_metadata.setdefault("version_id", state_data["version_id"])
+
+        # Verify loaded models are functional
+        if not self._verify_loaded_models(text_vectorizer, skills_vectorizer):
+            logging.warning("⚠️ Loaded models failed verification")
+            return None
+
+        return text_vectorizer, skills_vectorizer, training_metadata
+
+    def _load_vectorizer(
+        self, model_dir: str, name: str, model_type: str, filename: str
+    ):
+        """
+        Load one vectorizer in the format it was saved in
+
+        Array formats are memory-mapped (MODEL_MMAP), so every worker shares
+        the page cache instead of unpickling its own copy.
+        """
+        if filename.endswith(".pkl"):
+            return joblib.load(os.path.join(model_dir, filename))
+        if model_type == "hashing":
+            return HashingTfidfVectorizer.load(
+                model_dir, name, mmap=self.config.MODEL_MMAP
+            )
+        return MappedTfidfVectorizer.load(model_dir, name, mmap=self.config.MODEL_MMAP)
+
+    def _publish_saved_model(
+        self,
+        version_id: str,
+        text_vectorizer,
+        skills_vectorizer,
+        training_metadata: Dict[str, Any],
+    ) -> ModelSnapshot:
+        """
+        Publish a just-saved version as every other worker will load it
+
+        The saved (memory-mapped) files are read back; the in-memory
+        vectorizers are published if that fails.
+        """
         try:
-            self.text_vectorizer = joblib.load(text_path)
-            self.skills_vectorizer = joblib.load(skills_path)
+            loaded = self._read_model(self.model_store.version_path(version_id))
+        except Exception as e:
+            loaded = None
+            logging.warning(f"⚠️ Could not reload saved model: {str(e)}")
 
-            if self._verify_loaded_models():
-                self.is_trained = True
-                self.training_metadata = {
-                    "model_version": self.config.MODEL_VERSION,
-                    "status": "legacy_model_loaded",
-                    "loaded_timestamp": datetime.now(timezone.utc).isoformat(),
+        if loaded is None:
+            return self.registry.publish(
+                text_vectorizer, skills_vectorizer, training_metadata
+            )
+        return self.registry.publish(*loaded)
+
+    def export_model(self) -> Dict[str, Any]:
+        """
+        Store the loaded model as a new version in the memory-mappable format
+
+        Converts models saved as pickles (unversioned or by older releases)
+        without retraining; the vectors do not change.
+
+        Returns:
+            Training metadata of the new active version
+        """
+        with self._pinned_model() as snapshot:
+            if not snapshot.is_trained:
+                raise AIModelError(
+                    "No trained model to export", error_code="MODEL_NOT_TRAINED"
+                )
+
+            version_id = self.model_store.new_version_id()
+            training_metadata = dict(snapshot.training_metadata)
+            training_metadata.update(
+                {
+                    "version_id": version_id,
+                    "exported_from": snapshot.training_metadata.get("version_id"),
+                    "exported_timestamp": datetime.now(timezone.utc).isoformat(),
                 }
+            )
+
+            if not self._save_model(
+                version_id,
+                snapshot.text_vectorizer,
+                snapshot.skills_vectorizer,
+                training_metadata,
+            ):
+                raise AIModelError(
+                    "Failed to export model", error_code="MODEL_EXPORT_FAILED"
+                )
+
+        published = self._publish_saved_model(
+            version_id,
+            snapshot.text_vectorizer,
+            snapshot.skills_vectorizer,
+            training_metadata,
+        )
+        return dict(published.training_metadata)
+
+    def sync_model_version(self):
+        """
+        Switch to the model version activated by another worker, if any
+
+        Costs one stat of the version pointer when nothing changed.
+        """
+        self.wait_for_model()
+        self.registry.refresh(
+            self.model_store.pointer_mtime(), self._load_active_version
+        )
+
+    def _load_active_version(self):
+        """Load the active version unless it is already published"""
+        version_id = self.model_store.active_version()
+        if (
+            not version_id
+            or version_id == self.registry.current().training_metadata.get("version_id")
+        ):
+            return
+
+        try:
+            loaded = self._read_model(self.model_store.version_path(version_id))
+        except Exception as e:
+            loaded = None
+            logging.warning(f"⚠️ Could not load model version {version_id}: {str(e)}")
+
+        if loaded is None:
+            # The published model keeps serving requests
+            logging.warning(
+                f"⚠️ Keeping current model, version {version_id} is unusable"
+            )
+            return
+
+        self.registry.publish(*loaded)
+        logging.info(f"🔄 Switched to model version {version_id}")
+
+    def list_model_versions(self) -> List[Dict[str, Any]]:
+        """Stored model versions, newest first"""
+        return self.model_store.list_versions()
+
+    def activate_model_version(self, version_id: str) -> Dict[str, Any]:
+        """
+        Serve a stored model version without retraining
+
+        The version is loaded and verified before it becomes active, so a
+        broken version never replaces the model in use.
+
+        Returns:
+            Training metadata of the activated version
+        """
+        self.wait_for_model()
+        if not self.model_store.has_version(version_id):
+            raise AIModelError(
+                f"Model version {version_id} not found",
+                error_code="MODEL_VERSION_NOT_FOUND",
+            )
+
+        loaded = self._read_model(self.model_store.version_path(version_id))
+        if loaded is None:
+            raise AIModelError(
+                f"Model version {version_id} failed to load",
+                error_code="MODEL_VERSION_INVALID",
+            )
+
+        self.model_store.activate(version_id)
+        self.registry.source_mtime = self.model_store.pointer_mtime()
+        snapshot = self.registry.publish(*loaded)
+
+        logging.info(f"✅ Activated model version {version_id}")
+        return dict(snapshot.training_metadata)
+
+    def rollback_model(self) -> Dict[str, Any]:
+        """
+        Re-activate the version that was active before the current one
+
+        Returns:
+            Training metadata of the restored version
+        """
+        pointer = self.model_store.read_pointer() or {}
+        previous = pointer.get("previous")
+        if not previous:
+            raise AIModelError(
+                "No previous model version to roll back to",
+                error_code="NO_PREVIOUS_MODEL_VERSION",
+            )
+        return self.activate_model_version(previous)
+
+    def _load_legacy_model(self, text_path: str, skills_path: str) -> bool:
+        """Load model files without state file (backward compatibility)"""
+        try:
+            text_vectorizer = joblib.load(text_path)
+            skills_vectorizer = joblib.load(skills_path)
+            self._apply_vector_dtype(text_vectorizer, skills_vectorizer)
+
+            if self._verify_loaded_models(text_vectorizer, skills_vectorizer):
+                self.registry.publish(
+                    text_vectorizer,
+                    skills_vectorizer,
+                    {
+                        "model_version": self.config.MODEL_VERSION,
+                        "status": "legacy_model_loaded",
+                        "loaded_timestamp": datetime.now(timezone.utc).isoformat(),
+                        # Legacy files carry no training timestamp; their
+                        # contents identify the model across restarts
+                        "model_files_hash": files_hash(text_path, skills_path),
+                    },
+                )
                 logging.info("✅ Legacy model loaded successfully")
                 return True
             else:
@@ -394,10 +968,24 @@ class CandidateMatcher:
             logging.warning(f"⚠️ Failed to load legacy model: {str(e)}")
             return False
 
-    def _verify_loaded_models(self) -> bool:
+    def _apply_vector_dtype(self, *vectorizers):
+        """
+        Make loaded vectorizers count in VECTOR_DTYPE
+
+        Models trained in the other precision keep their vocabulary (or hashed
+        feature space) and their idf weights as stored, so memory-mapped
+        arrays stay shared by every worker and an export writes them back
+        unchanged. Only the count dtype is switched; each transformed matrix
+        is converted to VECTOR_DTYPE by _normalized_transform.
+        """
+        for vectorizer in vectorizers:
+            if vectorizer.dtype != self.vector_dtype:
+                vectorizer.dtype = self.vector_dtype
+
+    def _verify_loaded_models(self, text_vectorizer, skills_vectorizer) -> bool:
         """Verify that loaded models are functional"""
         try:
-            if not self.text_vectorizer or not self.skills_vectorizer:
+            if not text_vectorizer or not skills_vectorizer:
                 return False
 
             # Test vectorizers with sample data
@@ -405,12 +993,12 @@ class CandidateMatcher:
             test_skills = "Python JavaScript React"
 
             # Test text vectorizer
-            text_vector = self.text_vectorizer.transform([test_text])
+            text_vector = text_vectorizer.transform([test_text])
             if text_vector.shape[0] != 1:
                 return False
 
             # Test skills vectorizer
-            skills_vector = self.skills_vectorizer.transform([test_skills])
+            skills_vector = skills_vectorizer.transform([test_skills])
             if skills_vector.shape[0] != 1:
                 return False
 
@@ -422,15 +1010,17 @@ class CandidateMatcher:
 
     def _cleanup_incomplete_state(self):
         """Clean up incomplete or corrupted model state"""
-        self.is_trained = False
-        self.text_vectorizer = None
-        self.skills_vectorizer = None
-        self.training_metadata = {}
+        self.registry.clear()
+        self._clear_feature_caches()
 
         logging.info("🧹 Cleaned up incomplete model state")
 
+    @uses_model_snapshot
     def shortlist_candidates(
-        self, job_data: Dict[str, Any], applications: List[Dict[str, Any]]
+        self,
+        job_data: Dict[str, Any],
+        applications: List[Dict[str, Any]],
+        stats: Optional[Dict[str, Any]] = None,
     ) -> List[Dict[str, Any]]:
         """
         Shortlist top candidates for a given job
@@ -441,6 +1031,8 @@ class CandidateMatcher:
         Args:
             job_data: Dictionary containing job description and requirements
             applications: List of applications with candidate data and resumes
+            stats: Optional dictionary filled with the selection statistics
+                (filtered and pruned counts, per-stage timings)
 
         Returns:
             List of top candidates with their matching scores and explanations
@@ -450,42 +1042,13 @@ class CandidateMatcher:
                 f"🎯 Starting candidate shortlisting for job: {job_data.get('title', 'Unknown')}"
             )
 
-            if not self.is_trained:
-                raise AIModelError(
-                    "AI model is not trained yet. Please train the model first.",
-                    error_code="MODEL_NOT_TRAINED",
-                )
-
-            # FIXED: Additional verification that models are actually loaded
-            if not self.text_vectorizer or not self.skills_vectorizer:
-                raise AIModelError(
-                    "AI model components are missing. Please retrain the model.",
-                    error_code="MODEL_COMPONENTS_MISSING",
-                )
+            self._ensure_ready_for_scoring()
 
             if not applications:
                 return []
 
-            # Score each candidate against the job requirements
-            candidate_scores = []
-
-            for application in applications:
-                try:
-                    score_result = self._calculate_candidate_score(
-                        job_data, application
-                    )
-                    candidate_scores.append(score_result)
-                except Exception as e:
-                    logging.warning(
-                        f"⚠️ Failed to score candidate {application.get('candidateId', 'Unknown')}: {str(e)}"
-                    )
-                    continue
-
-            # Sort candidates by total score (highest first)
-            candidate_scores.sort(key=lambda x: x["total_score"], reverse=True)
-
-            # Return top candidates with detailed scoring information
-            top_candidates = candidate_scores[: self.config.MAX_CANDIDATES]
+            # Score the pool chunk by chunk, keeping only the running top-K
+            top_candidates = self._shortlist_top_k(job_data, applications, stats)
 
             logging.info(
                 f"✅ Shortlisted {len(top_candidates)} candidates from {len(applications)} applications"
@@ -500,91 +1063,1821 @@ class CandidateMatcher:
                 error_code="SHORTLISTING_FAILED",
             )
 
-    def _calculate_candidate_score(
-        self, job_data: Dict[str, Any], application: Dict[str, Any]
-    ) -> Dict[str, Any]:
+    @uses_model_snapshot
+    def shortlist_candidates_stream(
+        self,
+        job_data: Dict[str, Any],
+        applications: Iterable[Dict[str, Any]],
+        stats: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
         """
-        Calculate comprehensive matching score for a single candidate
+        Shortlist top candidates from applications that arrive as a stream
 
-        This function breaks down the evaluation into multiple components,
-        just like how a human recruiter would systematically evaluate a resume.
+        Applications are consumed chunk by chunk and only the running top-K is
+        kept, so the whole pool never has to be in memory at once.
 
         Args:
-            job_data: Job information and requirements
-            application: Application with candidate and resume data
+            job_data: Dictionary containing job description and requirements
+            applications: Iterable of applications, e.g. parsed NDJSON lines
+            stats: Optional dictionary filled with the selection statistics
 
         Returns:
-            Dictionary with detailed scoring breakdown and reasoning
+            List of top candidates with their matching scores and explanations
         """
-        candidate = application.get("candidate", {})
-        resume = application.get("resume", {})
+        try:
+            logging.info(
+                f"🎯 Starting streamed candidate shortlisting for job: {job_data.get('title', 'Unknown')}"
+            )
 
-        # Extract and clean text data for analysis
-        job_text = self._prepare_job_text(job_data)
-        candidate_text = self._prepare_candidate_text(resume)
+            self._ensure_ready_for_scoring()
 
-        # Calculate individual score components
-        scores = {}
+            # Never recorded for re-ranking: that would keep a row per streamed
+            # application and defeat the bounded memory of streaming
+            selector = self._select_top_k(job_data, applications, 0, None)
+            top_candidates = self._build_results(job_data, selector)
+            self._report_selection_stats(selector, stats)
 
-        # 1. Skills Matching (Most Important - configurable%)
-        scores["skills_match"] = self._calculate_skills_match(
-            job_data.get("requirements", ""), resume.get("skills", [])
-        )
+            logging.info(
+                f"✅ Shortlisted {len(top_candidates)} candidates from {selector.seen} streamed applications"
+            )
 
-        # 2. Experience Relevance (Very Important - configurable%)
-        scores["experience_relevance"] = self._calculate_experience_relevance(
-            job_text, resume.get("experience", "")
-        )
+            return top_candidates
 
-        # 3. Education Alignment (Important - configurable%)
-        scores["education_alignment"] = self._calculate_education_alignment(
-            job_data.get("requirements", ""), resume.get("education", "")
-        )
+        except Exception as e:
+            logging.error(f"❌ Streamed candidate shortlisting failed: {str(e)}")
+            raise AIModelError(
+                f"Failed to shortlist candidates: {str(e)}",
+                error_code="SHORTLISTING_FAILED",
+            )
 
-        # 4. Industry Experience (Helpful - configurable%)
-        scores["industry_experience"] = self._calculate_industry_match(
-            job_data.get("category", ""),
-            resume.get("industry", ""),
-            resume.get("company", ""),
-        )
+    @uses_model_snapshot
+    def shortlist_candidates_batch(
+        self,
+        job_batches: List[Tuple[Dict[str, Any], List[Dict[str, Any]]]],
+        stats: Optional[List[Dict[str, Any]]] = None,
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Shortlist top candidates for several jobs in one pass
 
-        # 5. Overall Text Similarity (Context - configurable%)
-        scores["text_similarity"] = self._calculate_text_similarity(
-            job_text, candidate_text
-        )
+        Every distinct resume across all jobs is vectorized once, and each
+        similarity component is computed for all resumes against all jobs
+        with a single sparse matrix product (resumes x jobs). Each job then
+        takes the rows of its own applicants and keeps its own top-K.
 
-        # Calculate weighted total score
-        total_score = sum(scores[key] * self.weights[key] for key in scores)
+        Args:
+            job_batches: List of (job_data, applications) pairs
+            stats: Optional list extended with the selection statistics of
+                each job, in the order of job_batches
 
-        # Generate human-readable explanation of the match
-        explanation = self._generate_match_explanation(scores, job_data["title"])
+        Returns:
+            List with the top candidates of each job, in the order of job_batches
+        """
+        try:
+            logging.info(f"🎯 Starting batch shortlisting for {len(job_batches)} jobs")
 
-        return {
-            "application_id": application["id"],
-            "candidate_id": application["candidateId"],
-            "candidate_name": f"{candidate.get('firstName', '')} {candidate.get('lastName', '')}".strip(),
-            "total_score": round(total_score, 3),
-            "score_breakdown": {key: round(value, 3) for key, value in scores.items()},
-            "match_explanation": explanation,
-            "recommendation_strength": self._get_recommendation_strength(total_score),
-        }
+            self._ensure_ready_for_scoring()
 
-    def _calculate_education_alignment(
-        self, job_requirements: str, education: str
-    ) -> float:
-        """
-        Evaluate how well the candidate's education matches job requirements
+            if not job_batches:
+                return []
 
-        This considers both the level of education and the relevance of the field of study.
-        For example, a Computer Science degree would score higher for a software development role.
+            selectors = [
+                TopKSelector(self.config.MAX_CANDIDATES, len(SCORE_COMPONENTS))
+                for _ in job_batches
+            ]
+
+            # Map every application kept by the prefilter to a distinct resume
+            resume_index = {}
+            unique_resumes = []
+            application_positions = []
+            application_rows = []
+
+            for selector, (job_data, applications) in zip(selectors, job_batches):
+                positions = np.arange(len(applications))
+                if self.config.ENABLE_PREFILTER and applications:
+                    started = time.perf_counter()
+                    positions = self._prefilter_chunk(job_data, applications)
+                    selector.timings["prefilter"] += time.perf_counter() - started
+                    selector.skip(len(applications) - len(positions), "filtered")
+
+                rows = []
+                for position in positions:
+                    resume_hash = resume_content_hash(
+                        applications[position].get("resume") or {}
+                    )
+                    if resume_hash not in resume_index:
+                        resume_index[resume_hash] = len(unique_resumes)
+                        unique_resumes.append(
+                            applications[position].get("resume") or {}
+                        )
+                    rows.append(resume_index[resume_hash])
+                application_positions.append(positions)
+                application_rows.append(np.array(rows, dtype=np.int64))
+                selector.counts["unique_resumes"] += len(set(rows))
+                selector.counts["duplicates"] += len(rows) - len(set(rows))
+
+            job_features = [self._get_job_features(job) for job, _ in job_batches]
+            if unique_resumes:
+                similarity_matrices = self._similarity_matrices(
+                    job_features, self._vectorize_resumes(unique_resumes)
+                )
+
+            results = []
+            for job_idx, (job_data, applications) in enumerate(job_batches):
+                rows = application_rows[job_idx]
+                positions = application_positions[job_idx]
+                selector = selectors[job_idx]
+                recorded = [] if self._records_components() else None
+
+                if len(rows):
+                    components = self._combine_components(
+                        job_data,
+                        job_features[job_idx],
+                        [unique_resumes[row] for row in rows],
+                        similarity_matrices["has_text"][rows],
+                        {
+                            field: matrix[rows, job_idx]
+                            for field, matrix in similarity_matrices.items()
+                            if field != "has_text"
+                        },
+                    )
+                    selector.push(
+                        self._weighted_totals(components),
+                        components,
+                        [applications[position] for position in positions],
+                        positions,
+                    )
+                    if recorded is not None:
+                        recorded.append(
+                            (
+                                components,
+                                positions,
+                                [
+                                    self._application_record(applications[position])
+                                    for position in positions
+                                ],
+                            )
+                        )
+
+                results.append(self._build_results(job_data, selector))
+                self._store_component_matrix(job_data, recorded)
+                if stats is not None:
+                    job_stats = {}
+                    self._report_selection_stats(selector, job_stats)
+                    stats.append(job_stats)
+
+            logging.info(
+                f"✅ Batch shortlisted {len(job_batches)} jobs using {len(unique_resumes)} unique resumes"
+            )
+
+            return results
+
+        except Exception as e:
+            logging.error(f"❌ Batch candidate shortlisting failed: {str(e)}")
+            raise AIModelError(
+                f"Failed to shortlist candidates: {str(e)}",
+                error_code="SHORTLISTING_FAILED",
+            )
+
+    @uses_model_snapshot
+    def index_jobs(self, jobs: List[Dict[str, Any]], job_index: JobIndex) -> int:
         """
-        if not education or not job_requirements:
-            return 0.5  # Neutral score when information is missing
+        Vectorize open jobs and add them to the job index
 
-        education_lower = education.lower()
-        requirements_lower = job_requirements.lower()
+        Args:
+            jobs: Job data of the jobs to add or update
+            job_index: Index of open jobs
 
-        # Define education level scoring
+        Returns:
+            Number of jobs in the index after the update
+        """
+        self._ensure_ready_for_scoring()
+
+        try:
+            job_index.upsert(jobs, self._get_job_features, self._model_fingerprint())
+            return len(job_index)
+
+        except Exception as e:
+            logging.error(f"❌ Indexing open jobs failed: {str(e)}")
+            raise AIModelError(
+                f"Failed to index open jobs: {str(e)}",
+                error_code="JOB_INDEXING_FAILED",
+            )
+
+    def remove_indexed_job(self, job_id: str, job_index: JobIndex) -> Optional[int]:
+        """
+        Remove a job from the job index
+
+        Only the stored jobs are edited, so this neither needs a trained
+        model nor waits for one to load; other workers drop the job on their
+        next sync.
+
+        Returns:
+            Number of jobs left in the index, or None if the job was not indexed
+        """
+        return job_index.remove(job_id)
+
+    @uses_model_snapshot
+    def match_jobs_for_candidate(
+        self, resume: Dict[str, Any], job_index: JobIndex, limit: int
+    ) -> List[Dict[str, Any]]:
+        """
+        Find the open jobs that best fit a candidate's resume
+
+        The inverted job index proposes the jobs sharing the most weighted
+        vocabulary with the resume (every job when too few share any); only
+        those are scored with the full multi-factor model and ranked.
+
+        Args:
+            resume: Candidate resume data
+            job_index: Index of open jobs
+            limit: Number of jobs to return
+
+        Returns:
+            List of best matching jobs with their scores, best first
+        """
+        try:
+            self._ensure_ready_for_scoring()
+
+            job_index.sync(self._get_job_features, self._model_fingerprint())
+            if len(job_index) == 0:
+                return []
+
+            resume_features = self._vectorize_resumes([resume])
+
+            # Weight each field by how much its similarity can add to the total
+            query = [
+                (
+                    "job_text_vector",
+                    resume_features["experience"],
+                    self.weights["experience_relevance"],
+                ),
+                (
+                    "requirements_text_vector",
+                    resume_features["education"],
+                    self.weights["education_alignment"] * 0.7,
+                ),
+                (
+                    "requirements_skills_vector",
+                    resume_features["skills"],
+                    self.weights["skills_match"] * 0.4,
+                ),
+                (
+                    "job_text_vector",
+                    resume_features["combined"],
+                    self.weights["text_similarity"],
+                ),
+            ]
+            candidate_ids = job_index.candidate_jobs(
+                query, max(limit * JOB_MATCH_CANDIDATE_FACTOR, 50)
+            )
+            candidates = [
+                indexed
+                for indexed in (job_index.get(job_id) for job_id in candidate_ids)
+                if indexed is not None
+            ]
+            if not candidates:
+                return []
+
+            similarity_matrices = self._similarity_matrices(
+                [job_features for _, job_features in candidates], resume_features
+            )
+
+            components = np.vstack(
+                [
+                    self._combine_components(
+                        job_data,
+                        job_features,
+                        [resume],
+                        similarity_matrices["has_text"],
+                        {
+                            field: matrix[:, job_idx]
+                            for field, matrix in similarity_matrices.items()
+                            if field != "has_text"
+                        },
+                    )
+                    for job_idx, (job_data, job_features) in enumerate(candidates)
+                ]
+            )
+            totals = self._weighted_totals(components)
+
+            selector = TopKSelector(limit, len(SCORE_COMPONENTS))
+            selector.push(totals, components, candidates, np.arange(len(candidates)))
+
+            return [
+                self._build_job_match_result(
+                    job_data,
+                    dict(zip(SCORE_COMPONENTS, job_components.tolist())),
+                    total_score,
+                )
+                for total_score, job_components, (job_data, _) in selector.results()
+            ]
+
+        except Exception as e:
+            logging.error(f"❌ Job matching for candidate failed: {str(e)}")
+            raise AIModelError(
+                f"Failed to match jobs for candidate: {str(e)}",
+                error_code="JOB_MATCHING_FAILED",
+            )
+
+    @uses_model_snapshot
+    def add_to_talent_pool(
+        self, applications: List[Dict[str, Any]], talent_pool: TalentPoolIndex
+    ) -> int:
+        """
+        Vectorize applications and store them in the persistent talent pool
+
+        Args:
+            applications: Applications with candidate and resume data
+            talent_pool: Talent pool index to append to
+
+        Returns:
+            Number of applications in the talent pool after the append
+        """
+        try:
+            self._ensure_ready_for_scoring()
+
+            return talent_pool.append(
+                applications, self._transform_resumes, self._model_fingerprint()
+            )
+
+        except Exception as e:
+            logging.error(f"❌ Adding applications to the talent pool failed: {str(e)}")
+            raise AIModelError(
+                f"Failed to add applications to the talent pool: {str(e)}",
+                error_code="TALENT_POOL_APPEND_FAILED",
+            )
+
+    @uses_model_snapshot
+    def shortlist_from_talent_pool(
+        self,
+        job_data: Dict[str, Any],
+        talent_pool: TalentPoolIndex,
+        stats: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Shortlist top candidates for a job from the stored talent pool
+
+        Resume vectors are read from the pool, so only the job is vectorized;
+        each block is scored with one sparse product per resume field.
+
+        Args:
+            job_data: Dictionary containing job description and requirements
+            talent_pool: Talent pool index to search
+            stats: Optional dictionary filled with the selection statistics
+
+        Returns:
+            List of top candidates with their matching scores and explanations
+        """
+        try:
+            logging.info(
+                f"🎯 Starting talent pool search for job: {job_data.get('title', 'Unknown')}"
+            )
+
+            self._ensure_ready_for_scoring()
+
+            talent_pool.sync(self._transform_resumes, self._model_fingerprint())
+            job_features = self._get_job_features(job_data)
+            selector = TopKSelector(self.config.MAX_CANDIDATES, len(SCORE_COMPONENTS))
+
+            for records, resume_features, live, offset in talent_pool.blocks():
+                rows = np.flatnonzero(live)
+                if self.config.ENABLE_PREFILTER and len(rows):
+                    started = time.perf_counter()
+                    kept = self._prefilter_chunk(
+                        job_data, [records[row] for row in rows]
+                    )
+                    selector.timings["prefilter"] += time.perf_counter() - started
+                    selector.skip(len(rows) - len(kept), "filtered")
+                    rows = rows[kept]
+                if not len(rows):
+                    continue
+
+                similarities = self._job_similarities(job_features, resume_features)
+                components = self._combine_components(
+                    job_data,
+                    job_features,
+                    [records[row].get("resume") or {} for row in rows],
+                    resume_features["has_text"][rows],
+                    {field: values[rows] for field, values in similarities.items()},
+                )
+                selector.push(
+                    self._weighted_totals(components),
+                    components,
+                    [records[row] for row in rows],
+                    offset + rows,
+                )
+
+            top_candidates = self._build_results(job_data, selector)
+            self._report_selection_stats(selector, stats)
+
+            logging.info(
+                f"✅ Shortlisted {len(top_candidates)} candidates from {len(talent_pool)} talent pool applications"
+            )
+
+            return top_candidates
+
+        except Exception as e:
+            logging.error(f"❌ Talent pool search failed: {str(e)}")
+            raise AIModelError(
+                f"Failed to search the talent pool: {str(e)}",
+                error_code="TALENT_POOL_SEARCH_FAILED",
+            )
+
+    @uses_model_snapshot
+    def explain_candidate(
+        self, job_data: Dict[str, Any], application: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Explain the score of a single application in full detail
+
+        Scores the application exactly like shortlisting does and adds the
+        weighted contribution of every component and the skills analysis
+        behind the skills score.
+
+        Args:
+            job_data: Dictionary containing job description and requirements
+            application: Application with candidate and resume data
+
+        Returns:
+            The candidate result with its full score breakdown
+        """
+        try:
+            self._ensure_ready_for_scoring()
+
+            components, scored = self._score_chunk(job_data, [application])
+            if not scored[0]:
+                raise AIModelError(
+                    "Application could not be scored", error_code="SCORING_FAILED"
+                )
+
+            scores = dict(zip(SCORE_COMPONENTS, components[0].tolist()))
+            total_score = float(self._weighted_totals(components)[0])
+
+            resume = application.get("resume") or {}
+            requirements = job_data.get("requirements", "") or ""
+            normalized_skills = self._normalize_skills(resume.get("skills", []))
+            matched_skills = SkillAutomaton(normalized_skills).find_all(
+                requirements.lower()
+            )
+
+            result = self._build_candidate_result(
+                job_data, application, scores, total_score
+            )
+            result["weights"] = self.weights
+            result["weighted_scores"] = {
+                key: float(np.round(value * self.weights[key], 3))
+                for key, value in scores.items()
+            }
+            result["skills_analysis"] = {
+                "matched_skills": [
+                    skill for skill in normalized_skills if skill in matched_skills
+                ],
+                "unmatched_skills": [
+                    skill for skill in normalized_skills if skill not in matched_skills
+                ],
+                "high_demand_skills": [
+                    skill
+                    for skill in normalized_skills
+                    if skill in matched_skills and skill in HIGH_DEMAND_SKILLS
+                ],
+            }
+            result["education_level_score"] = (
+                self._education_level_score(resume["education"])
+                if resume.get("education")
+                else None
+            )
+
+            return result
+
+        except AIModelError:
+            raise
+        except Exception as e:
+            logging.error(f"❌ Candidate explanation failed: {str(e)}")
+            raise AIModelError(
+                f"Failed to explain candidate score: {str(e)}",
+                error_code="EXPLANATION_FAILED",
+            )
+
+    def _build_job_match_result(
+        self, job_data: Dict[str, Any], scores: Dict[str, float], total_score: float
+    ) -> Dict[str, Any]:
+        """
+        Build the API result for a job matched to a candidate
+        """
+        return {
+            "job_id": job_data["id"],
+            "job_title": job_data.get("title"),
+            "company": job_data.get("company"),
+            "category": job_data.get("category"),
+            "total_score": float(np.round(total_score, 3)),
+            "score_breakdown": {
+                key: float(np.round(value, 3)) for key, value in scores.items()
+            },
+            "recommendation_strength": self._get_recommendation_strength(total_score),
+        }
+
+    def _similarity_matrices(
+        self, job_features: List[Dict[str, Any]], resume_features: Dict[str, Any]
+    ) -> Dict[str, np.ndarray]:
+        """
+        Compute resumes x jobs similarity matrices for every vectorized field
+
+        Returns:
+            Dictionary of dense (n_resumes, n_jobs) similarity matrices plus the
+            has_text flag of each resume
+        """
+        job_text_vectors = sp.vstack(
+            [features["job_text_vector"] for features in job_features], format="csr"
+        )
+        requirements_text_vectors = sp.vstack(
+            [features["requirements_text_vector"] for features in job_features],
+            format="csr",
+        )
+        requirements_skills_vectors = sp.vstack(
+            [features["requirements_skills_vector"] for features in job_features],
+            format="csr",
+        )
+
+        return {
+            "experience": pairwise_similarity(
+                resume_features["experience"], job_text_vectors
+            ),
+            "education": pairwise_similarity(
+                resume_features["education"], requirements_text_vectors
+            ),
+            "skills": pairwise_similarity(
+                resume_features["skills"], requirements_skills_vectors
+            ),
+            "text": pairwise_similarity(resume_features["combined"], job_text_vectors),
+            "has_text": resume_features["has_text"],
+        }
+
+    def _ensure_ready_for_scoring(self):
+        """Raise an AIModelError unless a trained model is loaded"""
+        if not self.is_trained:
+            raise AIModelError(
+                "AI model is not trained yet. Please train the model first.",
+                error_code="MODEL_NOT_TRAINED",
+            )
+
+        # FIXED: Additional verification that models are actually loaded
+        if not self.text_vectorizer or not self.skills_vectorizer:
+            raise AIModelError(
+                "AI model components are missing. Please retrain the model.",
+                error_code="MODEL_COMPONENTS_MISSING",
+            )
+
+    def _shortlist_top_k(
+        self,
+        job_data: Dict[str, Any],
+        applications: List[Dict[str, Any]],
+        stats: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Score the applicant pool and build results for the top candidates only
+
+        Large pools are sharded across worker processes when parallel
+        shortlisting is enabled; otherwise the pool is scored in-process.
+        """
+        recorded = (
+            [] if self._records_components() and not self._is_warming_up() else None
+        )
+
+        selector = None
+        if self._use_parallel_scoring(len(applications)):
+            try:
+                selector = parallel_select_top_k(
+                    self,
+                    job_data,
+                    applications,
+                    self.config.SHORTLIST_WORKERS,
+                    recorded,
+                )
+            except Exception as e:
+                logging.warning(
+                    f"⚠️ Parallel shortlisting failed, scoring in-process: {str(e)}"
+                )
+                recorded = [] if recorded is not None else None
+
+        if selector is None:
+            selector = self._select_top_k(job_data, applications, 0, recorded)
+
+        top_candidates = self._build_results(job_data, selector)
+        self._report_selection_stats(selector, stats)
+        self._store_component_matrix(job_data, recorded)
+        return top_candidates
+
+    def _records_components(self) -> bool:
+        """Whether shortlist runs keep their component matrix for re-ranking"""
+        return self.config.RERANK_CACHE_MAX_JOBS > 0
+
+    def _application_record(self, application: Dict[str, Any]) -> Dict[str, Any]:
+        """Compact copy of an application with only what a result needs"""
+        candidate = application.get("candidate", {})
+        return {
+            "id": application["id"],
+            "candidateId": application["candidateId"],
+            "candidate": {
+                "firstName": candidate.get("firstName", ""),
+                "lastName": candidate.get("lastName", ""),
+            },
+        }
+
+    def _store_component_matrix(
+        self,
+        job_data: Dict[str, Any],
+        recorded: Optional[List[Tuple[np.ndarray, np.ndarray, List]]],
+    ):
+        """
+        Cache the component scores of a finished run, in submission order,
+        in memory and in the component store shared by every worker
+        """
+        if recorded is None:
+            return
+
+        components = np.vstack(
+            [np.empty((0, len(SCORE_COMPONENTS)))] + [rows for rows, _, _ in recorded]
+        )
+        positions = np.concatenate(
+            [np.empty(0, dtype=np.int64)] + [chunk for _, chunk, _ in recorded]
+        )
+        records = [record for _, _, chunk in recorded for record in chunk]
+        order = np.argsort(positions, kind="stable")
+
+        job_id = str(job_data.get("id"))
+        entry = {
+            "job": {"id": job_data.get("id"), "title": job_data["title"]},
+            "components": components[order],
+            "positions": positions[order],
+            "applications": [records[idx] for idx in order],
+            "model_fingerprint": self._model_fingerprint(),
+        }
+        self.component_cache.put(job_id, entry)
+        self.component_store.put(job_id, entry)
+
+    @uses_model_snapshot
+    def rerank_candidates(
+        self, job_id: str, weights: Dict[str, float]
+    ) -> List[Dict[str, Any]]:
+        """
+        Re-rank the last shortlist run of a job with different weights
+
+        Uses the cached component score matrix of the job, so the new totals
+        are a single matrix-vector product and nothing is re-vectorized.
+
+        Args:
+            job_id: Id of a job shortlisted recently
+            weights: Weight of every score component (summing to 1.0)
+
+        Returns:
+            List of top candidates under the new weights
+        """
+        if not self._records_components():
+            raise AIModelError(
+                "Re-ranking is disabled. Set RERANK_CACHE_MAX_JOBS to record shortlist scores.",
+                error_code="RERANK_DISABLED",
+            )
+
+        entry = self.component_cache.get(str(job_id))
+        if entry is None:
+            # Shortlisted by another worker (or before a restart)
+            entry = self.component_store.get(str(job_id))
+            if entry is not None:
+                self.component_cache.put(str(job_id), entry)
+        if entry is None or entry["model_fingerprint"] != self._model_fingerprint():
+            raise AIModelError(
+                f"No cached shortlist scores for job {job_id}. Shortlist the job first.",
+                error_code="RERANK_NOT_AVAILABLE",
+            )
+
+        try:
+            weight_vector = np.array([weights[key] for key in SCORE_COMPONENTS])
+            totals = entry["components"] @ weight_vector
+
+            selector = TopKSelector(self.config.MAX_CANDIDATES, len(SCORE_COMPONENTS))
+            selector.push(
+                totals,
+                entry["components"],
+                entry["applications"],
+                entry["positions"],
+            )
+
+            logging.info(
+                f"🔁 Re-ranked {len(totals)} candidates for job {job_id} with new weights"
+            )
+
+            return self._build_results(entry["job"], selector)
+
+        except Exception as e:
+            logging.error(f"❌ Candidate re-ranking failed: {str(e)}")
+            raise AIModelError(
+                f"Failed to re-rank candidates: {str(e)}",
+                error_code="RERANK_FAILED",
+            )
+
+    def _build_results(
+        self, job_data: Dict[str, Any], selector: TopKSelector
+    ) -> List[Dict[str, Any]]:
+        """Build the API results for the candidates kept by a selector"""
+        started = time.perf_counter()
+        results = [
+            self._build_candidate_result(
+                job_data,
+                application,
+                dict(zip(SCORE_COMPONENTS, components.tolist())),
+                total_score,
+            )
+            for total_score, components, application in selector.results()
+        ]
+        selector.timings["results"] += time.perf_counter() - started
+        return results
+
+    def _report_selection_stats(
+        self, selector: TopKSelector, stats: Optional[Dict[str, Any]]
+    ):
+        """Fill a caller's stats dictionary from a finished selection"""
+        if stats is None:
+            return
+
+        selection = selector.stats()
+        unique = selection["counts"].get("unique_resumes", 0)
+        duplicates = selection["counts"].get("duplicates", 0)
+        stats.update(
+            {
+                "prefilter_enabled": self.config.ENABLE_PREFILTER,
+                "min_similarity": self.config.MIN_SIMILARITY,
+                "filtered_count": selection["skipped"].get("filtered", 0),
+                "pruned_count": selection["skipped"].get("pruned", 0),
+                "unique_resumes": unique,
+                "duplicate_count": duplicates,
+                "deduplication_ratio": (
+                    round(duplicates / (unique + duplicates), 3)
+                    if unique + duplicates
+                    else 0.0
+                ),
+                "stage_timings": {
+                    f"{stage}_seconds": round(seconds, 4)
+                    for stage, seconds in selection["timings"].items()
+                },
+            }
+        )
+
+    def start_parallel_workers(self) -> bool:
+        """
+        Fork the worker processes of parallel shortlisting, if enabled
+
+        Must run while this process has a single thread; otherwise the
+        workers are forked on the first large shortlist if that is safe then.
+
+        Returns:
+            True when the workers are running
+        """
+        if self.config.SHORTLIST_WORKERS <= 1 or not fork_available():
+            return False
+        return start_worker_pool(self, self.config.SHORTLIST_WORKERS)
+
+    def _use_parallel_scoring(self, n_applications: int) -> bool:
+        """Whether a pool of this size should be sharded across worker processes"""
+        return (
+            self.config.SHORTLIST_WORKERS > 1
+            and n_applications >= self.config.PARALLEL_MIN_APPLICATIONS
+            and fork_available()
+        )
+
+    def _select_top_k(
+        self,
+        job_data: Dict[str, Any],
+        applications: Iterable[Dict[str, Any]],
+        position_offset: int = 0,
+        recorded: Optional[List[Tuple[np.ndarray, np.ndarray, List]]] = None,
+    ) -> TopKSelector:
+        """
+        Score applications in fixed-size chunks, keeping only the running top-K
+
+        Each chunk is scored in one vectorized pass and merged into a K-sized
+        selection, so peak memory grows with MAX_CANDIDATES and the chunk size
+        rather than with the number of applicants.
+
+        Args:
+            job_data: Job information and requirements
+            applications: Applications to score (a list or any iterable)
+            position_offset: Submission position of the first application,
+                used to break ties when shards are merged
+            recorded: Optional list extended with the (component rows,
+                positions, candidate records) of every scored chunk, for the
+                component matrix cache. Pruning is skipped while recording
+                since every candidate needs its components.
+        """
+        selector = TopKSelector(self.config.MAX_CANDIDATES, len(SCORE_COMPONENTS))
+        chunk_size = max(1, self.config.SHORTLIST_CHUNK_SIZE)
+        iterator = iter(applications)
+        start = position_offset
+        known_resumes = {}  # resume hash -> component row (None once pruned)
+
+        while True:
+            chunk = list(islice(iterator, chunk_size))
+            if not chunk:
+                break
+
+            positions = start + np.arange(len(chunk))
+            start += len(chunk)
+
+            # Drop applicants below MIN_SIMILARITY before any TF-IDF work
+            if self.config.ENABLE_PREFILTER:
+                started = time.perf_counter()
+                kept = self._prefilter_chunk(job_data, chunk)
+                selector.timings["prefilter"] += time.perf_counter() - started
+                selector.skip(len(chunk) - len(kept), "filtered")
+                chunk = [chunk[idx] for idx in kept]
+                positions = positions[kept]
+                if not chunk:
+                    continue
+
+            started = time.perf_counter()
+            components, kept = self._score_chunk_deduplicated(
+                job_data, chunk, selector, recorded is None, known_resumes
+            )
+            selector.timings["scoring"] += time.perf_counter() - started
+            started = time.perf_counter()
+
+            if recorded is not None:
+                recorded.append(
+                    (
+                        components[kept],
+                        positions[kept],
+                        [self._application_record(chunk[idx]) for idx in kept],
+                    )
+                )
+
+            selector.push(
+                self._weighted_totals(components[kept]),
+                components[kept],
+                [chunk[idx] for idx in kept],
+                positions[kept],
+            )
+            selector.timings["ranking"] += time.perf_counter() - started
+
+        if selector.skipped:
+            logging.info(
+                f"✂️ Skipped {dict(selector.skipped)} of {selector.seen} candidates before full scoring"
+            )
+
+        return selector
+
+    def _score_chunk_deduplicated(
+        self,
+        job_data: Dict[str, Any],
+        applications: List[Dict[str, Any]],
+        selector: TopKSelector,
+        allow_pruning: bool,
+        known_resumes: Dict[str, Optional[np.ndarray]],
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Score each distinct resume of a chunk once and fan the scores out
+
+        Applications sharing a resume hash get the component row of the first
+        one, including resumes scored (or pruned) in earlier chunks of the
+        same request. Pruning still rules out a resume for good, since the
+        selection threshold only rises.
+
+        Returns:
+            Tuple of (component score matrix, indices of the scored rows)
+        """
+        resume_hashes = [
+            resume_content_hash(application.get("resume") or {})
+            for application in applications
+        ]
+
+        unique_index = {}  # resume hash -> row among the resumes to score
+        unique_rows = []
+        for idx, resume_hash in enumerate(resume_hashes):
+            if resume_hash not in known_resumes and resume_hash not in unique_index:
+                unique_index[resume_hash] = len(unique_rows)
+                unique_rows.append(idx)
+
+        unique_components = np.zeros((0, len(SCORE_COMPONENTS)))
+        unique_kept = np.zeros(0, dtype=bool)
+        unique_pruned = False
+        if unique_rows:
+            unique_applications = [applications[idx] for idx in unique_rows]
+            unique_hashes = [resume_hashes[idx] for idx in unique_rows]
+
+            # Skip the TF-IDF work for candidates that cannot reach the top-K
+            if self.config.ENABLE_SCORE_PRUNING and allow_pruning and selector.is_full:
+                unique_components, kept, pruned = self._score_chunk_pruned(
+                    job_data, unique_applications, selector.threshold, unique_hashes
+                )
+                unique_pruned = pruned > 0
+            else:
+                unique_components, scored = self._score_chunk(
+                    job_data, unique_applications, unique_hashes
+                )
+                kept = np.flatnonzero(scored)
+            unique_kept = np.zeros(len(unique_rows), dtype=bool)
+            unique_kept[kept] = True
+
+            for resume_hash, row in unique_index.items():
+                if len(known_resumes) >= DEDUP_MAX_TRACKED_RESUMES:
+                    break
+                if unique_kept[row]:
+                    known_resumes[resume_hash] = unique_components[row]
+                elif unique_pruned:
+                    known_resumes[resume_hash] = None
+
+        components = np.zeros((len(applications), len(SCORE_COMPONENTS)))
+        scored = np.zeros(len(applications), dtype=bool)
+        pruned = 0
+        for idx, resume_hash in enumerate(resume_hashes):
+            row = unique_index.get(resume_hash)
+            if row is not None:
+                if unique_kept[row]:
+                    components[idx] = unique_components[row]
+                    scored[idx] = True
+                elif unique_pruned:
+                    pruned += 1
+            elif known_resumes[resume_hash] is not None:
+                components[idx] = known_resumes[resume_hash]
+                scored[idx] = True
+            else:
+                pruned += 1
+
+        # Rows that reused another row's outcome (failed rows are not counted)
+        representatives = int(unique_kept.sum())
+        if unique_pruned:
+            representatives = len(unique_rows)
+        selector.skip(pruned, "pruned")
+        selector.counts["unique_resumes"] += representatives
+        selector.counts["duplicates"] += int(scored.sum()) + pruned - representatives
+        return components, np.flatnonzero(scored)
+
+    def _prefilter_chunk(
+        self, job_data: Dict[str, Any], applications: List[Dict[str, Any]]
+    ) -> np.ndarray:
+        """
+        Find the applications whose skill overlap reaches MIN_SIMILARITY
+
+        The overlap is the share of the candidate's skills mentioned in the
+        job requirements, found with one automaton scan of the requirements,
+        so the stage costs a fraction of the TF-IDF scoring it saves.
+
+        Returns:
+            Indices of the applications kept for full scoring
+        """
+        try:
+            requirements = job_data.get("requirements", "") or ""
+            normalized_skills = [
+                self._normalize_skills(
+                    (application.get("resume") or {}).get("skills", [])
+                )
+                for application in applications
+            ]
+            matched_skills = SkillAutomaton(
+                skill for skills in normalized_skills for skill in skills
+            ).find_all(requirements.lower())
+
+            overlaps = np.array(
+                [
+                    (
+                        self._skills_overlap(skills, matched_skills)[0]
+                        if skills and requirements
+                        else 0.0
+                    )
+                    for skills in normalized_skills
+                ]
+            )
+            return np.flatnonzero(overlaps >= self.config.MIN_SIMILARITY)
+        except Exception as e:
+            logging.warning(f"⚠️ Prefilter failed, keeping every candidate: {str(e)}")
+            return np.arange(len(applications))
+
+    def _score_chunk_pruned(
+        self,
+        job_data: Dict[str, Any],
+        applications: List[Dict[str, Any]],
+        threshold: float,
+        resume_hashes: Optional[List[str]] = None,
+    ) -> Tuple[np.ndarray, np.ndarray, int]:
+        """
+        Score a chunk with pruning, reusing persisted component scores
+
+        Cached candidates count as fully scored; only the others go through
+        the pruned stages, and only the ones that survive them are stored.
+
+        Returns:
+            Tuple of (component score matrix, indices of the rows that were
+            fully scored, number of pruned candidates)
+        """
+        pruned = 0
+
+        def score_missing(job_data, missing_applications):
+            nonlocal pruned
+            components, active, pruned = self._score_chunk_pruned_uncached(
+                job_data, missing_applications, threshold
+            )
+            scored = np.zeros(len(missing_applications), dtype=bool)
+            scored[active] = True
+            return components, scored
+
+        components, scored = self._score_chunk_cached(
+            job_data, applications, score_missing, resume_hashes
+        )
+        return components, np.flatnonzero(scored), pruned
+
+    def _score_chunk_pruned_uncached(
+        self,
+        job_data: Dict[str, Any],
+        applications: List[Dict[str, Any]],
+        threshold: float,
+    ) -> Tuple[np.ndarray, np.ndarray, int]:
+        """
+        Score a chunk in stages, dropping candidates that cannot make the top-K
+
+        Cheap components (industry, education level, skill overlap) are known
+        up front and every similarity not computed yet counts at its maximum,
+        which gives an upper bound of each candidate's total. Before each
+        TF-IDF stage, candidates whose bound cannot beat the current K-th best
+        score are dropped, so the costly long-text transforms only run for
+        candidates still in contention.
+
+        Every chunk comes after the candidates already selected and loses
+        ties at the threshold, so a candidate stays only while its rounded
+        bound is strictly above the K-th best rounded score.
+
+        Returns:
+            Tuple of (component score matrix, indices of the rows that were
+            fully scored, number of pruned candidates)
+        """
+        try:
+            resumes = [application.get("resume") or {} for application in applications]
+            job_features = self._get_job_features(job_data)
+            factors = self._resume_factors(job_data, job_features, resumes)
+            parts = self._resume_field_parts(resumes)
+            has_text = np.array([bool(text) for text in parts["combined"]])
+
+            similarities = {
+                similarity: np.full(len(resumes), SIMILARITY_UPPER_BOUND)
+                for similarity, _ in RESUME_FIELD_SIMILARITIES.values()
+            }
+            active = np.arange(len(resumes))
+
+            for stage_fields in PRUNING_STAGES:
+                upper_bounds = self._weighted_totals(
+                    self._blend_components(
+                        job_features,
+                        {key: values[active] for key, values in factors.items()},
+                        has_text[active],
+                        {key: values[active] for key, values in similarities.items()},
+                    )
+                )
+                active = active[np.round(upper_bounds, 3) > threshold]
+                if not len(active):
+                    break
+
+                if self.resume_vector_cache is not None:
+                    # Cached vectors make the remaining similarities cheap
+                    resume_features = self._vectorize_resumes(
+                        [resumes[idx] for idx in active]
+                    )
+                    for key, values in self._job_similarities(
+                        job_features, resume_features
+                    ).items():
+                        similarities[key][active] = values
+                    break
+
+                for field in stage_fields:
+                    similarity, job_vector = RESUME_FIELD_SIMILARITIES[field]
+                    vectors = self._normalized_transform_parts(
+                        self._field_vectorizer(field),
+                        [parts[field][idx] for idx in active],
+                    )
+                    similarities[similarity][active] = rows_similarity(
+                        vectors, job_features[job_vector]
+                    )
+
+            components = self._blend_components(
+                job_features, factors, has_text, similarities
+            )
+            return components, active, len(resumes) - len(active)
+
+        except Exception as e:
+            logging.warning(
+                f"⚠️ Pruned scoring failed, scoring every candidate: {str(e)}"
+            )
+            components, scored = self._score_chunk_uncached(job_data, applications)
+            return components, np.flatnonzero(scored), 0
+
+    def _reset_worker_state(self):
+        """
+        Replace shared mutable state after this matcher is forked into a worker
+
+        Caches (and their locks) are process-local; a forked worker gets an
+        empty job cache and token memo and no resume cache, since all of them
+        die with the process.
+        """
+        self.job_feature_cache = JobFeatureCache(
+            max_entries=self.config.JOB_CACHE_MAX_ENTRIES,
+            ttl_seconds=self.config.JOB_CACHE_TTL_SECONDS,
+        )
+        self.resume_vector_cache = None
+        self._shared_analyzers = {}
+        if self.score_cache is not None:
+            # SQLite connections and the writer thread do not survive a fork
+            self.score_cache = self._open_score_cache()
+
+    def _reopen_after_fork(self):
+        """
+        Reopen per-process resources in a forked server worker
+
+        Unlike _reset_worker_state the caches are kept: the worker lives as
+        long as the master did and serves requests with them.
+        """
+        if self.score_cache is not None:
+            self.score_cache = self._open_score_cache()
+
+    def verify_model(self) -> bool:
+        """
+        Check that the current model still transforms text, reloading it from
+        disk if it does not
+
+        Returns:
+            True when the model works (or none is trained)
+        """
+        snapshot = self.registry.current()
+        if not snapshot.is_trained or self._verify_loaded_models(
+            snapshot.text_vectorizer, snapshot.skills_vectorizer
+        ):
+            return True
+
+        logging.warning("⚠️ Loaded model failed verification, reloading from disk")
+        self._load_model_if_exists()
+        return self.registry.current().is_trained
+
+    def warm_up(self) -> bool:
+        """
+        Shortlist a synthetic job so the first real request does not pay for
+        lazy initialization (analyzers, skill automata, memory-mapped model
+        pages, NumPy and SciPy code paths)
+
+        The synthetic job leaves no trace: it is kept out of the job, resume
+        and score caches (and their hit/miss stats) and is never recorded for
+        re-ranking.
+
+        Returns:
+            True when the warm-up shortlist succeeded
+        """
+        applications = [
+            {
+                "id": f"warm-up-application-{idx}",
+                "candidateId": f"warm-up-candidate-{idx}",
+                "resume": dict(resume),
+                "status": "applied",
+            }
+            for idx, resume in enumerate(WARM_UP_RESUMES)
+        ]
+
+        start = time.perf_counter()
+        self._pinned.warming = True
+        try:
+            self.shortlist_candidates(dict(WARM_UP_JOB), applications)
+        except Exception as e:
+            logging.warning(f"⚠️ Model warm-up failed: {str(e)}")
+            return False
+        finally:
+            self._pinned.warming = False
+
+        logging.info(
+            f"🔥 Model warmed up in {(time.perf_counter() - start) * 1000:.0f} ms"
+        )
+        return True
+
+    def _is_warming_up(self) -> bool:
+        """Whether this thread is running the warm-up shortlist"""
+        return getattr(self._pinned, "warming", False)
+
+    def _open_score_cache(self) -> ScoreCache:
+        """Persistent score cache of this process in the model storage directory"""
+        return get_score_cache(
+            self.config.MODEL_STORAGE_PATH,
+            max_age_days=self.config.SCORE_CACHE_MAX_AGE_DAYS,
+        )
+
+    def _score_chunk(
+        self,
+        job_data: Dict[str, Any],
+        applications: List[Dict[str, Any]],
+        resume_hashes: Optional[List[str]] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Score a chunk of applications, reusing persisted component scores
+
+        Returns:
+            Tuple of (component score matrix, mask of successfully scored rows)
+        """
+        return self._score_chunk_cached(
+            job_data, applications, self._score_chunk_uncached, resume_hashes
+        )
+
+    def _score_chunk_cached(
+        self,
+        job_data: Dict[str, Any],
+        applications: List[Dict[str, Any]],
+        score_missing: Callable[
+            [Dict[str, Any], List[Dict[str, Any]]], Tuple[np.ndarray, np.ndarray]
+        ],
+        resume_hashes: Optional[List[str]] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Look up a chunk in the score cache and score only the misses
+
+        Applications whose (job, resume, model) scores are in the score cache
+        skip scoring; the others are scored in one call of score_missing and
+        the rows it marks as scored are queued for a background write.
+
+        Resume hashes are computed here from the resumes unless the caller
+        already computed them (never taken from the request itself).
+
+        Returns:
+            Tuple of (component score matrix, mask of successfully scored rows)
+        """
+        if self.score_cache is None or self._is_warming_up():
+            return score_missing(job_data, applications)
+
+        job_hash = job_content_hash(job_data)
+        if resume_hashes is None:
+            resume_hashes = [
+                resume_content_hash(application.get("resume") or {})
+                for application in applications
+            ]
+        fingerprint = self._model_fingerprint()
+        cached = self.score_cache.get_many(job_hash, resume_hashes, fingerprint)
+
+        components = np.zeros((len(applications), len(SCORE_COMPONENTS)))
+        scored = np.zeros(len(applications), dtype=bool)
+        missing = []
+        for idx, resume_hash in enumerate(resume_hashes):
+            if resume_hash in cached:
+                components[idx] = cached[resume_hash]
+                scored[idx] = True
+            else:
+                missing.append(idx)
+
+        if missing:
+            missing_components, missing_scored = score_missing(
+                job_data, [applications[idx] for idx in missing]
+            )
+            components[missing] = missing_components
+            scored[missing] = missing_scored
+            self.score_cache.put_many(
+                job_hash,
+                [
+                    (resume_hashes[idx], missing_components[row])
+                    for row, idx in enumerate(missing)
+                    if missing_scored[row]
+                ],
+                fingerprint,
+            )
+
+        return components, scored
+
+    def _score_chunk_uncached(
+        self, job_data: Dict[str, Any], applications: List[Dict[str, Any]]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Score a chunk of applications, falling back to per-candidate scoring
+
+        Returns:
+            Tuple of (component score matrix, mask of successfully scored rows)
+        """
+        try:
+            components = self._score_candidates_batch(job_data, applications)
+            return components, np.ones(len(applications), dtype=bool)
+        except Exception as e:
+            logging.warning(
+                f"⚠️ Batch scoring failed, falling back to per-candidate scoring: {str(e)}"
+            )
+
+        components = np.zeros((len(applications), len(SCORE_COMPONENTS)))
+        scored = np.zeros(len(applications), dtype=bool)
+
+        for idx, application in enumerate(applications):
+            try:
+                scores = self._calculate_candidate_components(job_data, application)
+                components[idx] = [scores[key] for key in SCORE_COMPONENTS]
+                scored[idx] = True
+            except Exception as e:
+                logging.warning(
+                    f"⚠️ Failed to score candidate {application.get('candidateId', 'Unknown')}: {str(e)}"
+                )
+                continue
+
+        return components, scored
+
+    def _score_candidates_batch(
+        self, job_data: Dict[str, Any], applications: List[Dict[str, Any]]
+    ) -> np.ndarray:
+        """
+        Calculate the score components of every candidate in one pass
+
+        The job is vectorized once and every similarity is a sparse matrix
+        product between its rows and the normalized resume rows of the whole
+        pool; the cheap factors are computed per resume.
+
+        Returns:
+            Array of shape (n_applications, len(SCORE_COMPONENTS))
+        """
+        n_candidates = len(applications)
+        scores = np.zeros((n_candidates, len(SCORE_COMPONENTS)))
+        if n_candidates == 0:
+            return scores
+
+        resumes = [application.get("resume") or {} for application in applications]
+        job_features = self._get_job_features(job_data)
+        resume_features = self._vectorize_resumes(resumes)
+
+        return self._combine_components(
+            job_data,
+            job_features,
+            resumes,
+            resume_features["has_text"],
+            self._job_similarities(job_features, resume_features),
+        )
+
+    def _job_similarities(
+        self, job_features: Dict[str, Any], resume_features: Dict[str, Any]
+    ) -> Dict[str, np.ndarray]:
+        """
+        Similarity of every resume field against one job, one product per field
+        """
+        return {
+            similarity: rows_similarity(
+                resume_features[field], job_features[job_vector]
+            )
+            for field, (similarity, job_vector) in RESUME_FIELD_SIMILARITIES.items()
+        }
+
+    def _combine_components(
+        self,
+        job_data: Dict[str, Any],
+        job_features: Dict[str, Any],
+        resumes: List[Dict[str, Any]],
+        has_text: np.ndarray,
+        similarities: Dict[str, np.ndarray],
+    ) -> np.ndarray:
+        """
+        Turn precomputed field similarities into the component score matrix
+
+        Args:
+            job_data: Job information and requirements
+            job_features: Output of _get_job_features for the job
+            resumes: Resumes being scored
+            has_text: Whether each resume has any text for the overall similarity
+            similarities: Experience, education, skills and text similarity of
+                each resume against the job
+
+        Returns:
+            Array of shape (len(resumes), len(SCORE_COMPONENTS))
+        """
+        return self._blend_components(
+            job_features,
+            self._resume_factors(job_data, job_features, resumes),
+            has_text,
+            similarities,
+        )
+
+    def _resume_factors(
+        self,
+        job_data: Dict[str, Any],
+        job_features: Dict[str, Any],
+        resumes: List[Dict[str, Any]],
+    ) -> Dict[str, np.ndarray]:
+        """
+        Compute the score inputs that need no TF-IDF similarity
+
+        Returns:
+            Dictionary of per-resume arrays: skill overlap and demand bonus,
+            education level, industry score and which components apply
+        """
+        n_resumes = len(resumes)
+        factors = {
+            "has_skills": np.zeros(n_resumes, dtype=bool),
+            "skills_base": np.zeros(n_resumes),
+            "skills_bonus": np.zeros(n_resumes),
+            "has_experience": np.zeros(n_resumes, dtype=bool),
+            "has_education": np.zeros(n_resumes, dtype=bool),
+            "education_level": np.zeros(n_resumes),
+            "industry": np.zeros(n_resumes),
+        }
+
+        job_text = job_features["job_text"]
+        requirements = job_features["requirements"]
+        category = job_data.get("category", "")
+
+        # Scan the requirements once for every distinct skill in the chunk
+        normalized_skills = [
+            self._normalize_skills(resume.get("skills", [])) for resume in resumes
+        ]
+        matched_skills = SkillAutomaton(
+            skill for skills in normalized_skills for skill in skills
+        ).find_all(requirements.lower())
+
+        for idx, resume in enumerate(resumes):
+            experience = resume.get("experience", "")
+            education = resume.get("education", "")
+
+            # 1. Skills Matching - direct matches and demand bonus
+            if normalized_skills[idx] and requirements:
+                factors["has_skills"][idx] = True
+                factors["skills_base"][idx], factors["skills_bonus"][idx] = (
+                    self._skills_overlap(normalized_skills[idx], matched_skills)
+                )
+
+            # 2. Experience Relevance
+            factors["has_experience"][idx] = bool(experience and job_text)
+
+            # 3. Education Alignment - level score
+            if education and requirements:
+                factors["has_education"][idx] = True
+                factors["education_level"][idx] = self._education_level_score(education)
+
+            # 4. Industry Experience
+            factors["industry"][idx] = self._calculate_industry_match(
+                category, resume.get("industry", ""), resume.get("company", "")
+            )
+
+        return factors
+
+    def _blend_components(
+        self,
+        job_features: Dict[str, Any],
+        factors: Dict[str, np.ndarray],
+        has_text: np.ndarray,
+        similarities: Dict[str, np.ndarray],
+    ) -> np.ndarray:
+        """
+        Blend resume factors with field similarities into component scores
+
+        Uses the same arithmetic, in the same order, as the per-candidate
+        _calculate_* methods so both paths produce identical scores.
+
+        Returns:
+            Array of shape (n_resumes, len(SCORE_COMPONENTS))
+        """
+        scores = np.zeros((len(has_text), len(SCORE_COMPONENTS)))
+
+        # 1. Skills Matching - direct matches, demand bonus and semantic similarity
+        scores[:, 0] = np.where(
+            factors["has_skills"],
+            np.minimum(
+                1.0,
+                (factors["skills_base"] * 0.6)
+                + (similarities["skills"] * 0.4)
+                + factors["skills_bonus"],
+            ),
+            0.0,
+        )
+
+        # 2. Experience Relevance
+        scores[:, 1] = np.where(
+            factors["has_experience"], similarities["experience"], 0.0
+        )
+
+        # 3. Education Alignment - level score blended with field relevance
+        scores[:, 2] = np.where(
+            factors["has_education"],
+            np.minimum(
+                1.0,
+                (factors["education_level"] * 0.3) + (similarities["education"] * 0.7),
+            ),
+            0.5,
+        )
+
+        # 4. Industry Experience
+        scores[:, 3] = factors["industry"]
+
+        # 5. Overall Text Similarity
+        if job_features["job_text"]:
+            scores[:, 4] = np.where(has_text, similarities["text"], 0.0)
+
+        return scores
+
+    def _get_job_features(self, job_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Get the vectorized job features, reusing cached ones when available
+        """
+        if self._is_warming_up():
+            return self._vectorize_job(job_data)
+
+        cache_key = (
+            str(job_data.get("id")),
+            job_content_hash(job_data),
+            self._model_fingerprint(),
+        )
+
+        job_features = self.job_feature_cache.get(cache_key)
+        if job_features is None:
+            job_features = self._vectorize_job(job_data)
+            self.job_feature_cache.put(cache_key, job_features)
+
+        return job_features
+
+    def _clear_feature_caches(self):
+        """Drop cached job and resume vectors, token streams and score matrices"""
+        self._shared_analyzers = {}
+        self.job_feature_cache.clear()
+        self.component_cache.clear()
+        if self.resume_vector_cache is not None:
+            self.resume_vector_cache.clear()
+
+    def _model_fingerprint(self) -> str:
+        """
+        Identify the loaded model and vector precision so cached features never
+        outlive a retrain or a VECTOR_DTYPE change
+        """
+        return "{}:{}:{}".format(
+            self.training_metadata.get("model_version", self.config.MODEL_VERSION),
+            self.training_metadata.get("training_timestamp")
+            or self.training_metadata.get("model_files_hash", "unknown"),
+            self.vector_dtype.name,
+        )
+
+    def _vectorize_job(self, job_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Vectorize the job side of the comparison once for the whole pool
+        """
+        job_text = self._prepare_job_text(job_data)
+        requirements = job_data.get("requirements", "") or ""
+
+        text_vectors = self._normalized_transform(
+            self.text_vectorizer, [job_text, requirements]
+        )
+
+        return {
+            "job_text": job_text,
+            "requirements": requirements,
+            "job_text_vector": text_vectors[0],
+            "requirements_text_vector": text_vectors[1],
+            "requirements_skills_vector": self._normalized_transform(
+                self.skills_vectorizer, [requirements]
+            ),
+        }
+
+    def _vectorize_resumes(self, resumes: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Vectorize every resume field, reusing cached resume vectors when enabled
+        """
+        if self.resume_vector_cache is None or self._is_warming_up():
+            return self._transform_resumes(resumes)
+
+        fingerprint = self._model_fingerprint()
+        cache_keys = [(resume_content_hash(resume), fingerprint) for resume in resumes]
+        entries = [self.resume_vector_cache.get(key) for key in cache_keys]
+
+        # Vectorize only the resumes the cache has not seen, still in one batch
+        missing = [idx for idx, entry in enumerate(entries) if entry is None]
+        if missing:
+            fresh = self._transform_resumes([resumes[idx] for idx in missing])
+            for position, idx in enumerate(missing):
+                entry = {
+                    field: fresh[field][position] for field in RESUME_VECTOR_FIELDS
+                }
+                entry["has_text"] = bool(fresh["has_text"][position])
+                self.resume_vector_cache.put(cache_keys[idx], entry)
+                entries[idx] = entry
+
+        features = {
+            field: sp.vstack([entry[field] for entry in entries], format="csr")
+            for field in RESUME_VECTOR_FIELDS
+        }
+        features["has_text"] = np.array([entry["has_text"] for entry in entries])
+        return features
+
+    def _transform_resumes(self, resumes: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Vectorize every resume field with a single transform call per field
+        """
+        parts = self._resume_field_parts(resumes)
+
+        features = {
+            field: self._normalized_transform_parts(
+                self._field_vectorizer(field), parts[field]
+            )
+            for field in RESUME_VECTOR_FIELDS
+        }
+        features["has_text"] = np.array([bool(text) for text in parts["combined"]])
+        return features
+
+    def _resume_field_parts(
+        self, resumes: List[Dict[str, Any]]
+    ) -> Dict[str, List[List[str]]]:
+        """
+        Build the text parts of every vectorized resume field
+
+        The combined text is kept as its parts (experience, education, ...)
+        so their token streams are shared with the single-field vectors.
+        """
+        parts = {field: [] for field in RESUME_VECTOR_FIELDS}
+
+        for resume in resumes:
+            candidate_skills = resume.get("skills", [])
+            if not isinstance(candidate_skills, list):
+                candidate_skills = [str(candidate_skills)]
+
+            parts["experience"].append([str(resume.get("experience", "") or "")])
+            parts["education"].append([str(resume.get("education", "") or "")])
+            parts["skills"].append([" ".join(str(skill) for skill in candidate_skills)])
+            parts["combined"].append(self._candidate_text_parts(resume))
+
+        return parts
+
+    def _field_vectorizer(self, field: str):
+        """Vectorizer used for a resume field"""
+        return self.skills_vectorizer if field == "skills" else self.text_vectorizer
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """
+        Get hit/miss statistics of the feature and score caches
+        """
+        return {
+            "job_features": self.job_feature_cache.stats(),
+            "component_matrices": self.component_cache.stats(),
+            "resume_vectors": (
+                self.resume_vector_cache.stats()
+                if self.resume_vector_cache is not None
+                else None
+            ),
+            "pairwise_scores": (
+                self.score_cache.stats() if self.score_cache is not None else None
+            ),
+            "token_streams": {
+                name: self._shared_analyzer(vectorizer).stats()
+                for name, vectorizer in (
+                    ("text", self.text_vectorizer),
+                    ("skills", self.skills_vectorizer),
+                )
+                if vectorizer is not None
+            },
+        }
+
+    def _normalized_transform(self, vectorizer, texts: List[str]):
+        """
+        Transform texts into L2-normalized sparse rows
+        """
+        return self._normalized_transform_parts(vectorizer, [[text] for text in texts])
+
+    def _normalized_transform_parts(self, vectorizer, documents: List[List[str]]):
+        """
+        Transform documents given as text parts into L2-normalized sparse rows
+
+        Each document is vectorized as its space-joined parts, reusing the
+        memoized token stream of every part already seen.
+
+        With normalized rows cosine similarity becomes a plain dot product,
+        computed by the kernels in models.similarity for both the batch and
+        the per-candidate scoring paths. Rows use the
+        configured VECTOR_DTYPE, which also sets the precision of every
+        cached vector and similarity product.
+        """
+        matrix = self._shared_analyzer(vectorizer).transform(documents).tocsr()
+        if matrix.dtype != self.vector_dtype:
+            # Models trained in the other precision are converted on the fly
+            matrix = matrix.astype(self.vector_dtype)
+        return normalize(matrix, norm="l2", copy=False)
+
+    def _shared_analyzer(self, vectorizer) -> SharedAnalyzer:
+        """Memoizing analyzer of a loaded vectorizer (rebuilt after a retrain)"""
+        analyzer = self._shared_analyzers.get(id(vectorizer))
+        if analyzer is None or analyzer.vectorizer is not vectorizer:
+            analyzer = SharedAnalyzer(
+                vectorizer, max_entries=self.config.TOKEN_CACHE_MAX_ENTRIES
+            )
+            self._shared_analyzers[id(vectorizer)] = analyzer
+        return analyzer
+
+    def _weighted_totals(self, components: np.ndarray) -> np.ndarray:
+        """
+        Weighted total score of each row of a component score matrix
+
+        Accumulates components in the same order as the per-candidate sum so
+        batch totals match single-candidate totals exactly.
+        """
+        totals = np.zeros(components.shape[0])
+        for column, key in enumerate(SCORE_COMPONENTS):
+            totals = totals + components[:, column] * self.weights[key]
+        return totals
+
+    def _build_candidate_result(
+        self,
+        job_data: Dict[str, Any],
+        application: Dict[str, Any],
+        scores: Dict[str, float],
+        total_score: float,
+    ) -> Dict[str, Any]:
+        """
+        Build the API result for a scored candidate
+        """
+        candidate = application.get("candidate", {})
+
+        # Generate human-readable explanation of the match
+        explanation = self._generate_match_explanation(
+            scores, job_data["title"], total_score
+        )
+
+        return {
+            "application_id": application["id"],
+            "candidate_id": application["candidateId"],
+            "candidate_name": f"{candidate.get('firstName', '')} {candidate.get('lastName', '')}".strip(),
+            "total_score": float(np.round(total_score, 3)),
+            "score_breakdown": {
+                key: float(np.round(value, 3)) for key, value in scores.items()
+            },
+            "match_explanation": explanation,
+            "recommendation_strength": self._get_recommendation_strength(total_score),
+        }
+
+    def _calculate_candidate_components(
+        self, job_data: Dict[str, Any], application: Dict[str, Any]
+    ) -> Dict[str, float]:
+        """
+        Calculate the individual score components for a single candidate
+        """
+        resume = application.get("resume", {})
+
+        # Extract and clean text data for analysis
+        job_text = self._prepare_job_text(job_data)
+        candidate_text = self._prepare_candidate_text(resume)
+
+        # Calculate individual score components
+        scores = {}
+
+        # 1. Skills Matching (Most Important - configurable%)
+        scores["skills_match"] = self._calculate_skills_match(
+            job_data.get("requirements", ""), resume.get("skills", [])
+        )
+
+        # 2. Experience Relevance (Very Important - configurable%)
+        scores["experience_relevance"] = self._calculate_experience_relevance(
+            job_text, resume.get("experience", "")
+        )
+
+        # 3. Education Alignment (Important - configurable%)
+        scores["education_alignment"] = self._calculate_education_alignment(
+            job_data.get("requirements", ""), resume.get("education", "")
+        )
+
+        # 4. Industry Experience (Helpful - configurable%)
+        scores["industry_experience"] = self._calculate_industry_match(
+            job_data.get("category", ""),
+            resume.get("industry", ""),
+            resume.get("company", ""),
+        )
+
+        # 5. Overall Text Similarity (Context - configurable%)
+        scores["text_similarity"] = self._calculate_text_similarity(
+            job_text, candidate_text
+        )
+
+        return scores
+
+    def _calculate_education_alignment(
+        self, job_requirements: str, education: str
+    ) -> float:
+        """
+        Evaluate how well the candidate's education matches job requirements
+
+        This considers both the level of education and the relevance of the field of study.
+        For example, a Computer Science degree would score higher for a software development role.
+        """
+        if not education or not job_requirements:
+            return 0.5  # Neutral score when information is missing
+
+        # Calculate education level score
+        level_score = self._education_level_score(education)
+
+        # Calculate field relevance using text similarity
+        try:
+            if self.text_vectorizer:
+                vectors = self._normalized_transform(
+                    self.text_vectorizer, [education, job_requirements]
+                )
+                field_relevance = row_similarity(vectors[0], vectors[1])
+            else:
+                field_relevance = self._simple_keyword_match(
+                    education, job_requirements
+                )
+        except:
+            field_relevance = 0.3
+
+        # Combine level and relevance (relevance is more important)
+        final_score = (level_score * 0.3) + (field_relevance * 0.7)
+        return min(1.0, final_score)
+
+    def _education_level_score(self, education: str) -> float:
+        """
+        Score the highest education level mentioned in the candidate's education
+        """
+        education_lower = education.lower()
+
+        # Define education level scoring
         # Higher education levels get bonus points, but practical experience often matters more
         education_levels = {
             "phd": 1.0,
@@ -603,31 +2896,11 @@ class CandidateMatcher:
             "certificate": 0.4,
         }
 
-        # Calculate education level score
-        level_score = 0.0
         for level, score in education_levels.items():
             if level in education_lower:
-                level_score = max(level_score, score)
-                break
-        else:
-            level_score = 0.3  # Default for unspecified education
-
-        # Calculate field relevance using text similarity
-        try:
-            if self.text_vectorizer:
-                edu_vector = self.text_vectorizer.transform([education])
-                req_vector = self.text_vectorizer.transform([job_requirements])
-                field_relevance = cosine_similarity(edu_vector, req_vector)[0][0]
-            else:
-                field_relevance = self._simple_keyword_match(
-                    education, job_requirements
-                )
-        except:
-            field_relevance = 0.3
+                return score
 
-        # Combine level and relevance (relevance is more important)
-        final_score = (level_score * 0.3) + (field_relevance * 0.7)
-        return min(1.0, final_score)
+        return 0.3  # Default for unspecified education
 
     def _calculate_industry_match(
         self, job_category: str, candidate_industry: str, candidate_company: str
@@ -686,75 +2959,65 @@ class CandidateMatcher:
 
         try:
             if self.text_vectorizer:
-                job_vector = self.text_vectorizer.transform([job_text])
-                candidate_vector = self.text_vectorizer.transform([candidate_text])
-                similarity = cosine_similarity(job_vector, candidate_vector)[0][0]
-                return similarity
+                vectors = self._normalized_transform(
+                    self.text_vectorizer, [candidate_text, job_text]
+                )
+                return row_similarity(vectors[0], vectors[1])
             else:
                 return self._simple_keyword_match(job_text, candidate_text)
         except Exception as e:
             logging.warning(f"Text similarity calculation failed: {str(e)}")
             return 0.0
 
-    def _calculate_skills_bonus(
-        self, candidate_skills: List[str], job_requirements: str
-    ) -> float:
+    def _normalize_skills(self, candidate_skills) -> List[str]:
         """
-        Calculate bonus points for high-demand or specialized skills
-
-        This rewards candidates who have rare or particularly valuable skills
-        that are explicitly mentioned in the job requirements.
+        Lowercase and strip candidate skills for matching against requirements
         """
-        if not candidate_skills or not job_requirements:
-            return 0.0
-
-        requirements_lower = job_requirements.lower()
-        bonus = 0.0
+        if not candidate_skills:
+            return []
 
         # Ensure candidate_skills is a list
         if not isinstance(candidate_skills, list):
             candidate_skills = [str(candidate_skills)]
 
-        # High-demand technical skills (you can customize this list based on your market)
-        high_demand_skills = {
-            "python": 0.05,
-            "javascript": 0.05,
-            "react": 0.04,
-            "node.js": 0.04,
-            "aws": 0.06,
-            "docker": 0.05,
-            "kubernetes": 0.06,
-            "microservices": 0.05,
-            "machine learning": 0.07,
-            "ai": 0.06,
-            "data science": 0.06,
-            "postgresql": 0.04,
-            "mongodb": 0.04,
-            "redis": 0.03,
-            "git": 0.02,
-            "agile": 0.03,
-            "devops": 0.05,
-        }
+        return [str(skill).lower().strip() for skill in candidate_skills]
+
+    def _skills_overlap(
+        self, normalized_skills: List[str], matched_skills: Set[str]
+    ) -> Tuple[float, float]:
+        """
+        Calculate the direct-match score and demand bonus from one requirements scan
 
-        for skill in candidate_skills:
-            skill_lower = str(skill).lower().strip()
+        Args:
+            normalized_skills: Candidate skills from _normalize_skills
+            matched_skills: Skills found in the job requirements by a SkillAutomaton
+
+        Returns:
+            Tuple of (share of skills mentioned in requirements, demand bonus)
+        """
+        matched_count = 0
+        bonus = 0.0
 
+        for skill in normalized_skills:
             # Check if skill is explicitly mentioned in job requirements
-            if skill_lower in requirements_lower:
+            if skill in matched_skills:
+                matched_count += 1
                 # Give bonus based on skill demand level
-                bonus += high_demand_skills.get(
-                    skill_lower, 0.02
-                )  # Default small bonus
+                bonus += HIGH_DEMAND_SKILLS.get(skill, 0.02)  # Default small bonus
+
+        base_score = matched_count / max(1, len(normalized_skills))
 
-        return min(0.15, bonus)  # Cap bonus at 15% to prevent over-weighting
+        # Cap bonus at 15% to prevent over-weighting
+        return base_score, min(0.15, bonus)
 
     def _generate_match_explanation(
-        self, scores: Dict[str, float], job_title: str
+        self, scores: Dict[str, float], job_title: str, total_score: float
     ) -> str:
         """
         Generate human-readable explanation of why this candidate is a good match
 
         This helps recruiters understand the AI's reasoning and builds trust in the system.
+        Only called for returned candidates, with the total already computed by the scorer.
         """
         explanations = []
 
@@ -793,7 +3056,6 @@ class CandidateMatcher:
             explanations.append("🌐 Some relevant industry background")
 
         # Overall recommendation
-        total_score = sum(scores[key] * self.weights[key] for key in scores)
         if total_score >= 0.75:
             recommendation = f"🌟 Highly recommended for {job_title} position"
         elif total_score >= 0.6:
@@ -845,6 +3107,12 @@ class CandidateMatcher:
         """
         Prepare candidate text for analysis by combining relevant fields
         """
+        return " ".join(self._candidate_text_parts(resume))
+
+    def _candidate_text_parts(self, resume: Dict[str, Any]) -> List[str]:
+        """
+        Relevant resume fields that make up the candidate text, in order
+        """
         text_parts = []
 
         if resume.get("experience"):
@@ -862,7 +3130,7 @@ class CandidateMatcher:
         if resume.get("company"):
             text_parts.append(resume["company"])
 
-        return " ".join(text_parts)
+        return text_parts
 
     def _calculate_skills_match(
         self, job_requirements: str, candidate_skills: List[str]
@@ -877,28 +3145,22 @@ class CandidateMatcher:
         if not isinstance(candidate_skills, list):
             candidate_skills = [str(candidate_skills)]
 
-        requirements_lower = job_requirements.lower()
-        matched_skills = 0
-        total_skills = len(candidate_skills)
-
-        for skill in candidate_skills:
-            skill_lower = str(skill).lower().strip()
-            if skill_lower in requirements_lower:
-                matched_skills += 1
-
-        # Base score from direct matches
-        base_score = matched_skills / max(1, total_skills) if total_skills > 0 else 0.0
-
-        # Add bonus for high-demand skills
-        bonus = self._calculate_skills_bonus(candidate_skills, job_requirements)
+        # Scan the requirements once for all skills; the same scan drives both
+        # the direct matches and the high-demand bonus
+        normalized_skills = self._normalize_skills(candidate_skills)
+        matched_skills = SkillAutomaton(normalized_skills).find_all(
+            job_requirements.lower()
+        )
+        base_score, bonus = self._skills_overlap(normalized_skills, matched_skills)
 
         # Use skills vectorizer for semantic matching if available
         if self.skills_vectorizer:
             try:
                 skills_text = " ".join([str(skill) for skill in candidate_skills])
-                skills_vector = self.skills_vectorizer.transform([skills_text])
-                req_vector = self.skills_vectorizer.transform([job_requirements])
-                semantic_score = cosine_similarity(skills_vector, req_vector)[0][0]
+                vectors = self._normalized_transform(
+                    self.skills_vectorizer, [skills_text, job_requirements]
+                )
+                semantic_score = row_similarity(vectors[0], vectors[1])
 
                 # Combine direct matching with semantic similarity
                 final_score = (base_score * 0.6) + (semantic_score * 0.4) + bonus
@@ -918,10 +3180,10 @@ class CandidateMatcher:
 
         try:
             if self.text_vectorizer:
-                exp_vector = self.text_vectorizer.transform([experience])
-                job_vector = self.text_vectorizer.transform([job_text])
-                similarity = cosine_similarity(exp_vector, job_vector)[0][0]
-                return similarity
+                vectors = self._normalized_transform(
+                    self.text_vectorizer, [experience, job_text]
+                )
+                return row_similarity(vectors[0], vectors[1])
             else:
                 return self._simple_keyword_match(experience, job_text)
         except:
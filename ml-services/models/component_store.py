@@ -0,0 +1,110 @@
+import json
+import logging
+import os
+import time
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+from utils.hash_utils import content_hash
+
+
+class ComponentMatrixStore:
+    """
+    Component score matrices of recent shortlist runs, shared by all workers
+
+    Every gunicorn worker has its own in-memory ComponentMatrixCache, so a
+    re-rank usually reaches a worker that did not shortlist the job. Runs
+    are also written here, one .npz file per job under the model storage
+    directory, and a worker that misses in memory reads the file instead.
+    Files are replaced atomically, so a reader never sees a partial matrix.
+    """
+
+    DIRNAME = "rerank"
+
+    def __init__(self, storage_path: str, max_entries: int, ttl_seconds: float):
+        self.directory = os.path.join(storage_path, self.DIRNAME)
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+
+    def put(self, job_id: str, entry: Dict[str, Any]):
+        """Write the matrix of a job's run, replacing its previous run"""
+        os.makedirs(self.directory, exist_ok=True)
+        path = self._path(job_id)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+
+        metadata = {
+            "job": entry["job"],
+            "applications": entry["applications"],
+            "model_fingerprint": entry["model_fingerprint"],
+        }
+        try:
+            with open(temp_path, "wb") as f:
+                np.savez(
+                    f,
+                    components=entry["components"],
+                    positions=entry["positions"],
+                    metadata=np.array(json.dumps(metadata, default=str)),
+                )
+            os.replace(temp_path, path)
+        except Exception as e:
+            logging.warning(f"⚠️ Could not store component scores: {str(e)}")
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            return
+
+        self._prune()
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Matrix of the job's last run, or None if missing or expired"""
+        path = self._path(job_id)
+        try:
+            if time.time() - os.path.getmtime(path) > self.ttl_seconds:
+                return None
+            with np.load(path, allow_pickle=False) as data:
+                entry = json.loads(str(data["metadata"]))
+                entry["components"] = data["components"]
+                entry["positions"] = data["positions"]
+            return entry
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logging.warning(
+                f"⚠️ Unreadable component scores for job {job_id}: {str(e)}"
+            )
+            return None
+
+    def _path(self, job_id: str) -> str:
+        # Hashed so any job id is a safe file name
+        return os.path.join(self.directory, f"{content_hash(str(job_id))[:32]}.npz")
+
+    def _prune(self):
+        """Delete expired matrices and the oldest beyond max_entries"""
+        now = time.time()
+        files = []
+        for name in self._file_names():
+            try:
+                mtime = os.path.getmtime(os.path.join(self.directory, name))
+            except OSError:
+                continue
+            if now - mtime > self.ttl_seconds:
+                self._remove(name)
+            else:
+                files.append((mtime, name))
+
+        for _, name in sorted(files, reverse=True)[self.max_entries :]:
+            self._remove(name)
+
+    def _file_names(self):
+        try:
+            return [
+                name for name in os.listdir(self.directory) if name.endswith(".npz")
+            ]
+        except FileNotFoundError:
+            return []
+
+    def _remove(self, name: str):
+        try:
+            os.remove(os.path.join(self.directory, name))
+        except OSError:
+            pass
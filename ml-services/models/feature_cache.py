@@ -0,0 +1,163 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+
+class JobFeatureCache:
+    """
+    LRU cache of vectorized job features with time-based expiry
+
+    Entries are keyed by (job id, job content hash, model fingerprint), so an
+    edited posting or a newly trained model never reuses stale vectors.
+    Cached feature dictionaries are shared between requests and must be
+    treated as read-only.
+    """
+
+    def __init__(self, max_entries: int = 128, ttl_seconds: float = 3600):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Dict[str, Any]]:
+        """Return the cached features for key, or None on a miss or expiry"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            expires_at, features = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return features
+
+    def put(self, key: Hashable, features: Dict[str, Any]):
+        """Store features for key, evicting the least recently used entries"""
+        if self.max_entries <= 0:
+            return
+
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, features)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Drop every cached entry"""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Get cache size and hit/miss counters"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            }
+
+
+class ComponentMatrixCache(JobFeatureCache):
+    """
+    LRU cache of the component score matrix of each job's last shortlist run
+
+    Entries are keyed by job id and hold one (n_candidates, n_components)
+    matrix plus compact candidate records, so a job can be re-ranked with new
+    weights without re-scoring or re-vectorizing anything. Entries carry the
+    model fingerprint they were scored with and are ignored after a retrain.
+    """
+
+
+class ResumeVectorCache:
+    """
+    Memory-bounded LRU cache of vectorized resume fields
+
+    Entries are keyed by (resume content hash, model fingerprint) and hold the
+    sparse rows of each resume field. The cache evicts least recently used
+    entries once the estimated size of the stored rows exceeds max_bytes.
+    """
+
+    # Rough per-entry cost of the dict, key and sparse matrix objects
+    ENTRY_OVERHEAD_BYTES = 1024
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Dict[str, Any]]:
+        """Return the cached resume vectors for key, or None on a miss"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key: Hashable, vectors: Dict[str, Any]):
+        """Store resume vectors for key, evicting entries to stay within budget"""
+        size = self._estimate_size(vectors)
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.current_bytes -= previous[0]
+
+            self._entries[key] = (size, vectors)
+            self.current_bytes += size
+
+            while self.current_bytes > self.max_bytes and self._entries:
+                evicted_size, _ = self._entries.popitem(last=False)[1]
+                self.current_bytes -= evicted_size
+                self.evictions += 1
+
+    def clear(self):
+        """Drop every cached entry"""
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Get cache size, memory usage and hit/miss counters"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "memory_bytes": self.current_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            }
+
+    def _estimate_size(self, vectors: Dict[str, Any]) -> int:
+        """Estimate the memory held by the sparse rows of one entry"""
+        size = self.ENTRY_OVERHEAD_BYTES
+        for value in vectors.values():
+            if hasattr(value, "indptr"):
+                size += value.data.nbytes + value.indices.nbytes + value.indptr.nbytes
+        return size
@@ -0,0 +1,185 @@
+import json
+import os
+from typing import Iterable, List, Optional, Tuple
+
+import numpy as np
+from sklearn.feature_extraction.text import HashingVectorizer
+from sklearn.preprocessing import normalize
+
+# Model types accepted by CandidateMatcher.train_model
+MODEL_TYPES = ("tfidf", "hashing")
+
+
+class HashingTfidfVectorizer:
+    """
+    Stateless TF-IDF vectorizer built on feature hashing
+
+    Terms are hashed into a fixed number of columns instead of being looked
+    up in a fitted vocabulary, so the model is one IDF array of n_features
+    floats whatever the corpus size, and transforming needs no dict lookups.
+    Columns no training document hit, or outside min_df/max_df, get an IDF
+    of 0 and drop out of the vectors, like terms missing from a vocabulary.
+
+    The IDF array is stored as .npy next to a small JSON file holding the
+    analyzer parameters.
+    """
+
+    def __init__(
+        self,
+        n_features: int = 2**18,
+        ngram_range: Tuple[int, int] = (1, 1),
+        stop_words: Optional[str] = None,
+        token_pattern: str = r"(?u)\b\w\w+\b",
+        min_df: float = 1,
+        max_df: float = 1.0,
+        dtype=np.float64,
+    ):
+        self.n_features = n_features
+        self.ngram_range = tuple(ngram_range)
+        self.stop_words = stop_words
+        self.token_pattern = token_pattern
+        self.min_df = min_df
+        self.max_df = max_df
+        self.idf_ = None
+        self._dtype = np.dtype(dtype)
+        self._analyzer = "word"
+        self._hasher = None
+
+    @property
+    def dtype(self) -> np.dtype:
+        return self._dtype
+
+    @dtype.setter
+    def dtype(self, value):
+        self._dtype = np.dtype(value)
+        self._hasher = None
+
+    @property
+    def analyzer(self):
+        """Analyzer of the hasher ("word", or a callable for pre-analyzed input)"""
+        return self._analyzer
+
+    @analyzer.setter
+    def analyzer(self, value):
+        self._analyzer = value
+        self._hasher = None
+
+    @property
+    def feature_count(self) -> int:
+        """Number of hashed columns carrying weight (the effective vocabulary)"""
+        return int(np.count_nonzero(self.idf_)) if self.idf_ is not None else 0
+
+    def fit(self, raw_documents: Iterable[str]) -> "HashingTfidfVectorizer":
+        """
+        Learn the IDF weight of every hashed column
+
+        Uses the smoothed IDF of TfidfVectorizer: ln((1 + n) / (1 + df)) + 1.
+        """
+        counts = self._get_hasher().transform(raw_documents).tocsr()
+        n_documents = counts.shape[0]
+        document_frequency = np.bincount(counts.indices, minlength=self.n_features)
+
+        min_documents = (
+            self.min_df if isinstance(self.min_df, int) else self.min_df * n_documents
+        )
+        max_documents = (
+            self.max_df if isinstance(self.max_df, int) else self.max_df * n_documents
+        )
+        kept = (document_frequency >= max(min_documents, 1)) & (
+            document_frequency <= max_documents
+        )
+
+        idf = np.log((1 + n_documents) / (1 + document_frequency)) + 1
+        idf[~kept] = 0
+        self.idf_ = idf.astype(self.dtype)
+        return self
+
+    def transform(self, raw_documents: Iterable[str]):
+        """Hash documents into L2-normalized TF-IDF rows (CSR)"""
+        if self.idf_ is None:
+            raise ValueError("HashingTfidfVectorizer is not fitted")
+
+        matrix = self._get_hasher().transform(raw_documents).tocsr()
+        matrix.data *= self.idf_[matrix.indices]
+        matrix.eliminate_zeros()
+        return normalize(matrix, norm="l2", copy=False)
+
+    def fit_transform(self, raw_documents: List[str]):
+        return self.fit(raw_documents).transform(raw_documents)
+
+    def save(self, directory: str, name: str) -> List[str]:
+        """
+        Write the parameters (JSON) and IDF array (.npy) of the vectorizer
+
+        Returns:
+            File names written inside directory
+        """
+        params_file = f"{name}.json"
+        idf_file = f"{name}_idf.npy"
+
+        np.save(os.path.join(directory, idf_file), self.idf_)
+        with open(os.path.join(directory, params_file), "w") as f:
+            json.dump(
+                {
+                    "n_features": self.n_features,
+                    "ngram_range": list(self.ngram_range),
+                    "stop_words": self.stop_words,
+                    "token_pattern": self.token_pattern,
+                    "min_df": self.min_df,
+                    "max_df": self.max_df,
+                    "dtype": np.dtype(self.idf_.dtype).name,
+                    "idf_file": idf_file,
+                },
+                f,
+                indent=2,
+            )
+
+        return [params_file, idf_file]
+
+    @classmethod
+    def load(
+        cls, directory: str, name: str, mmap: bool = False
+    ) -> "HashingTfidfVectorizer":
+        """
+        Load a vectorizer written by save
+
+        With mmap the IDF array is opened read-only with mmap_mode="r", so
+        processes loading the same file share its pages.
+        """
+        with open(os.path.join(directory, f"{name}.json"), "r") as f:
+            params = json.load(f)
+
+        idf_file = params.pop("idf_file")
+        vectorizer = cls(**params)
+        vectorizer.idf_ = np.load(
+            os.path.join(directory, idf_file), mmap_mode="r" if mmap else None
+        )
+        if len(vectorizer.idf_) != vectorizer.n_features:
+            raise ValueError(
+                f"IDF array of {name} has {len(vectorizer.idf_)} entries, expected {vectorizer.n_features}"
+            )
+        return vectorizer
+
+    def build_preprocessor(self):
+        return self._get_hasher().build_preprocessor()
+
+    def build_tokenizer(self):
+        return self._get_hasher().build_tokenizer()
+
+    def get_stop_words(self):
+        return self._get_hasher().get_stop_words()
+
+    def _get_hasher(self) -> HashingVectorizer:
+        """Hashing analyzer producing raw term counts"""
+        if self._hasher is None:
+            self._hasher = HashingVectorizer(
+                n_features=self.n_features,
+                ngram_range=self.ngram_range,
+                stop_words=self.stop_words,
+                token_pattern=self.token_pattern,
+                analyzer=self.analyzer,
+                alternate_sign=False,
+                norm=None,
+                dtype=self.dtype,
+            )
+        return self._hasher
@@ -0,0 +1,260 @@
+import heapq
+import json
+import logging
+import os
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows: writers are only serialized within one process
+    fcntl = None
+
+# Job vectors indexed in the inverted index (keys of the job feature dicts)
+INDEXED_JOB_FIELDS = (
+    "job_text_vector",
+    "requirements_text_vector",
+    "requirements_skills_vector",
+)
+
+
+class JobIndex:
+    """
+    Inverted index of open jobs for reverse (candidate -> jobs) matching
+
+    Each indexed job vector field keeps a posting list per vocabulary term
+    (term -> {job_id: weight}). A query only walks the posting lists of the
+    terms present in the candidate's resume, so the cost grows with the
+    number of matching postings rather than with the number of open jobs.
+
+    Raw job data is persisted as JSON under the model storage path so the
+    index survives restarts, is picked up by other workers on their next
+    query, and can be re-vectorized when a new model is trained.
+
+    Every worker writes the same file, so changes hold an exclusive lock on
+    a lock file next to it and are applied to the jobs as stored, never to
+    this worker's possibly stale copy.
+    """
+
+    FILENAME = "open_jobs.json"
+
+    def __init__(self, storage_path: str):
+        self.storage_path = os.path.join(storage_path, self.FILENAME)
+        self.lock_path = f"{self.storage_path}.lock"
+        self.model_fingerprint = None
+
+        self._jobs = {}  # job_id -> job data
+        self._features = {}  # job_id -> vectorized job features
+        self._postings = {field: defaultdict(dict) for field in INDEXED_JOB_FIELDS}
+        self._loaded_mtime = None
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._jobs)
+
+    def sync(self, vectorize_job: Callable, model_fingerprint: str):
+        """
+        Bring the index up to date with the stored jobs and the loaded model
+
+        Reloads jobs written by another worker and re-vectorizes every job
+        when the model fingerprint changed since the index was built.
+
+        Args:
+            vectorize_job: Function turning job data into job features
+            model_fingerprint: Fingerprint of the currently loaded model
+        """
+        with self._lock:
+            if self._is_current(model_fingerprint):
+                return
+
+        with self._exclusive():
+            self._sync_locked(vectorize_job, model_fingerprint)
+
+    def upsert(
+        self,
+        jobs: List[Dict[str, Any]],
+        vectorize_job: Callable,
+        model_fingerprint: str,
+    ):
+        """
+        Add jobs to the index or replace their previous versions
+
+        The index is synced with the stored jobs first (under the same lock),
+        so jobs written by other workers are kept.
+
+        Args:
+            jobs: Job data of the jobs to index
+            vectorize_job: Function turning job data into job features
+            model_fingerprint: Fingerprint of the currently loaded model
+        """
+        with self._exclusive():
+            self._sync_locked(vectorize_job, model_fingerprint)
+
+            for job_data in jobs:
+                job_id = str(job_data["id"])
+                self._unindex_job(job_id)
+                self._index_job(job_id, job_data, vectorize_job(job_data))
+
+            self._write_jobs(list(self._jobs.values()))
+            self._loaded_mtime = self._stored_mtime()
+
+    def remove(self, job_id: str) -> Optional[int]:
+        """
+        Remove a job from the stored index
+
+        Works on the stored jobs, so it needs no model (and re-vectorizes
+        nothing).
+
+        Returns:
+            Number of stored jobs left, or None if the job was not indexed
+        """
+        job_id = str(job_id)
+
+        with self._exclusive():
+            in_sync = self._stored_mtime() == self._loaded_mtime
+            stored = self._read_jobs() if self._stored_mtime() is not None else {}
+            self._unindex_job(job_id)
+            if stored.pop(job_id, None) is None:
+                return None
+
+            self._write_jobs(list(stored.values()))
+            if in_sync:
+                # The rest of this worker's copy still matches the stored jobs
+                self._loaded_mtime = self._stored_mtime()
+            return len(stored)
+
+    def get(self, job_id: str) -> Optional[Tuple[Dict[str, Any], Dict[str, Any]]]:
+        """Get the (job data, job features) of an indexed job"""
+        with self._lock:
+            if job_id not in self._jobs:
+                return None
+            return self._jobs[job_id], self._features[job_id]
+
+    def candidate_jobs(
+        self, query: List[Tuple[str, Any, float]], limit: int
+    ) -> List[str]:
+        """
+        Find the jobs most similar to a candidate by walking posting lists
+
+        Args:
+            query: (job field, normalized 1 x V candidate row, weight) triples;
+                each row is compared against the job vectors of that field
+            limit: Number of job ids to return
+
+        Returns:
+            Ids of the jobs with the highest weighted similarity, best first.
+            When fewer than limit jobs share a term with the candidate, every
+            other indexed job follows (a full scan)
+        """
+        with self._lock:
+            scores = defaultdict(float)
+
+            for field, row, weight in query:
+                postings = self._postings[field]
+                for term, value in zip(row.indices, row.data):
+                    for job_id, job_weight in postings.get(term, {}).items():
+                        scores[job_id] += weight * value * job_weight
+
+            ranked = [
+                job_id
+                for job_id, _ in heapq.nlargest(
+                    limit, scores.items(), key=lambda item: item[1]
+                )
+            ]
+            if len(ranked) < limit:
+                # Jobs without a shared term can still score on industry or
+                # substring skill matches
+                ranked.extend(job_id for job_id in self._jobs if job_id not in scores)
+            return ranked
+
+    @contextmanager
+    def _exclusive(self):
+        """Hold the thread lock and the inter-process lock of the jobs file"""
+        with self._lock:
+            if fcntl is None:
+                yield
+                return
+
+            os.makedirs(os.path.dirname(self.lock_path), exist_ok=True)
+            with open(self.lock_path, "a") as lock_file:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _is_current(self, model_fingerprint: str) -> bool:
+        return (
+            self._stored_mtime() == self._loaded_mtime
+            and model_fingerprint == self.model_fingerprint
+        )
+
+    def _sync_locked(self, vectorize_job: Callable, model_fingerprint: str):
+        """sync, with the locks held"""
+        if self._is_current(model_fingerprint):
+            return
+
+        mtime = self._stored_mtime()
+        jobs = self._read_jobs() if mtime is not None else {}
+        self._jobs = {}
+        self._features = {}
+        self._postings = {field: defaultdict(dict) for field in INDEXED_JOB_FIELDS}
+
+        for job_id, job_data in jobs.items():
+            self._index_job(job_id, job_data, vectorize_job(job_data))
+
+        self._loaded_mtime = mtime
+        self.model_fingerprint = model_fingerprint
+
+        logging.info(f"📇 Job index synced with {len(self._jobs)} open jobs")
+
+    def _index_job(
+        self, job_id: str, job_data: Dict[str, Any], job_features: Dict[str, Any]
+    ):
+        """Store a job and add its terms to the posting lists"""
+        self._jobs[job_id] = job_data
+        self._features[job_id] = job_features
+
+        for field in INDEXED_JOB_FIELDS:
+            row = job_features[field]
+            for term, value in zip(row.indices, row.data):
+                self._postings[field][term][job_id] = value
+
+    def _unindex_job(self, job_id: str):
+        """Drop a job and its postings (no-op when it is not indexed)"""
+        job_features = self._features.pop(job_id, None)
+        self._jobs.pop(job_id, None)
+        if job_features is None:
+            return
+
+        for field in INDEXED_JOB_FIELDS:
+            postings = self._postings[field]
+            for term in job_features[field].indices:
+                postings[term].pop(job_id, None)
+                if not postings[term]:
+                    del postings[term]
+
+    def _stored_mtime(self) -> Optional[float]:
+        """Modification time of the stored jobs file (None if missing)"""
+        try:
+            return os.path.getmtime(self.storage_path)
+        except OSError:
+            return None
+
+    def _read_jobs(self) -> Dict[str, Dict[str, Any]]:
+        """Read the stored open jobs"""
+        try:
+            with open(self.storage_path, "r") as f:
+                return {str(job["id"]): job for job in json.load(f)}
+        except Exception as e:
+            logging.warning(f"⚠️ Could not read job index file: {str(e)}")
+            return {}
+
+    def _write_jobs(self, jobs: List[Dict[str, Any]]):
+        """Persist the open jobs atomically (write a temp file, then rename)"""
+        temp_path = f"{self.storage_path}.{os.getpid()}.tmp"
+        with open(temp_path, "w") as f:
+            json.dump(jobs, f)
+        os.replace(temp_path, self.storage_path)
@@ -0,0 +1,263 @@
+import json
+import os
+from typing import Iterable, List, Tuple
+
+import numpy as np
+import scipy.sparse as sp
+from sklearn.feature_extraction.text import CountVectorizer
+from sklearn.preprocessing import normalize
+
+# Analyzer parameters carried over from a fitted TfidfVectorizer
+ANALYZER_PARAMS = (
+    "lowercase",
+    "strip_accents",
+    "token_pattern",
+    "ngram_range",
+    "stop_words",
+)
+
+
+class MappedTfidfVectorizer:
+    """
+    Fitted TF-IDF model stored as memory-mappable NumPy arrays
+
+    A pickled TfidfVectorizer is unpickled into private memory by every
+    process that loads it. This format keeps the vocabulary as a sorted
+    fixed-width string array (terms are found with a binary search instead
+    of a dict) next to the matching column and IDF arrays, all saved as .npy
+    and opened with mmap_mode="r". Every worker loading the same files then
+    shares the same page-cache pages, and loading does no unpickling.
+
+    Vectors are identical to those of the TfidfVectorizer it was built from.
+    Only the default TF-IDF weighting (raw counts, IDF, L2 norm) is supported.
+    """
+
+    def __init__(
+        self,
+        terms: np.ndarray,
+        columns: np.ndarray,
+        idf: np.ndarray,
+        lowercase: bool = True,
+        strip_accents=None,
+        token_pattern: str = r"(?u)\b\w\w+\b",
+        ngram_range: Tuple[int, int] = (1, 1),
+        stop_words=None,
+    ):
+        self.terms_ = terms
+        self.columns_ = columns
+        self._idf = idf
+        self.lowercase = lowercase
+        self.strip_accents = strip_accents
+        self.token_pattern = token_pattern
+        self.ngram_range = tuple(ngram_range)
+        self.stop_words = stop_words
+        self._dtype = np.dtype(idf.dtype)
+        self._analyzer = "word"
+        self._analyze = None
+        self._idf_diag = None
+
+    @classmethod
+    def from_tfidf(cls, vectorizer) -> "MappedTfidfVectorizer":
+        """Convert a fitted sklearn TfidfVectorizer"""
+        if (
+            vectorizer.sublinear_tf
+            or not vectorizer.use_idf
+            or vectorizer.norm != "l2"
+            or vectorizer.binary
+            or vectorizer.analyzer != "word"
+            or vectorizer.preprocessor is not None
+            or vectorizer.tokenizer is not None
+        ):
+            raise ValueError("Only default word-level TF-IDF models can be mapped")
+
+        terms = sorted(vectorizer.vocabulary_)
+        mapped = cls(
+            terms=np.array(terms, dtype=str),
+            columns=np.array(
+                [vectorizer.vocabulary_[term] for term in terms], dtype=np.int32
+            ),
+            # Full-precision weights, whatever dtype the model counts in
+            idf=np.asarray(vectorizer.idf_),
+            **{param: getattr(vectorizer, param) for param in ANALYZER_PARAMS},
+        )
+        mapped.dtype = vectorizer.dtype
+        return mapped
+
+    @property
+    def idf_(self) -> np.ndarray:
+        return self._idf
+
+    @idf_.setter
+    def idf_(self, value: np.ndarray):
+        self._idf = value
+        self._idf_diag = None
+
+    @property
+    def dtype(self) -> np.dtype:
+        return self._dtype
+
+    @dtype.setter
+    def dtype(self, value):
+        self._dtype = np.dtype(value)
+
+    @property
+    def analyzer(self):
+        """Analyzer ("word", or a callable for pre-analyzed input)"""
+        return self._analyzer
+
+    @analyzer.setter
+    def analyzer(self, value):
+        self._analyzer = value
+        self._analyze = None
+
+    @property
+    def feature_count(self) -> int:
+        return len(self.terms_)
+
+    def transform(self, raw_documents: Iterable[str]):
+        """Vectorize documents into L2-normalized TF-IDF rows (CSR)"""
+        analyze = self._get_analyze()
+
+        features = []
+        lengths = []
+        for document in raw_documents:
+            document_features = analyze(document)
+            features.extend(document_features)
+            lengths.append(len(document_features))
+
+        columns = self._lookup(features)
+        rows = np.repeat(np.arange(len(lengths)), lengths)
+        known = columns >= 0
+
+        counts = sp.csr_matrix(
+            (
+                np.ones(np.count_nonzero(known), dtype=self.dtype),
+                (rows[known], columns[known]),
+            ),
+            shape=(len(lengths), len(self.idf_)),
+        )
+        counts.sum_duplicates()
+        counts.sort_indices()
+
+        # Weighted with the same sparse diagonal product as TfidfTransformer,
+        # which fixes the order of the stored entries (and of every sum over
+        # them) exactly like the pickled model
+        return normalize(counts @ self._get_idf_diag(), norm="l2", copy=False)
+
+    def save(self, directory: str, name: str) -> List[str]:
+        """
+        Write the parameters (JSON) and the term, column and IDF arrays (.npy)
+
+        Returns:
+            File names written inside directory
+        """
+        files = {
+            "terms_file": f"{name}_terms.npy",
+            "columns_file": f"{name}_columns.npy",
+            "idf_file": f"{name}_idf.npy",
+        }
+        params_file = f"{name}.json"
+
+        np.save(os.path.join(directory, files["terms_file"]), self.terms_)
+        np.save(os.path.join(directory, files["columns_file"]), self.columns_)
+        np.save(os.path.join(directory, files["idf_file"]), self.idf_)
+        with open(os.path.join(directory, params_file), "w") as f:
+            json.dump(
+                {
+                    "format": "mapped_tfidf",
+                    "lowercase": self.lowercase,
+                    "strip_accents": self.strip_accents,
+                    "token_pattern": self.token_pattern,
+                    "ngram_range": list(self.ngram_range),
+                    "stop_words": (
+                        self.stop_words
+                        if self.stop_words is None or isinstance(self.stop_words, str)
+                        else sorted(self.stop_words)
+                    ),
+                    **files,
+                },
+                f,
+                indent=2,
+            )
+
+        return [params_file, *files.values()]
+
+    @classmethod
+    def load(
+        cls, directory: str, name: str, mmap: bool = True
+    ) -> "MappedTfidfVectorizer":
+        """
+        Load a vectorizer written by save
+
+        With mmap the arrays are opened read-only with mmap_mode="r" and
+        paged in from the shared page cache on first use.
+        """
+        with open(os.path.join(directory, f"{name}.json"), "r") as f:
+            params = json.load(f)
+
+        mmap_mode = "r" if mmap else None
+        arrays = {
+            key: np.load(os.path.join(directory, params.pop(f"{key}_file")), mmap_mode)
+            for key in ("terms", "columns", "idf")
+        }
+        params.pop("format", None)
+
+        if not len(arrays["terms"]) == len(arrays["columns"]) == len(arrays["idf"]):
+            raise ValueError(f"Arrays of {name} have mismatching lengths")
+        return cls(**arrays, **params)
+
+    def build_preprocessor(self):
+        return self._analyzer_builder().build_preprocessor()
+
+    def build_tokenizer(self):
+        return self._analyzer_builder().build_tokenizer()
+
+    def get_stop_words(self):
+        return self._analyzer_builder().get_stop_words()
+
+    def _lookup(self, features: List[str]) -> np.ndarray:
+        """Column of every feature, -1 for terms outside the vocabulary"""
+        if not features or not len(self.terms_):
+            return np.full(len(features), -1, dtype=np.int64)
+
+        queries = np.array(features, dtype=str)
+        positions = np.searchsorted(self.terms_, queries)
+        positions[positions == len(self.terms_)] = 0
+        found = self.terms_[positions] == queries
+        return np.where(found, self.columns_[positions], -1)
+
+    def _get_idf_diag(self) -> sp.csr_matrix:
+        """
+        IDF weights as a sparse diagonal matrix (built once per process)
+
+        Kept in float64 like the diagonal TfidfTransformer builds when its
+        idf_ is assigned, which is how loaded models get their precision.
+        """
+        if self._idf_diag is None:
+            n_terms = len(self.idf_)
+            self._idf_diag = sp.diags(
+                np.asarray(self.idf_, dtype=np.float64),
+                offsets=0,
+                shape=(n_terms, n_terms),
+                format="csr",
+            )
+        return self._idf_diag
+
+    def _get_analyze(self):
+        if self._analyze is None:
+            self._analyze = (
+                self.analyzer
+                if callable(self.analyzer)
+                else self._analyzer_builder().build_analyzer()
+            )
+        return self._analyze
+
+    def _analyzer_builder(self) -> CountVectorizer:
+        """Unfitted CountVectorizer with the model's analyzer parameters"""
+        return CountVectorizer(
+            lowercase=self.lowercase,
+            strip_accents=self.strip_accents,
+            token_pattern=self.token_pattern,
+            ngram_range=self.ngram_range,
+            stop_words=self.stop_words,
+        )
@@ -0,0 +1,176 @@
+import os
+import threading
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+
+@dataclass(frozen=True)
+class ModelSnapshot:
+    """
+    Immutable view of one trained model
+
+    A snapshot is never modified after it is published: a retrain builds new
+    vectorizers and publishes a new snapshot, so a request holding a snapshot
+    keeps scoring with one consistent model however long it runs.
+    """
+
+    text_vectorizer: Any = None
+    skills_vectorizer: Any = None
+    training_metadata: Mapping[str, Any] = field(
+        default_factory=lambda: MappingProxyType({})
+    )
+    generation: int = 0
+
+    @property
+    def is_trained(self) -> bool:
+        return self.text_vectorizer is not None and self.skills_vectorizer is not None
+
+    @property
+    def model_type(self) -> str:
+        """Type of the model ("tfidf" for models trained before hashing)"""
+        return self.training_metadata.get("model_type", "tfidf")
+
+
+class ModelRegistry:
+    """
+    Process-wide holder of the current model snapshot
+
+    Readers take the current snapshot with a single attribute read and never
+    lock. Publishing builds the new snapshot first and swaps the reference
+    last, so every matcher in the process sees either the old model or the
+    new one, never a mix. Writers (loading, training) serialize on a lock.
+
+    The first load can run on a background thread (start_loading). Callers
+    that need the model wait for it through load_once, while the readiness
+    state reports "loading", then "warming", then "ready".
+    """
+
+    def __init__(self):
+        self._snapshot = ModelSnapshot()
+        self._write_lock = threading.Lock()
+        self._load_lock = threading.Lock()
+        self._prepare_lock = threading.Lock()
+        self._start_lock = threading.Lock()
+        self._loader_thread = None
+        self.loaded = False
+        # Set once the first load and the warm-up have finished
+        self.ready = threading.Event()
+        # Modification time of the on-disk model source last loaded
+        self.source_mtime = None
+
+    def current(self) -> ModelSnapshot:
+        """Snapshot serving requests right now"""
+        return self._snapshot
+
+    def publish(
+        self,
+        text_vectorizer,
+        skills_vectorizer,
+        training_metadata: Optional[Dict[str, Any]] = None,
+    ) -> ModelSnapshot:
+        """
+        Atomically replace the current snapshot
+
+        Returns:
+            The published snapshot
+        """
+        with self._write_lock:
+            snapshot = ModelSnapshot(
+                text_vectorizer=text_vectorizer,
+                skills_vectorizer=skills_vectorizer,
+                training_metadata=MappingProxyType(dict(training_metadata or {})),
+                generation=self._snapshot.generation + 1,
+            )
+            self._snapshot = snapshot
+            self.loaded = True
+            return snapshot
+
+    def clear(self) -> ModelSnapshot:
+        """Publish an untrained snapshot"""
+        return self.publish(None, None)
+
+    def load_once(self, loader) -> ModelSnapshot:
+        """
+        Run loader (which publishes what it loads) unless a model was already
+        loaded or published in this process
+        """
+        with self._load_lock:
+            if not self.loaded:
+                loader()
+                self.loaded = True
+        return self._snapshot
+
+    def prepare(self, loader, warm_up=None) -> ModelSnapshot:
+        """
+        Load the model once, warm it up and mark the registry ready
+
+        Args:
+            loader: Function publishing the stored model (see load_once)
+            warm_up: Optional function run once a trained model is loaded
+        """
+        with self._prepare_lock:
+            if not self.ready.is_set():
+                try:
+                    self.load_once(loader)
+                    if warm_up is not None and self._snapshot.is_trained:
+                        warm_up()
+                finally:
+                    self.ready.set()
+        return self._snapshot
+
+    def start_loading(self, loader, warm_up=None) -> bool:
+        """
+        Run prepare on a daemon thread (once per process)
+
+        Returns:
+            True if this call started the thread
+        """
+        with self._start_lock:
+            if self._loader_thread is not None or self.ready.is_set():
+                return False
+            self._loader_thread = threading.Thread(
+                target=self.prepare,
+                args=(loader, warm_up),
+                name="model-loader",
+                daemon=True,
+            )
+            self._loader_thread.start()
+            return True
+
+    @property
+    def status(self) -> str:
+        """Readiness state ("loading", "warming" or "ready")"""
+        if self.ready.is_set():
+            return "ready"
+        return "warming" if self.loaded else "loading"
+
+    def refresh(self, source_mtime: Optional[float], loader) -> ModelSnapshot:
+        """
+        Run loader (which publishes what it loads) when the model source
+        changed since it was last loaded
+        """
+        if source_mtime == self.source_mtime:
+            return self._snapshot
+
+        with self._load_lock:
+            if source_mtime != self.source_mtime:
+                self.source_mtime = source_mtime
+                loader()
+        return self._snapshot
+
+
+# One registry per model storage directory and vector precision (loaded
+# vectorizers are converted to the precision they serve)
+_registries: Dict[Tuple[str, str], ModelRegistry] = {}
+_registries_lock = threading.Lock()
+
+
+def get_model_registry(storage_path: str, vector_dtype: str) -> ModelRegistry:
+    """Registry shared by every matcher of this process using storage_path"""
+    key = (os.path.realpath(storage_path), vector_dtype)
+    with _registries_lock:
+        registry = _registries.get(key)
+        if registry is None:
+            registry = _registries[key] = ModelRegistry()
+        return registry
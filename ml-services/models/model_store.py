@@ -0,0 +1,205 @@
+import json
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import uuid
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows: activations are only serialized within one process
+    fcntl = None
+
+STATE_FILE = "training_state.json"
+
+
+class ModelStore:
+    """
+    Versioned on-disk store of trained models
+
+    Every training run is written to its own directory under versions/.
+    The files are written into a temporary directory first and renamed into
+    place once complete, so a crash never leaves a partial version behind.
+
+    The active version is named by a small pointer file (current.json) that
+    is replaced atomically. It also records the previously active version
+    for rollback. Readers resolve the pointer and then only read files of a
+    finished version, so a concurrent load in another worker never sees a
+    torn model. Other workers pick up an activation on their next request
+    by watching the pointer's modification time.
+    """
+
+    VERSIONS_DIRNAME = "versions"
+    POINTER = "current.json"
+
+    # Shared by every store of the process (each matcher opens its own)
+    _pointer_lock = threading.Lock()
+
+    def __init__(self, storage_path: str, keep_versions: int = 5):
+        self.storage_path = storage_path
+        self.versions_dir = os.path.join(storage_path, self.VERSIONS_DIRNAME)
+        self.pointer_path = os.path.join(storage_path, self.POINTER)
+        self.lock_path = f"{self.pointer_path}.lock"
+        self.keep_versions = keep_versions
+
+    def new_version_id(self) -> str:
+        """Sortable id of a new version (UTC time plus a random suffix)"""
+        timestamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%fZ")
+        return f"{timestamp}-{uuid.uuid4().hex[:6]}"
+
+    def write_version(self, version_id: str, write_files: Callable[[str], Any]):
+        """
+        Write a new version atomically
+
+        Args:
+            version_id: Id from new_version_id
+            write_files: Function writing the model files into the directory
+                it is given
+        """
+        os.makedirs(self.versions_dir, exist_ok=True)
+        temp_dir = tempfile.mkdtemp(prefix=f".{version_id}.", dir=self.versions_dir)
+        try:
+            write_files(temp_dir)
+            os.rename(temp_dir, self.version_path(version_id))
+        except Exception:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+            raise
+
+    def version_path(self, version_id: str) -> str:
+        return os.path.join(self.versions_dir, version_id)
+
+    def has_version(self, version_id: str) -> bool:
+        return (
+            bool(version_id)
+            and os.path.basename(version_id) == version_id
+            and not version_id.startswith(".")
+            and os.path.isfile(os.path.join(self.version_path(version_id), STATE_FILE))
+        )
+
+    def read_pointer(self) -> Optional[Dict[str, Any]]:
+        """Active and previous version (None before the first versioned model)"""
+        try:
+            with open(self.pointer_path, "r") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logging.warning(f"⚠️ Could not read model version pointer: {str(e)}")
+            return None
+
+    def pointer_mtime(self) -> Optional[float]:
+        """Modification time of the pointer (None if missing)"""
+        try:
+            return os.path.getmtime(self.pointer_path)
+        except OSError:
+            return None
+
+    def active_version(self) -> Optional[str]:
+        pointer = self.read_pointer()
+        return pointer.get("version") if pointer else None
+
+    def activate(self, version_id: str):
+        """Point current.json at a finished version (atomic rename)"""
+        if not self.has_version(version_id):
+            raise FileNotFoundError(f"Model version {version_id} does not exist")
+
+        # Serialized so concurrent activations never lose the previous version
+        with self._exclusive():
+            previous = self.active_version()
+            pointer = {
+                "version": version_id,
+                "previous": previous if previous != version_id else None,
+                "activated_timestamp": datetime.now(timezone.utc).isoformat(),
+            }
+
+            temp_path = f"{self.pointer_path}.{os.getpid()}.{uuid.uuid4().hex}.tmp"
+            try:
+                with open(temp_path, "w") as f:
+                    json.dump(pointer, f, indent=2)
+                os.replace(temp_path, self.pointer_path)
+            except Exception:
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
+                raise
+
+    @contextmanager
+    def _exclusive(self):
+        """Hold the thread lock and the inter-process lock of the pointer file"""
+        with self._pointer_lock:
+            if fcntl is None:
+                yield
+                return
+
+            os.makedirs(self.storage_path, exist_ok=True)
+            with open(self.lock_path, "a") as lock_file:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def list_versions(self) -> List[Dict[str, Any]]:
+        """Summary of every stored version, newest first"""
+        pointer = self.read_pointer() or {}
+        versions = []
+
+        for version_id in self._version_ids():
+            try:
+                with open(
+                    os.path.join(self.version_path(version_id), STATE_FILE), "r"
+                ) as f:
+                    metadata = json.load(f).get("training_metadata", {})
+            except Exception as e:
+                logging.warning(f"⚠️ Unreadable model version {version_id}: {str(e)}")
+                continue
+
+            versions.append(
+                {
+                    "version": version_id,
+                    "active": version_id == pointer.get("version"),
+                    "previous": version_id == pointer.get("previous"),
+                    "model_type": metadata.get("model_type", "tfidf"),
+                    "model_version": metadata.get("model_version"),
+                    "training_timestamp": metadata.get("training_timestamp"),
+                    "valid_samples": metadata.get("valid_samples"),
+                    "vocabulary_size": metadata.get("vocabulary_size"),
+                }
+            )
+
+        return versions
+
+    def prune(self) -> List[str]:
+        """
+        Delete the oldest versions beyond keep_versions
+
+        The active and previous versions are always kept.
+
+        Returns:
+            Ids of the deleted versions
+        """
+        if self.keep_versions <= 0:
+            return []
+
+        pointer = self.read_pointer() or {}
+        protected = {pointer.get("version"), pointer.get("previous")}
+        deleted = []
+
+        for version_id in self._version_ids()[self.keep_versions :]:
+            if version_id in protected:
+                continue
+            shutil.rmtree(self.version_path(version_id), ignore_errors=True)
+            deleted.append(version_id)
+
+        return deleted
+
+    def _version_ids(self) -> List[str]:
+        """Ids of the finished versions, newest first"""
+        try:
+            names = os.listdir(self.versions_dir)
+        except FileNotFoundError:
+            return []
+        return sorted((name for name in names if self.has_version(name)), reverse=True)
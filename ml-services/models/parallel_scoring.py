@@ -0,0 +1,220 @@
+import logging
+import math
+import multiprocessing
+import os
+import signal
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from models.ranking import TopKSelector
+
+# Matcher inherited by forked workers. It is only set while the pool forks
+# its workers, so they reuse the parent's loaded vectorizers instead of
+# receiving a pickled copy with every task.
+_worker_matcher = None
+
+# Scoring workers of this process, forked once and reused by every request
+_executor = None
+_executor_pid = None
+_executor_warned = False
+
+# Guards creating (and replacing) the pool of this process
+_pool_lock = threading.Lock()
+
+
+def fork_available() -> bool:
+    """Check whether worker processes can be forked on this platform"""
+    return "fork" in multiprocessing.get_all_start_methods()
+
+
+def start_worker_pool(matcher, workers: int) -> bool:
+    """
+    Fork the scoring workers of this process unless they are running
+
+    Call it while the process has a single thread (a gunicorn post_fork
+    hook, before any background thread starts); a fork copies the locks
+    held by other threads, which can deadlock the child.
+
+    Returns:
+        True when the pool is running
+    """
+    with _pool_lock:
+        return _ensure_pool(matcher, workers) is not None
+
+
+def _ensure_pool(matcher, workers: int) -> Optional[ProcessPoolExecutor]:
+    """Pool of this process, forked now if that is safe, else None"""
+    global _executor, _executor_pid, _executor_warned, _worker_matcher
+
+    # A pool inherited from a parent process has no manager thread here
+    if _executor is not None and _executor_pid == os.getpid():
+        return _executor
+
+    if threading.active_count() > 1:
+        if not _executor_warned:
+            logging.warning(
+                "⚠️ Scoring workers can only be forked while the process is single-threaded; scoring in-process"
+            )
+            _executor_warned = True
+        return None
+
+    _worker_matcher = matcher
+    try:
+        executor = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("fork"),
+            initializer=_init_worker,
+        )
+        # The first task forks every worker, before the pool starts its own
+        # management threads
+        executor.submit(os.getpid).result()
+    finally:
+        _worker_matcher = None
+
+    _executor, _executor_pid = executor, os.getpid()
+    logging.info(f"⚡ Started {workers} scoring worker processes")
+    return executor
+
+
+def _discard_pool(executor: ProcessPoolExecutor):
+    """Drop a broken pool so the next run can fork a new one"""
+    global _executor
+
+    with _pool_lock:
+        if _executor is executor:
+            _executor = None
+    executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _init_worker():
+    """Prepare the matcher inherited by a freshly forked worker"""
+    # Die on termination signals instead of running the server's handlers
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    signal.signal(signal.SIGINT, signal.SIG_DFL)
+    _worker_matcher._reset_worker_state()
+
+
+def _score_shard(
+    model_fingerprint: str,
+    job_data: Dict[str, Any],
+    applications: List[Dict[str, Any]],
+    offset: int,
+    record: bool,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, Dict[str, Any], Optional[Tuple]]:
+    """
+    Score one shard in a worker and return its top-K as plain arrays
+
+    The worker outlives model changes in the parent, so it first switches
+    to the active model version and refuses to score with any other model
+    than the parent's. When record is set, the component rows and positions
+    of every scored candidate are returned too (candidate records are
+    rebuilt by the parent).
+    """
+    _worker_matcher.sync_model_version()
+    if _worker_matcher._model_fingerprint() != model_fingerprint:
+        raise RuntimeError("Scoring worker does not have the request's model")
+
+    recorded = [] if record else None
+    selector = _worker_matcher._select_top_k(job_data, applications, offset, recorded)
+
+    # Workers exit without running atexit hooks; commit queued scores first
+    if _worker_matcher.score_cache is not None:
+        _worker_matcher.score_cache.flush()
+
+    shard_components = None
+    if recorded is not None:
+        shard_components = (
+            np.vstack(
+                [np.empty((0, len(_worker_matcher.weights)))]
+                + [rows for rows, _, _ in recorded]
+            ),
+            np.concatenate(
+                [np.empty(0, dtype=np.int64)] + [chunk for _, chunk, _ in recorded]
+            ),
+        )
+
+    return (*selector.arrays(), selector.stats(), shard_components)
+
+
+def parallel_select_top_k(
+    matcher,
+    job_data: Dict[str, Any],
+    applications: List[Dict[str, Any]],
+    workers: int,
+    recorded: Optional[List[Tuple]] = None,
+) -> Optional[TopKSelector]:
+    """
+    Shard applications across the scoring workers and merge their top-K
+
+    Each worker scores its shard with the vectorizers inherited from the
+    parent and returns only its K best scores, component rows and positions.
+    The parent merges those into the final selection, so the merged ranking
+    (including tie-breaking by submission order) matches in-process scoring.
+
+    Args:
+        matcher: Trained CandidateMatcher to inherit in the workers
+        job_data: Job information and requirements
+        applications: Applications to score
+        workers: Number of worker processes
+        recorded: Optional list extended with the component rows, positions
+            and candidate records of every scored application
+
+    Returns:
+        TopKSelector holding the merged top candidates, or None when this
+        process has no scoring workers and cannot safely fork them
+    """
+    with _pool_lock:
+        executor = _ensure_pool(matcher, workers)
+    if executor is None:
+        return None
+
+    shard_size = math.ceil(len(applications) / workers)
+    selector = TopKSelector(matcher.config.MAX_CANDIDATES, len(matcher.weights))
+    model_fingerprint = matcher._model_fingerprint()
+
+    try:
+        futures = [
+            executor.submit(
+                _score_shard,
+                model_fingerprint,
+                job_data,
+                applications[start : start + shard_size],
+                start,
+                recorded is not None,
+            )
+            for start in range(0, len(applications), shard_size)
+        ]
+        shards = [future.result() for future in futures]
+    except BrokenProcessPool:
+        _discard_pool(executor)
+        raise
+
+    for scores, components, positions, shard_stats, shard_components in shards:
+        selector.merge_stats(shard_stats)
+        if recorded is not None:
+            shard_rows, shard_positions = shard_components
+            recorded.append(
+                (
+                    shard_rows,
+                    shard_positions,
+                    [
+                        matcher._application_record(applications[position])
+                        for position in shard_positions
+                    ],
+                )
+            )
+        selector.push(
+            scores,
+            components,
+            [applications[position] for position in positions],
+            positions,
+        )
+
+    logging.info(
+        f"⚡ Scored {len(applications)} applications across {len(futures)} worker shards"
+    )
+    return selector
@@ -0,0 +1,123 @@
+from collections import defaultdict
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+
+class TopKSelector:
+    """
+    Keep the K best scored items seen across chunks of a candidate pool
+
+    Items are ranked by their score rounded to 3 decimals (highest first), and
+    items with equal rounded scores keep their submission order, which is the
+    same ranking a full stable sort of the pool would produce. Only K scores,
+    component rows and items are retained between chunks, so memory grows with
+    K rather than with the size of the pool.
+    """
+
+    def __init__(self, k: int, n_components: int):
+        self.k = max(0, int(k))
+        self.seen = 0
+        self.skipped = defaultdict(int)  # stage -> items ruled out unscored
+        self.counts = defaultdict(int)  # name -> other per-item counters
+        self.timings = defaultdict(float)  # stage -> seconds spent
+        self._scores = np.empty(0)
+        self._positions = np.empty(0, dtype=np.int64)
+        self._components = np.empty((0, n_components))
+        self._items = []
+
+    @property
+    def is_full(self) -> bool:
+        """Whether K items have been selected so far"""
+        return len(self._items) >= self.k
+
+    @property
+    def threshold(self) -> float:
+        """Rounded score of the current K-th best item (-inf until K items are kept)"""
+        if not self.is_full or self.k == 0:
+            return float("-inf")
+        return float(np.round(self._scores[-1], 3))
+
+    def skip(self, count: int, stage: str):
+        """Count items that a stage (e.g. "filtered", "pruned") ruled out unscored"""
+        self.seen += count
+        self.skipped[stage] += count
+
+    def stats(self) -> Dict[str, Any]:
+        """Get the counters and stage timings of the selection"""
+        return {
+            "skipped": dict(self.skipped),
+            "counts": dict(self.counts),
+            "timings": dict(self.timings),
+        }
+
+    def merge_stats(self, stats: Dict[str, Any]):
+        """
+        Add the counters and timings of another selection (e.g. a worker shard)
+        """
+        for stage, count in stats["skipped"].items():
+            self.skipped[stage] += count
+        for name, count in stats["counts"].items():
+            self.counts[name] += count
+        for stage, seconds in stats["timings"].items():
+            self.timings[stage] += seconds
+
+    def push(
+        self,
+        scores: np.ndarray,
+        components: np.ndarray,
+        items: List[Any],
+        positions: np.ndarray,
+    ):
+        """
+        Merge a scored chunk into the running top-K
+
+        Args:
+            scores: Total score of every item in the chunk
+            components: Score component rows matching scores
+            items: Chunk items (e.g. applications) matching scores
+            positions: Submission position of every item, used to break ties
+        """
+        self.seen += len(items)
+        if self.k == 0 or len(items) == 0:
+            return
+
+        rounded = np.round(scores, 3)
+
+        # Cheap preselection: only items at or above the chunk's K-th best
+        # rounded score can make it into the merged top-K
+        if len(rounded) > self.k:
+            kth_best = np.partition(rounded, len(rounded) - self.k)[
+                len(rounded) - self.k
+            ]
+            keep = np.flatnonzero(rounded >= max(kth_best, self.threshold))
+        else:
+            keep = np.flatnonzero(rounded >= self.threshold)
+
+        if len(keep) == 0:
+            return
+
+        merged_scores = np.concatenate([self._scores, scores[keep]])
+        merged_positions = np.concatenate([self._positions, positions[keep]])
+        merged_components = np.vstack([self._components, components[keep]])
+        merged_items = self._items + [items[idx] for idx in keep]
+
+        order = np.lexsort((merged_positions, -np.round(merged_scores, 3)))[: self.k]
+
+        self._scores = merged_scores[order]
+        self._positions = merged_positions[order]
+        self._components = merged_components[order]
+        self._items = [merged_items[idx] for idx in order]
+
+    def arrays(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Get the selected (scores, component rows, positions) as arrays, best first"""
+        return self._scores, self._components, self._positions
+
+    def results(self) -> List[Tuple[float, np.ndarray, Any]]:
+        """Get the selected (score, components, item) tuples, best first"""
+        return [
+            (float(score), components, item)
+            for score, components, item in zip(
+                self._scores, self._components, self._items
+            )
+        ]
@@ -0,0 +1,221 @@
+import atexit
+import logging
+import os
+import queue
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from typing import Dict, Iterable, List, Tuple
+
+import numpy as np
+
+# SQLite allows at most 999 bound parameters per statement on older builds
+LOOKUP_BATCH_SIZE = 500
+
+# Score caches of this process, one per storage directory
+_caches: Dict[str, "ScoreCache"] = {}
+_caches_lock = threading.Lock()
+
+
+class ScoreCache:
+    """
+    Disk-backed cache of component scores per (job, resume) pair
+
+    Rows are keyed by (job content hash, resume content hash, model
+    fingerprint) and hold the raw component scores as a float64 blob, so
+    cached candidates rank exactly like freshly scored ones. Components do
+    not depend on the scoring weights, which are applied after the lookup,
+    so a weight change keeps the cache warm. The SQLite file lives under the
+    model storage path and survives restarts.
+
+    Lookups read the whole application list in a few IN queries. Writes are
+    queued and committed in batches by a background thread, so storing
+    scores never adds to request latency.
+    """
+
+    FILENAME = "score_cache.sqlite3"
+
+    def __init__(self, storage_path: str, max_age_days: float = 30):
+        self.path = os.path.join(storage_path, self.FILENAME)
+        self.max_age_seconds = max_age_days * 24 * 3600
+        # Process that owns the connections and the writer thread
+        self.pid = os.getpid()
+        self.hits = 0
+        self.misses = 0
+
+        self._local = threading.local()
+        self._queue = queue.Queue()
+        self._stats_lock = threading.Lock()
+
+        with closing(self._connect()) as connection, connection:
+            connection.execute("""
+                CREATE TABLE IF NOT EXISTS component_scores (
+                    job_hash TEXT NOT NULL,
+                    resume_hash TEXT NOT NULL,
+                    model_fingerprint TEXT NOT NULL,
+                    components BLOB NOT NULL,
+                    created_at REAL NOT NULL,
+                    PRIMARY KEY (job_hash, resume_hash, model_fingerprint)
+                ) WITHOUT ROWID
+                """)
+
+        self._writer = threading.Thread(
+            target=self._write_loop, name="score-cache-writer", daemon=True
+        )
+        self._writer.start()
+        atexit.register(self.flush)
+
+    def get_many(
+        self,
+        job_hash: str,
+        resume_hashes: Iterable[str],
+        model_fingerprint: str,
+    ) -> Dict[str, np.ndarray]:
+        """
+        Look up the cached component scores of many resumes for one job
+
+        Returns:
+            Dictionary of resume hash -> component score array for the hits
+        """
+        unique_hashes = list(dict.fromkeys(resume_hashes))
+        found = {}
+
+        try:
+            connection = self._reader()
+            for start in range(0, len(unique_hashes), LOOKUP_BATCH_SIZE):
+                batch = unique_hashes[start : start + LOOKUP_BATCH_SIZE]
+                rows = connection.execute(
+                    "SELECT resume_hash, components FROM component_scores "
+                    "WHERE job_hash = ? AND model_fingerprint = ? "
+                    f"AND resume_hash IN ({', '.join('?' * len(batch))})",
+                    (job_hash, model_fingerprint, *batch),
+                ).fetchall()
+                for resume_hash, components in rows:
+                    found[resume_hash] = np.frombuffer(components, dtype=np.float64)
+        except sqlite3.Error as e:
+            logging.warning(f"⚠️ Score cache lookup failed: {str(e)}")
+
+        with self._stats_lock:
+            self.hits += len(found)
+            self.misses += len(unique_hashes) - len(found)
+
+        return found
+
+    def put_many(
+        self,
+        job_hash: str,
+        entries: List[Tuple[str, np.ndarray]],
+        model_fingerprint: str,
+    ):
+        """Queue (resume hash, component scores) pairs for a background write"""
+        if not entries:
+            return
+
+        created_at = time.time()
+        self._queue.put(
+            [
+                (
+                    job_hash,
+                    resume_hash,
+                    model_fingerprint,
+                    np.asarray(components, dtype=np.float64).tobytes(),
+                    created_at,
+                )
+                for resume_hash, components in entries
+            ]
+        )
+
+    def flush(self):
+        """Block until every queued write has been committed"""
+        self._queue.join()
+
+    def expire(self) -> int:
+        """
+        Delete rows older than the maximum age
+
+        Scores of replaced models and of jobs or resumes that changed are
+        never read again, so age is the only eviction needed.
+
+        Returns:
+            Number of deleted rows
+        """
+        try:
+            with closing(self._connect()) as connection, connection:
+                return connection.execute(
+                    "DELETE FROM component_scores WHERE created_at < ?",
+                    (time.time() - self.max_age_seconds,),
+                ).rowcount
+        except sqlite3.Error as e:
+            logging.warning(f"⚠️ Score cache cleanup failed: {str(e)}")
+            return 0
+
+    def stats(self) -> Dict[str, int]:
+        """Get lookup counters and the number of pending writes"""
+        with self._stats_lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+                "pending_writes": self._queue.qsize(),
+            }
+
+    def _write_loop(self):
+        """Commit queued rows, merging everything pending into one transaction"""
+        connection = self._connect()
+
+        while True:
+            batches = [self._queue.get()]
+            while True:
+                try:
+                    batches.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            try:
+                with connection:
+                    connection.executemany(
+                        "INSERT OR REPLACE INTO component_scores VALUES (?, ?, ?, ?, ?)",
+                        [row for batch in batches for row in batch],
+                    )
+            except sqlite3.Error as e:
+                logging.warning(f"⚠️ Score cache write failed: {str(e)}")
+            finally:
+                for _ in batches:
+                    self._queue.task_done()
+
+    def _reader(self) -> sqlite3.Connection:
+        """Connection of the current thread (SQLite connections are per thread)"""
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = self._connect()
+            self._local.connection = connection
+        return connection
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection that lets readers and the writer work concurrently"""
+        connection = sqlite3.connect(self.path, timeout=30)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        return connection
+
+
+def get_score_cache(storage_path: str, max_age_days: float = 30) -> ScoreCache:
+    """
+    Score cache shared by every matcher of this process using storage_path
+
+    One cache means one writer thread and one exit flush per process. A
+    cache inherited through fork is replaced, since its SQLite connections
+    and writer thread do not survive the fork. Expired rows are deleted when
+    a cache is opened.
+    """
+    key = os.path.realpath(storage_path)
+    with _caches_lock:
+        cache = _caches.get(key)
+        if cache is None or cache.pid != os.getpid():
+            cache = _caches[key] = ScoreCache(storage_path, max_age_days)
+            expired = cache.expire()
+            if expired:
+                logging.info(f"🧹 Expired {expired} cached score rows")
+        return cache
@@ -0,0 +1,54 @@
+import numpy as np
+import scipy.sparse as sp
+
+# Similarity kernels for L2-normalized CSR rows
+#
+# Cosine similarity of normalized rows is a plain dot product, so these skip
+# the input validation and re-normalization of sklearn's cosine_similarity.
+# Every kernel sums the products in the stored order of the left operand's
+# nonzeros, like a scipy CSR product, so a pair gets bit-identical scores
+# whether it is scored alone (1x1), against a pool (1xN) or in a matrix (MxN).
+
+
+def row_similarity(row: sp.csr_matrix, other: sp.csr_matrix) -> float:
+    """
+    Similarity of two normalized single-row CSR matrices (1x1)
+
+    Matches the overlapping columns with a binary search instead of building
+    a sparse product.
+    """
+    if not other.has_sorted_indices:
+        other = other.sorted_indices()
+
+    indices = row.indices[row.indptr[0] : row.indptr[1]]
+    other_indices = other.indices[other.indptr[0] : other.indptr[1]]
+    if not len(indices) or not len(other_indices):
+        return 0.0
+
+    positions = np.searchsorted(other_indices, indices)
+    positions[positions == len(other_indices)] = 0
+    shared = other_indices[positions] == indices
+    if not shared.any():
+        return 0.0
+
+    products = row.data[row.indptr[0] : row.indptr[1]][shared] * (
+        other.data[other.indptr[0] : other.indptr[1]][positions[shared]]
+    )
+    # cumsum adds strictly left to right, like the CSR product loop
+    return float(np.cumsum(products)[-1])
+
+
+def rows_similarity(matrix: sp.csr_matrix, row: sp.csr_matrix) -> np.ndarray:
+    """
+    Similarity of every normalized row in matrix against one normalized row (1xN)
+
+    The row is densified once so the product is a single CSR mat-vec.
+    """
+    return matrix @ row.toarray().ravel()
+
+
+def pairwise_similarity(rows: sp.csr_matrix, columns: sp.csr_matrix) -> np.ndarray:
+    """
+    Similarity of every normalized row against every normalized column row (MxN)
+    """
+    return (rows @ columns.T).toarray()
@@ -0,0 +1,83 @@
+from collections import deque
+from typing import Iterable, Set
+
+
+class SkillAutomaton:
+    """
+    Aho-Corasick automaton for finding many skills in a text in one pass
+
+    Built once over a set of lowercase skill patterns, it scans a requirements
+    string a single time and reports every pattern that occurs in it as a
+    substring - the same answer as running `skill in text` for each skill.
+    """
+
+    def __init__(self, patterns: Iterable[str]):
+        self.patterns = set(patterns)
+
+        # Trie nodes: outgoing edges, failure link and patterns ending here
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [set()]
+
+        for pattern in self.patterns:
+            if pattern:
+                self._add_pattern(pattern)
+
+        self._build_failure_links()
+
+    def _add_pattern(self, pattern: str):
+        """Insert a pattern into the trie"""
+        node = 0
+        for char in pattern:
+            next_node = self._goto[node].get(char)
+            if next_node is None:
+                next_node = len(self._goto)
+                self._goto[node][char] = next_node
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append(set())
+            node = next_node
+        self._output[node].add(pattern)
+
+    def _build_failure_links(self):
+        """Link every node to its longest proper suffix in the trie (BFS order)"""
+        queue = deque(self._goto[0].values())
+
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                queue.append(child)
+
+                fallback = self._fail[node]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[child] = self._goto[fallback].get(char, 0)
+
+                # Patterns that are suffixes of this one also end here
+                self._output[child] |= self._output[self._fail[child]]
+
+    def find_all(self, text: str) -> Set[str]:
+        """
+        Find every pattern that occurs in text
+
+        Args:
+            text: Lowercase text to scan
+
+        Returns:
+            Set of matched patterns
+        """
+        matched = set()
+
+        # Like `"" in text`, the empty pattern matches any text
+        if "" in self.patterns:
+            matched.add("")
+
+        node = 0
+        for char in text:
+            while node and char not in self._goto[node]:
+                node = self._fail[node]
+            node = self._goto[node].get(char, 0)
+            if self._output[node]:
+                matched |= self._output[node]
+
+        return matched
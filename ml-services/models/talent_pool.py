@@ -0,0 +1,364 @@
+import json
+import logging
+import os
+import shutil
+import threading
+import uuid
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import scipy.sparse as sp
+
+try:
+    import fcntl
+except ImportError:  # Windows: writers are only serialized within one process
+    fcntl = None
+
+# Resume vector fields stored per block (keys of the resume feature dicts)
+POOL_VECTOR_FIELDS = ("experience", "education", "skills", "combined")
+
+
+class TalentPoolIndex:
+    """
+    Persistent index of past applicants for matching new jobs without resumes
+
+    The pool is stored under the model storage path as a list of blocks.
+    Each block holds up to block_size applications: one normalized CSR
+    matrix per resume field (.npz), the has_text flags (.npy) and the
+    application records (.json) acting as the id map of the block's rows.
+
+    Appends fill the last block and then open new ones. Re-adding an
+    application id supersedes its earlier row; superseded rows stay on disk
+    until the pool is rebuilt, which happens automatically when the model
+    that produced the vectors changes. The manifest is replaced atomically,
+    so other workers pick up a consistent pool on their next query.
+
+    Workers share the pool, so every change (and every reload of changed
+    blocks) holds an exclusive lock on a file in the pool directory and
+    starts from the manifest as stored, never from this worker's copy.
+    """
+
+    DIRNAME = "talent_pool"
+    MANIFEST = "manifest.json"
+    LOCK_FILE = ".lock"
+
+    def __init__(self, storage_path: str, block_size: int):
+        self.root = os.path.join(storage_path, self.DIRNAME)
+        self.manifest_path = os.path.join(self.root, self.MANIFEST)
+        self.lock_path = os.path.join(self.root, self.LOCK_FILE)
+        self.block_size = max(1, block_size)
+        self.model_fingerprint = None
+
+        self._blocks = []  # loaded blocks: name, records, features
+        self._locations = {}  # application id -> (block position, row)
+        self._loaded_mtime = None
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._locations)
+
+    def sync(self, vectorize_resumes: Callable, model_fingerprint: str):
+        """
+        Bring the pool up to date with the stored blocks and the loaded model
+
+        Reloads blocks written by another worker and re-vectorizes the whole
+        pool when the model fingerprint changed since the vectors were stored.
+
+        Args:
+            vectorize_resumes: Function turning resumes into resume features
+            model_fingerprint: Fingerprint of the currently loaded model
+        """
+        with self._lock:
+            if self._stored_mtime() == self._loaded_mtime and (
+                not self._blocks or self.model_fingerprint == model_fingerprint
+            ):
+                self.model_fingerprint = model_fingerprint
+                return
+
+        with self._exclusive():
+            self._sync_locked(vectorize_resumes, model_fingerprint)
+
+    def refresh(self):
+        """Reload blocks written by another worker (no re-vectorization)"""
+        with self._lock:
+            if self._stored_mtime() == self._loaded_mtime:
+                return
+
+        with self._exclusive():
+            self._reload()
+
+    def append(
+        self,
+        applications: List[Dict[str, Any]],
+        vectorize_resumes: Callable,
+        model_fingerprint: str,
+    ) -> int:
+        """
+        Vectorize applications and append them to the pool
+
+        The pool is synced first (under the same lock), so the append builds
+        on the blocks as stored, including those of other workers.
+
+        Args:
+            applications: Applications with candidate and resume data
+            vectorize_resumes: Function turning resumes into resume features
+            model_fingerprint: Fingerprint of the currently loaded model
+
+        Returns:
+            Number of applications in the pool after the append
+        """
+        with self._exclusive():
+            if not self._sync_locked(vectorize_resumes, model_fingerprint):
+                raise RuntimeError("The stored talent pool could not be loaded")
+
+            blocks = list(self._blocks)
+            replaced = None
+            records = list(applications)
+
+            # Top up a partially filled last block before opening new ones
+            if blocks and len(blocks[-1]["records"]) < self.block_size:
+                replaced = blocks.pop()
+                room = self.block_size - len(replaced["records"])
+                head, records = records[:room], records[room:]
+                blocks.append(
+                    self._write_block(
+                        replaced["records"] + head,
+                        self._concat_features(
+                            replaced["features"],
+                            self._vectorize(head, vectorize_resumes),
+                        ),
+                    )
+                )
+
+            for start in range(0, len(records), self.block_size):
+                chunk = records[start : start + self.block_size]
+                blocks.append(
+                    self._write_block(chunk, self._vectorize(chunk, vectorize_resumes))
+                )
+
+            self._commit(blocks, self.model_fingerprint)
+            if replaced is not None:
+                self._delete_block(replaced["name"])
+
+            logging.info(
+                f"🗃️ Added {len(applications)} applications to the talent pool ({len(self)} total)"
+            )
+            return len(self)
+
+    def blocks(
+        self,
+    ) -> List[Tuple[List[Dict[str, Any]], Dict[str, Any], np.ndarray, int]]:
+        """
+        Snapshot of the stored blocks for scoring
+
+        Returns:
+            List of (records, resume features, live row mask, position of the
+            block's first row) tuples, in insertion order
+        """
+        with self._lock:
+            snapshot = []
+            offset = 0
+            for block in self._blocks:
+                snapshot.append(
+                    (block["records"], block["features"], block["live"], offset)
+                )
+                offset += len(block["records"])
+            return snapshot
+
+    def stats(self) -> Dict[str, Any]:
+        """Size of the pool on disk"""
+        with self._lock:
+            stored_rows = sum(len(block["records"]) for block in self._blocks)
+            return {
+                "applications": len(self),
+                "blocks": len(self._blocks),
+                "superseded_rows": stored_rows - len(self),
+                "model_fingerprint": self.model_fingerprint,
+            }
+
+    @contextmanager
+    def _exclusive(self):
+        """Hold the thread lock and the pool's inter-process file lock"""
+        with self._lock:
+            if fcntl is None:
+                yield
+                return
+
+            os.makedirs(self.root, exist_ok=True)
+            with open(self.lock_path, "a") as lock_file:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _sync_locked(self, vectorize_resumes: Callable, model_fingerprint: str) -> bool:
+        """
+        sync, with the locks held
+
+        Returns:
+            False when the stored blocks could not be loaded
+        """
+        if not self._reload():
+            return False
+
+        if self._blocks and self.model_fingerprint != model_fingerprint:
+            self._rebuild(vectorize_resumes, model_fingerprint)
+
+        self.model_fingerprint = model_fingerprint
+        return True
+
+    def _reload(self) -> bool:
+        """
+        Load the stored manifest and blocks if they changed, with the locks held
+
+        Returns:
+            False when the stored blocks could not be loaded (the previous
+            snapshot is kept)
+        """
+        mtime = self._stored_mtime()
+        if mtime == self._loaded_mtime:
+            return True
+
+        manifest = self._read_manifest() if mtime is not None else None
+        if manifest is None:
+            self._set_blocks([])
+            self.model_fingerprint = None
+        else:
+            try:
+                blocks = [self._read_block(name) for name in manifest["blocks"]]
+            except Exception as e:
+                logging.warning(f"⚠️ Could not load talent pool blocks: {str(e)}")
+                return False
+            self._set_blocks(blocks)
+            self.model_fingerprint = manifest["model_fingerprint"]
+
+        self._loaded_mtime = mtime
+        return True
+
+    def _rebuild(self, vectorize_resumes: Callable, model_fingerprint: str):
+        """Re-vectorize every live application with the current model"""
+        records = [
+            record
+            for block in self._blocks
+            for record, live in zip(block["records"], block["live"])
+            if live
+        ]
+        old_names = [block["name"] for block in self._blocks]
+
+        blocks = [
+            self._write_block(chunk, self._vectorize(chunk, vectorize_resumes))
+            for chunk in (
+                records[start : start + self.block_size]
+                for start in range(0, len(records), self.block_size)
+            )
+        ]
+        self._commit(blocks, model_fingerprint)
+        for name in old_names:
+            self._delete_block(name)
+
+        logging.info(
+            f"🗃️ Talent pool re-vectorized for the current model ({len(records)} applications)"
+        )
+
+    def _set_blocks(self, blocks: List[Dict[str, Any]]):
+        """Install loaded blocks and rebuild the id map (later rows win)"""
+        locations = {}
+        for position, block in enumerate(blocks):
+            for row, record in enumerate(block["records"]):
+                locations[str(record["id"])] = (position, row)
+
+        for block in blocks:
+            block["live"] = np.zeros(len(block["records"]), dtype=bool)
+        for position, row in locations.values():
+            blocks[position]["live"][row] = True
+
+        self._blocks = blocks
+        self._locations = locations
+
+    def _commit(self, blocks: List[Dict[str, Any]], model_fingerprint: str):
+        """Point the manifest at a new list of blocks"""
+        os.makedirs(self.root, exist_ok=True)
+        temp_path = f"{self.manifest_path}.{os.getpid()}.tmp"
+        with open(temp_path, "w") as f:
+            json.dump(
+                {
+                    "model_fingerprint": model_fingerprint,
+                    "blocks": [block["name"] for block in blocks],
+                },
+                f,
+            )
+        os.replace(temp_path, self.manifest_path)
+
+        self._set_blocks(blocks)
+        self.model_fingerprint = model_fingerprint
+        self._loaded_mtime = self._stored_mtime()
+
+    def _vectorize(
+        self, records: List[Dict[str, Any]], vectorize_resumes: Callable
+    ) -> Dict[str, Any]:
+        """Resume features of a list of application records"""
+        return vectorize_resumes([record.get("resume") or {} for record in records])
+
+    def _concat_features(
+        self, first: Dict[str, Any], second: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Stack the rows of two resume feature dicts"""
+        features = {
+            field: sp.vstack([first[field], second[field]], format="csr")
+            for field in POOL_VECTOR_FIELDS
+        }
+        features["has_text"] = np.concatenate([first["has_text"], second["has_text"]])
+        return features
+
+    def _write_block(
+        self, records: List[Dict[str, Any]], features: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Write a new block directory and return it as a loaded block"""
+        name = f"block_{uuid.uuid4().hex[:12]}"
+        block_path = os.path.join(self.root, name)
+        os.makedirs(block_path)
+
+        for field in POOL_VECTOR_FIELDS:
+            sp.save_npz(os.path.join(block_path, f"{field}.npz"), features[field])
+        np.save(os.path.join(block_path, "has_text.npy"), features["has_text"])
+        with open(os.path.join(block_path, "records.json"), "w") as f:
+            json.dump(records, f)
+
+        return {"name": name, "records": records, "features": features}
+
+    def _read_block(self, name: str) -> Dict[str, Any]:
+        """Load a stored block"""
+        block_path = os.path.join(self.root, name)
+
+        with open(os.path.join(block_path, "records.json"), "r") as f:
+            records = json.load(f)
+
+        features = {
+            field: sp.load_npz(os.path.join(block_path, f"{field}.npz")).tocsr()
+            for field in POOL_VECTOR_FIELDS
+        }
+        features["has_text"] = np.load(os.path.join(block_path, "has_text.npy"))
+
+        return {"name": name, "records": records, "features": features}
+
+    def _delete_block(self, name: str):
+        """Remove a block that is no longer referenced by the manifest"""
+        shutil.rmtree(os.path.join(self.root, name), ignore_errors=True)
+
+    def _stored_mtime(self) -> Optional[float]:
+        """Modification time of the stored manifest (None if missing)"""
+        try:
+            return os.path.getmtime(self.manifest_path)
+        except OSError:
+            return None
+
+    def _read_manifest(self) -> Optional[Dict[str, Any]]:
+        """Read the stored manifest"""
+        try:
+            with open(self.manifest_path, "r") as f:
+                return json.load(f)
+        except Exception as e:
+            logging.warning(f"⚠️ Could not read talent pool manifest: {str(e)}")
+            return None
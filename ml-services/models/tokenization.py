@@ -0,0 +1,135 @@
+import copy
+import threading
+from collections import OrderedDict
+from typing import List, Sequence, Tuple
+
+
+def _pre_analyzed(features: List[str]) -> List[str]:
+    """Analyzer for documents that are already lists of n-gram features"""
+    return features
+
+
+class SharedAnalyzer:
+    """
+    Memoized, part-wise analyzer of one fitted vectorizer
+
+    Splits the vectorizer's analyzer (preprocess, tokenize, drop stop words,
+    build n-grams) so each distinct text is analyzed once and its token
+    stream reused wherever the text appears: a resume's experience is
+    analyzed for its own vector and reused inside the combined resume text,
+    and repeated job requirements, industries or companies are analyzed once
+    per process.
+
+    Documents are sequences of parts that the vectorizer would otherwise see
+    joined with spaces. Their features are the memoized features of every
+    part plus the n-grams spanning part boundaries, which is the same
+    multiset of features the vectorizer's own analyzer produces for the
+    joined text, so the vectors are identical.
+    """
+
+    def __init__(self, vectorizer, max_entries: int = 10000):
+        self.vectorizer = vectorizer
+        self.max_entries = max_entries
+        self.min_n, self.max_n = vectorizer.ngram_range
+        self.hits = 0
+        self.misses = 0
+
+        self._preprocess = vectorizer.build_preprocessor()
+        self._tokenize = vectorizer.build_tokenizer()
+        self._stop_words = vectorizer.get_stop_words()
+
+        # Same fitted model, fed with features instead of raw text
+        self._transformer = copy.copy(vectorizer)
+        self._transformer.analyzer = _pre_analyzed
+
+        self._memo = OrderedDict()  # text -> (filtered tokens, n-gram features)
+        self._lock = threading.Lock()
+
+    def transform(self, documents: Sequence[Sequence[str]]):
+        """
+        Vectorize documents given as lists of text parts
+
+        Returns:
+            The vectorizer's sparse output for the space-joined parts
+        """
+        return self._transformer.transform(
+            [self.features(parts) for parts in documents]
+        )
+
+    def features(self, parts: Sequence[str]) -> List[str]:
+        """N-gram features of the space-joined parts"""
+        analyzed = [self._analyze_part(part) for part in parts]
+        if len(analyzed) == 1:
+            return list(analyzed[0][1])
+
+        features = []
+        for _, part_features in analyzed:
+            features.extend(part_features)
+
+        if self.max_n > 1:
+            features.extend(
+                self._boundary_ngrams([tokens for tokens, _ in analyzed if tokens])
+            )
+        return features
+
+    def stats(self):
+        """Memo hit/miss counters"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._memo),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            }
+
+    def _analyze_part(self, text: str) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+        """Filtered tokens and n-gram features of one text, memoized"""
+        with self._lock:
+            entry = self._memo.get(text)
+            if entry is not None:
+                self._memo.move_to_end(text)
+                self.hits += 1
+                return entry
+            self.misses += 1
+
+        tokens = self._tokenize(self._preprocess(text))
+        if self._stop_words is not None:
+            tokens = [token for token in tokens if token not in self._stop_words]
+        entry = (tuple(tokens), tuple(self._ngrams(tokens, self.min_n)))
+
+        with self._lock:
+            self._memo[text] = entry
+            while len(self._memo) > self.max_entries:
+                self._memo.popitem(last=False)
+        return entry
+
+    def _ngrams(self, tokens: Sequence[str], min_n: int) -> List[str]:
+        """N-grams of one token stream, in the vectorizer's order"""
+        features = list(tokens) if min_n == 1 else []
+        for n in range(max(min_n, 2), min(self.max_n, len(tokens)) + 1):
+            features.extend(
+                " ".join(tokens[start : start + n])
+                for start in range(len(tokens) - n + 1)
+            )
+        return features
+
+    def _boundary_ngrams(self, streams: List[Tuple[str, ...]]) -> List[str]:
+        """
+        N-grams of the concatenated streams that span at least one boundary
+
+        Each spanning n-gram is generated once, from the stream it starts in.
+        """
+        tokens = [token for stream in streams for token in stream]
+        features = []
+        stream_start = 0
+
+        for stream in streams[:-1]:
+            boundary = stream_start + len(stream)
+            for n in range(max(self.min_n, 2), self.max_n + 1):
+                for start in range(max(stream_start, boundary - n + 1), boundary):
+                    if start + n <= len(tokens):
+                        features.append(" ".join(tokens[start : start + n]))
+            stream_start = boundary
+
+        return features
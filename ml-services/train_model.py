@@ -195,7 +195,7 @@ def format_data_for_ai_model(training_data):
     return formatted_data
 
 
-def train_ai_model(formatted_data):
+def train_ai_model(formatted_data, model_type=None):
     """Train the AI model with formatted data"""
     print_step(3, "Training AI Model")
 
@@ -214,7 +214,7 @@ def train_ai_model(formatted_data):
         start_time = time.time()
 
         # Train the model
-        training_results = matcher.train_model(formatted_data)
+        training_results = matcher.train_model(formatted_data, model_type=model_type)
 
         training_time = time.time() - start_time
 
@@ -236,6 +236,29 @@ def train_ai_model(formatted_data):
         return False, None
 
 
+def export_trained_model():
+    """Store the loaded model as a new memory-mappable version"""
+    print_step(3, "Exporting Trained Model")
+
+    try:
+        from models.candidate_matcher import CandidateMatcher
+
+        matcher = CandidateMatcher()
+        if not matcher.is_trained:
+            print_error("No trained model to export. Train the model first.")
+            return False
+
+        metadata = matcher.export_model()
+        print_success(
+            f"Model exported as version {metadata['version_id']} (memory-mapped .npy arrays)"
+        )
+        return True
+
+    except Exception as e:
+        print_error(f"Error exporting model: {e}")
+        return False
+
+
 def test_trained_model():
     """Test the trained model with a sample prediction"""
     print_step(4, "Testing Trained Model")
@@ -432,6 +455,17 @@ def main():
     parser.add_argument(
         "--test-only", action="store_true", help="Only test existing trained model"
     )
+    parser.add_argument(
+        "--export-model",
+        action="store_true",
+        help="Store the existing model in the memory-mappable format, then test it",
+    )
+    parser.add_argument(
+        "--model-type",
+        choices=["tfidf", "hashing"],
+        default=None,
+        help="Vectorizer to train (default: MODEL_TYPE from the environment)",
+    )
 
     args = parser.parse_args()
 
@@ -454,13 +488,17 @@ def main():
             # Only test the model
             success = test_trained_model()
 
+        elif args.export_model:
+            # Convert the existing model without retraining
+            success = export_trained_model() and test_trained_model()
+
         elif args.train_only:
             # Only train model with existing data
             training_data = load_training_data()
             if training_data:
                 formatted_data = format_data_for_ai_model(training_data)
                 if formatted_data:
-                    success, results = train_ai_model(formatted_data)
+                    success, results = train_ai_model(formatted_data, args.model_type)
                     if success:
                         success = test_trained_model()
                 else:
@@ -488,7 +526,7 @@ def main():
                     success = False
                 else:
                     # Step 3: Train the model
-                    success, results = train_ai_model(formatted_data)
+                    success, results = train_ai_model(formatted_data, args.model_type)
                     if success:
                         # Step 4: Test the model
                         success = test_trained_model()
@@ -0,0 +1,62 @@
+import hashlib
+import json
+from typing import Dict, Any
+
+# Job fields that influence the job-side features used for scoring
+JOB_CONTENT_FIELDS = ("title", "description", "requirements", "category")
+
+
+def content_hash(payload: Any) -> str:
+    """
+    Create a stable SHA-256 hash of a JSON-serializable payload
+
+    Args:
+        payload: Data to hash (dict keys are sorted before hashing)
+
+    Returns:
+        Hex digest of the payload
+    """
+    serialized = json.dumps(payload, sort_keys=True, default=str, ensure_ascii=False)
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+
+def files_hash(*paths: str) -> str:
+    """
+    Create a SHA-256 hash of the contents of one or more files
+
+    Args:
+        paths: Files to hash, in order
+
+    Returns:
+        Hex digest of the concatenated file contents
+    """
+    digest = hashlib.sha256()
+    for path in paths:
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(block)
+    return digest.hexdigest()
+
+
+def job_content_hash(job_data: Dict[str, Any]) -> str:
+    """
+    Hash the job fields used for scoring
+
+    Two postings with the same title, description, requirements and category
+    produce the same hash, whatever other fields they carry.
+    """
+    return content_hash({field: job_data.get(field) for field in JOB_CONTENT_FIELDS})
+
+
+# Resume fields that influence the resume-side features used for scoring
+RESUME_CONTENT_FIELDS = ("skills", "experience", "education", "industry", "company")
+
+
+def resume_content_hash(resume: Dict[str, Any]) -> str:
+    """
+    Hash the resume fields used for scoring
+
+    The same resume attached to several applications (or jobs) produces the
+    same hash, so its vectors and scores can be reused.
+    """
+    return content_hash({field: resume.get(field) for field in RESUME_CONTENT_FIELDS})